@@ -6,15 +6,85 @@ Comprehensive monitoring dashboard for Intel Arc B580 + AMD Ryzen systems
 
 import tkinter as tk
 from tkinter import ttk
-import subprocess
-import re
+from tkinter import font as tkfont
 import os
+import heapq
+import socket
+import struct
 import time
 import threading
-from pathlib import Path
+from collections import deque
 from datetime import datetime, timedelta
 
 
+# utmp(5) record layout on glibc: 384-byte records, ut_type is the leading short
+UTMP_RECORD_SIZE = 384
+UTMP_USER_PROCESS = 7
+UTMP_TYPE = struct.Struct("h")
+
+# Filesystems the storage panel never shows (same set we used to pass to df -x)
+IGNORED_FSTYPES = {"tmpfs", "devtmpfs", "squashfs"}
+MOUNT_CACHE_SECONDS = 30
+
+# hwmon driver names for the thermal panel (matched against /sys/class/hwmon/*/name)
+HWMON_CPU_DRIVERS = ("k10temp", "zenpower", "coretemp")
+HWMON_GPU_DRIVERS = ("xe", "i915", "amdgpu")
+
+# Sampler wake-up period in seconds; may be sub-second, the UI just redraws more often
+SAMPLE_TICK = 1.0
+
+# Seconds between samples of each panel's data; slow-moving signals are read less often
+SAMPLE_INTERVALS = {
+    'cpu': 1,
+    'network': 1,
+    'memory': 1,
+    'thermal': 2,
+    'processes': 2,
+    'system': 5,
+    'storage': 10,
+}
+
+# Samples kept per graph; histories are fixed ring buffers of this length
+HISTORY_LEN = 60
+
+# /proc/meminfo fields used by the memory panel
+MEMINFO_KEYS = frozenset((b'MemTotal', b'MemAvailable', b'SwapTotal', b'SwapFree'))
+
+# "0%".."100%", so whole-number percentages are a lookup rather than a new string
+PERCENT_STRINGS = tuple(f"{i}%" for i in range(101))
+
+# Process table: rows shown and character width of each column
+PROCESS_ROWS = 6
+PROCESS_COLUMNS = (25, 8, 8, 8)
+PROCESS_ROW_FORMAT = "{:<25}{:<8}{:<8}{:<8}"
+EMPTY_PROCESS_ROW = PROCESS_ROW_FORMAT.format("--", "--", "--", "--")
+
+# (divisor, unit) tables for the formatters, indexed by power of 1024
+BYTE_SCALES = tuple(
+    (1 << (10 * i), unit) for i, unit in enumerate(('B', 'KB', 'MB', 'GB', 'TB', 'PB'))
+)
+SPEED_SCALES = tuple(
+    (1 << (10 * i), unit) for i, unit in enumerate(('B/s', 'KB/s', 'MB/s', 'GB/s', 'TB/s'))
+)
+
+
+def format_scaled(value, scales):
+    """Format value in the largest unit of scales that keeps it >= 1"""
+    # Shifting out the first 10 bits puts everything under 1 KiB at index 0
+    # without a max(); each further 10 bits of magnitude is one unit up
+    idx = ((int(value) >> 10).bit_length() + 9) // 10
+    if idx >= len(scales):
+        idx = len(scales) - 1
+    divisor, unit = scales[idx]
+    return f"{value / divisor:.1f} {unit}"
+
+
+def scale_graph_values(data, h, max_val):
+    """Map a history (oldest sample first) to canvas y coordinates"""
+    scale = h / max_val
+    return [h - (v if v < max_val else max_val) * scale for v in data]
+
+
 class SystemCommandCenter:
     def __init__(self, root):
         self.root = root
@@ -25,6 +95,10 @@ class SystemCommandCenter:
         self.root.geometry("1200x800")
         self.root.minsize(1000, 700)
         
+        # Raw Tcl entry point for the per-tick paths: skips tkinter's argument
+        # flattening and the parsing of return values nobody reads
+        self.tk_call = root.tk.call
+        
         # Color scheme - critical/military aesthetic
         self.colors = {
             "bg_dark": "#0a0a0f",
@@ -47,18 +121,91 @@ class SystemCommandCenter:
             "grid_line": "#1a1f26"
         }
         
+        # Severity bands, indexed by how many thresholds a reading crosses,
+        # e.g. usage_colors[(percent >= 70) + (percent >= 90)]
+        self.usage_colors = (
+            self.colors["accent_green"], self.colors["warning"], self.colors["critical"]
+        )
+        self.temp_states = (
+            (self.colors["nominal"], "● NOMINAL"),
+            (self.colors["warning"], "● ELEVATED"),
+            (self.colors["critical"], "● CRITICAL"),
+        )
+        
         # Data storage
-        self.cpu_history = [0] * 60
-        self.mem_history = [0] * 60
-        self.net_rx_history = [0] * 60
-        self.net_tx_history = [0] * 60
+        # Bounded deques: append drops the oldest sample in O(1)
+        self.cpu_history = deque([0] * HISTORY_LEN, maxlen=HISTORY_LEN)
+        self.mem_history = deque([0] * HISTORY_LEN, maxlen=HISTORY_LEN)
+        self.net_rx_history = deque([0] * HISTORY_LEN, maxlen=HISTORY_LEN)
+        self.net_tx_history = deque([0] * HISTORY_LEN, maxlen=HISTORY_LEN)
         self.last_net_rx = 0
         self.last_net_tx = 0
-        self.last_net_time = time.time()
+        self.last_net_time = None
         self.start_time = datetime.now()
         
+        self.mounts = []
+        self.mounts_time = None
+        
+        # Per-process CPU accounting (jiffies from /proc/[pid]/stat)
+        self.clk_tck = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.mem_total = os.sysconf("SC_PHYS_PAGES") * self.page_size
+        self.last_proc_jiffies = {}
+        self.last_proc_time = time.monotonic()
+        self.proc_names = {}  # (pid, starttime) -> display name
+        
+        # Hot pseudo-files stay open; each tick re-reads them from offset 0
+        # (16 KiB so /proc/net/dev fits whole even with many interfaces)
+        self.read_buf = bytearray(16384)
+        self.stat_fd = self.open_fd("/proc/stat")
+        self.meminfo_fd = self.open_fd("/proc/meminfo")
+        self.uptime_fd = self.open_fd("/proc/uptime")
+        self.loadavg_fd = self.open_fd("/proc/loadavg")
+        self.net_dev_fd = self.open_fd("/proc/net/dev")
+        self.cpu_temp_fd, self.gpu_temp_fd = self.probe_hwmon()
+        self.cpu_freq_fd = self.open_fd("/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq")
+        
+        # Static host info (never changes while running)
+        self.hostname = socket.gethostname()
+        self.kernel = os.uname().release
+        self.cpu_cores = self.get_cpu_cores()
+        
+        # Latest sample from the background thread, consumed by update_all
+        self.snapshot = None
+        self.snapshot_lock = threading.Lock()
+        self.sample_times = {}
+        self.samplers = {
+            'cpu': lambda: (self.get_cpu_usage(), self.get_cpu_freq()),
+            'network': self.get_network_speed,
+            'memory': self.get_memory_info,
+            'thermal': lambda: (self.get_cpu_temp(), self.get_gpu_temp()),
+            'processes': self.get_top_processes,
+            'system': self.get_system_stats,
+            'storage': self.get_storage_info,
+        }
+        
+        # The sampler writes a byte here after each snapshot so Tk wakes up
+        # exactly when there is something new to draw
+        self.wake_r, self.wake_w = os.pipe()
+        os.set_blocking(self.wake_w, False)
+        
+        self.status_dot_lit = True
+        self.clock_second = None
+        
+        # Widget writes queued during a render pass, flushed together from after_idle
+        self.pending = {}
+        self.flush_scheduled = False
+        self.applied = {}  # last options actually sent to Tk, per target
+        
+        # Per-canvas item ids for incremental graph drawing (see draw_graph)
+        self.graph_state = {}
+        self.canvas_sizes = {}  # canvas -> (width, height), kept current by <Configure>
+        
         self.setup_ui()
-        self.update_all()
+        self.root.createfilehandler(self.wake_r, tk.READABLE, self.on_sample_ready)
+        self.start_sampler()
+        self.update_clock()
+        self.blink_status()
     
     def setup_ui(self):
         # Main container
@@ -110,12 +257,11 @@ class SystemCommandCenter:
         title.pack(side="left", pady=15)
         
         # Blinking status indicator
-        self.status_dot = tk.Label(
+        self.status_dot = self.create_value_text(
             left,
             text="●",
             font=("Monospace", 12),
-            fg=self.colors["nominal"],
-            bg=self.colors["bg_panel"]
+            fill=self.colors["nominal"]
         )
         self.status_dot.pack(side="left", padx=(10, 0))
         
@@ -133,14 +279,14 @@ class SystemCommandCenter:
         right = tk.Frame(header, bg=self.colors["bg_panel"])
         right.pack(side="right", fill="y", padx=15)
         
-        self.time_label = tk.Label(
+        self.time_text = self.create_value_text(
             right,
             text="00:00:00",
             font=("Monospace", 20, "bold"),
-            fg=self.colors["text_bright"],
-            bg=self.colors["bg_panel"]
+            fill=self.colors["text_bright"],
+            anchor="e"
         )
-        self.time_label.pack(side="right", pady=10)
+        self.time_text.pack(side="right", pady=10)
         
         time_prefix = tk.Label(
             right,
@@ -155,12 +301,9 @@ class SystemCommandCenter:
         center = tk.Frame(header, bg=self.colors["bg_panel"])
         center.pack(side="right", fill="y", padx=30)
         
-        hostname = subprocess.getoutput("hostname").strip()
-        kernel = subprocess.getoutput("uname -r").strip()
-        
         self.hostname_label = tk.Label(
             center,
-            text=f"◈ {hostname.upper()}",
+            text=f"◈ {self.hostname.upper()}",
             font=("Monospace", 11, "bold"),
             fg=self.colors["accent_orange"],
             bg=self.colors["bg_panel"]
@@ -169,7 +312,7 @@ class SystemCommandCenter:
         
         self.kernel_label = tk.Label(
             center,
-            text=f"KERNEL {kernel}",
+            text=f"KERNEL {self.kernel}",
             font=("Monospace", 9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -212,6 +355,37 @@ class SystemCommandCenter:
         
         return content
     
+    def track_size(self, canvas):
+        """Cache a canvas's size from <Configure> so redraws never query Tk for it"""
+        self.canvas_sizes[canvas] = (0, 0)
+        
+        def on_configure(event):
+            self.canvas_sizes[canvas] = (event.width, event.height)
+        
+        canvas.bind("<Configure>", on_configure)
+    
+    def create_value_text(self, parent, text, font, fill, sample=None, anchor="w"):
+        """Canvas text item for values redrawn every tick.
+        
+        itemconfig on a canvas item is much cheaper than Label.config, which
+        goes through option parsing and geometry management. The canvas is
+        sized to fit `sample` (defaults to the initial text).
+        """
+        metrics = tkfont.Font(font=font)
+        width = metrics.measure(sample or text)
+        height = metrics.metrics("linespace")
+        
+        canvas = tk.Canvas(
+            parent,
+            width=width,
+            height=height,
+            bg=self.colors["bg_panel"],
+            highlightthickness=0
+        )
+        x = width if anchor == "e" else 0
+        canvas.create_text(x, height // 2, text=text, font=font, fill=fill, anchor=anchor, tags="value")
+        return canvas
+    
     def create_thermal_panel(self, parent):
         """Thermal monitoring panel"""
         content = self.create_panel(parent, "THERMAL STATUS", height=160)
@@ -240,14 +414,14 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="w")
         
-        self.gpu_temp_label = tk.Label(
+        self.gpu_temp_text = self.create_value_text(
             gpu_frame,
             text="--°C",
             font=("Monospace", 32, "bold"),
-            fg=self.colors["text_dim"],
-            bg=self.colors["bg_panel"]
+            fill=self.colors["text_dim"],
+            sample="100°C"
         )
-        self.gpu_temp_label.pack(anchor="w", pady=(5, 0))
+        self.gpu_temp_text.pack(anchor="w", pady=(5, 0))
         
         self.gpu_status = tk.Label(
             gpu_frame,
@@ -278,14 +452,14 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="w")
         
-        self.cpu_temp_label = tk.Label(
+        self.cpu_temp_text = self.create_value_text(
             cpu_frame,
             text="--°C",
             font=("Monospace", 32, "bold"),
-            fg=self.colors["nominal"],
-            bg=self.colors["bg_panel"]
+            fill=self.colors["nominal"],
+            sample="100°C"
         )
-        self.cpu_temp_label.pack(anchor="w", pady=(5, 0))
+        self.cpu_temp_text.pack(anchor="w", pady=(5, 0))
         
         self.cpu_temp_status = tk.Label(
             cpu_frame,
@@ -304,14 +478,14 @@ class SystemCommandCenter:
         stats = tk.Frame(content, bg=self.colors["bg_panel"])
         stats.pack(fill="x")
         
-        self.cpu_percent_label = tk.Label(
+        self.cpu_percent_text = self.create_value_text(
             stats,
             text="0%",
             font=("Monospace", 28, "bold"),
-            fg=self.colors["accent_green"],
-            bg=self.colors["bg_panel"]
+            fill=self.colors["accent_green"],
+            sample="100%"
         )
-        self.cpu_percent_label.pack(side="left")
+        self.cpu_percent_text.pack(side="left")
         
         cpu_info = tk.Frame(stats, bg=self.colors["bg_panel"])
         cpu_info.pack(side="right")
@@ -327,7 +501,7 @@ class SystemCommandCenter:
         
         self.cpu_cores_label = tk.Label(
             cpu_info,
-            text="0 cores",
+            text=f"{self.cpu_cores} cores",
             font=("Monospace", 9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -342,6 +516,7 @@ class SystemCommandCenter:
             highlightthickness=0
         )
         self.cpu_canvas.pack(fill="x", pady=(10, 0))
+        self.track_size(self.cpu_canvas)
     
     def create_memory_panel(self, parent):
         """Memory panel"""
@@ -362,22 +537,26 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(side="left")
         
-        self.ram_percent = tk.Label(
+        self.ram_percent_text = self.create_value_text(
             ram_header,
             text="0%",
             font=("Monospace", 10, "bold"),
-            fg=self.colors["text_bright"],
-            bg=self.colors["bg_panel"]
+            fill=self.colors["text_bright"],
+            sample="100.0%",
+            anchor="e"
         )
-        self.ram_percent.pack(side="right")
+        self.ram_percent_text.pack(side="right")
         
         # RAM bar
-        self.ram_bar_frame = tk.Frame(ram_frame, bg=self.colors["bg_card"], height=20)
-        self.ram_bar_frame.pack(fill="x", pady=(5, 0))
-        self.ram_bar_frame.pack_propagate(False)
-        
-        self.ram_bar = tk.Frame(self.ram_bar_frame, bg=self.colors["accent_purple"], width=0)
-        self.ram_bar.pack(side="left", fill="y")
+        # Bars are canvas rectangles resized with coords, so a tick never reflows the column
+        self.ram_bar_canvas = tk.Canvas(
+            ram_frame, bg=self.colors["bg_card"], height=20, highlightthickness=0
+        )
+        self.ram_bar_canvas.pack(fill="x", pady=(5, 0))
+        self.track_size(self.ram_bar_canvas)
+        self.ram_bar_canvas.create_rectangle(
+            0, 0, 0, 20, fill=self.colors["accent_purple"], outline="", tags="fill"
+        )
         
         self.ram_details = tk.Label(
             ram_frame,
@@ -403,22 +582,25 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(side="left")
         
-        self.swap_percent = tk.Label(
+        self.swap_percent_text = self.create_value_text(
             swap_header,
             text="0%",
             font=("Monospace", 10, "bold"),
-            fg=self.colors["text_bright"],
-            bg=self.colors["bg_panel"]
+            fill=self.colors["text_bright"],
+            sample="100.0%",
+            anchor="e"
         )
-        self.swap_percent.pack(side="right")
+        self.swap_percent_text.pack(side="right")
         
         # Swap bar
-        self.swap_bar_frame = tk.Frame(swap_frame, bg=self.colors["bg_card"], height=12)
-        self.swap_bar_frame.pack(fill="x", pady=(5, 0))
-        self.swap_bar_frame.pack_propagate(False)
-        
-        self.swap_bar = tk.Frame(self.swap_bar_frame, bg=self.colors["accent_yellow"], width=0)
-        self.swap_bar.pack(side="left", fill="y")
+        self.swap_bar_canvas = tk.Canvas(
+            swap_frame, bg=self.colors["bg_card"], height=12, highlightthickness=0
+        )
+        self.swap_bar_canvas.pack(fill="x", pady=(5, 0))
+        self.track_size(self.swap_bar_canvas)
+        self.swap_bar_canvas.create_rectangle(
+            0, 0, 0, 12, fill=self.colors["accent_yellow"], outline="", tags="fill"
+        )
         
         self.swap_details = tk.Label(
             swap_frame,
@@ -478,6 +660,46 @@ class SystemCommandCenter:
         
         self.storage_frame = tk.Frame(content, bg=self.colors["bg_panel"])
         self.storage_frame.pack(fill="both", expand=True)
+        
+        # Fixed pool of rows, shown and hidden as disks come and go
+        self.storage_rows = []
+        for _ in range(4):  # Show max 4 disks
+            row = tk.Frame(self.storage_frame, bg=self.colors["bg_panel"])
+            
+            # Name and mount
+            name = tk.Label(
+                row,
+                text="",
+                font=("Monospace", 9),
+                fg=self.colors["text_normal"],
+                bg=self.colors["bg_panel"],
+                width=25,
+                anchor="w"
+            )
+            name.pack(side="left")
+            
+            # Percent
+            percent = tk.Label(
+                row,
+                text="",
+                font=("Monospace", 9, "bold"),
+                fg=self.colors["accent_green"],
+                bg=self.colors["bg_panel"],
+                width=6
+            )
+            percent.pack(side="right")
+            
+            # Bar
+            bar = tk.Canvas(
+                row, bg=self.colors["bg_card"], height=10, width=100, highlightthickness=0
+            )
+            bar.pack(side="right", padx=5)
+            bar.create_rectangle(0, 0, 0, 10, fill=self.colors["accent_green"], outline="", tags="fill")
+            
+            self.storage_rows.append({
+                'frame': row, 'name': name, 'percent': percent, 'bar': bar,
+                'bar_percent': 0, 'visible': False
+            })
     
     def create_network_panel(self, parent):
         """Network panel"""
@@ -499,14 +721,14 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="w")
         
-        self.net_dl_label = tk.Label(
+        self.net_dl_text = self.create_value_text(
             dl_frame,
             text="0 B/s",
             font=("Monospace", 16, "bold"),
-            fg=self.colors["accent_green"],
-            bg=self.colors["bg_panel"]
+            fill=self.colors["accent_green"],
+            sample="1023.9 KB/s"
         )
-        self.net_dl_label.pack(anchor="w")
+        self.net_dl_text.pack(anchor="w")
         
         # Upload
         ul_frame = tk.Frame(stats, bg=self.colors["bg_panel"])
@@ -520,14 +742,15 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="e")
         
-        self.net_ul_label = tk.Label(
+        self.net_ul_text = self.create_value_text(
             ul_frame,
             text="0 B/s",
             font=("Monospace", 16, "bold"),
-            fg=self.colors["accent_red"],
-            bg=self.colors["bg_panel"]
+            fill=self.colors["accent_red"],
+            sample="1023.9 KB/s",
+            anchor="e"
         )
-        self.net_ul_label.pack(anchor="e")
+        self.net_ul_text.pack(anchor="e")
         
         # Network graph
         self.net_canvas = tk.Canvas(
@@ -537,6 +760,16 @@ class SystemCommandCenter:
             highlightthickness=0
         )
         self.net_canvas.pack(fill="x", pady=(10, 0))
+        self.track_size(self.net_canvas)
+        
+        # One polyline per direction, reshaped with coords on every update; kept
+        # by item id so Tk doesn't have to resolve a tag each time
+        self.net_rx_line = self.net_canvas.create_line(
+            0, 0, 0, 0, fill=self.colors["accent_green"], width=2
+        )
+        self.net_tx_line = self.net_canvas.create_line(
+            0, 0, 0, 0, fill=self.colors["accent_red"], width=2
+        )
     
     def create_processes_panel(self, parent):
         """Top processes panel"""
@@ -546,67 +779,93 @@ class SystemCommandCenter:
         header = tk.Frame(content, bg=self.colors["bg_panel"])
         header.pack(fill="x")
         
-        cols = [("PROCESS", 200), ("CPU%", 70), ("MEM%", 70), ("PID", 70)]
-        for text, width in cols:
+        for text, width in zip(("PROCESS", "CPU%", "MEM%", "PID"), PROCESS_COLUMNS):
             tk.Label(
                 header,
                 text=text,
                 font=("Monospace", 8),
                 fg=self.colors["text_dim"],
                 bg=self.colors["bg_panel"],
-                width=width//8,
+                width=width,
                 anchor="w"
             ).pack(side="left")
         
-        # Process list
-        self.process_frame = tk.Frame(content, bg=self.colors["bg_panel"])
-        self.process_frame.pack(fill="both", expand=True, pady=(5, 0))
-        
-        self.process_labels = []
-        for i in range(6):
-            row = tk.Frame(self.process_frame, bg=self.colors["bg_panel"])
-            row.pack(fill="x", pady=1)
-            
-            labels = []
-            widths = [200, 70, 70, 70]
-            for w in widths:
-                lbl = tk.Label(
-                    row,
-                    text="--",
-                    font=("Monospace", 9),
-                    fg=self.colors["text_normal"],
-                    bg=self.colors["bg_panel"],
-                    width=w//8,
-                    anchor="w"
-                )
-                lbl.pack(side="left")
-                labels.append(lbl)
-            self.process_labels.append(labels)
+        # Process list: one Text widget, so a refresh is a single replace of the
+        # whole table instead of a config per cell. PROCESS_ROW_FORMAT pads each
+        # row to the PROCESS_COLUMNS character widths the header labels use.
+        self.process_text = tk.Text(
+            content,
+            font=("Monospace", 9),
+            fg=self.colors["text_normal"],
+            bg=self.colors["bg_panel"],
+            width=sum(PROCESS_COLUMNS),
+            height=PROCESS_ROWS,
+            spacing1=1,
+            spacing3=1,
+            bd=0,
+            highlightthickness=0,
+            cursor="arrow",
+            takefocus=0
+        )
+        self.process_text.pack(fill="both", expand=True, pady=(5, 0))
+        self.process_table = None
+        self.update_processes([])
     
     # ==================== DATA FETCHING ====================
     
+    def open_fd(self, path):
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+    
+    def probe_hwmon(self):
+        """Find the CPU and GPU temperature sensors by driver name, once.
+        
+        hwmonN numbering follows driver probe order and can change between
+        boots, so match on each device's name file instead.
+        """
+        cpu_fd = gpu_fd = None
+        try:
+            entries = sorted(os.scandir("/sys/class/hwmon"), key=lambda e: e.name)
+        except OSError:
+            return None, None
+        for entry in entries:
+            try:
+                with open(f"{entry.path}/name") as f:
+                    name = f.read().strip()
+            except OSError:
+                continue
+            if cpu_fd is None and name in HWMON_CPU_DRIVERS:
+                cpu_fd = self.open_fd(f"{entry.path}/temp1_input")
+            elif gpu_fd is None and name.startswith(HWMON_GPU_DRIVERS):
+                gpu_fd = self.open_fd(f"{entry.path}/temp1_input")
+        return cpu_fd, gpu_fd
+    
+    def read_fd(self, fd):
+        """Re-read an open /proc or /sys file into the shared buffer (sampler thread only)"""
+        n = os.preadv(fd, [self.read_buf], 0)
+        return self.read_buf[:n]
+    
     def get_cpu_temp(self):
         try:
-            temp_file = Path("/sys/class/hwmon/hwmon2/temp1_input")
-            if temp_file.exists():
-                return int(temp_file.read_text().strip()) / 1000
+            if self.cpu_temp_fd is not None:
+                return int(self.read_fd(self.cpu_temp_fd)) / 1000
             return None
         except:
             return None
     
     def get_gpu_temp(self):
         try:
-            temp_file = Path("/sys/class/hwmon/hwmon3/temp1_input")
-            if temp_file.exists():
-                return int(temp_file.read_text().strip()) / 1000
+            if self.gpu_temp_fd is not None:
+                return int(self.read_fd(self.gpu_temp_fd)) / 1000
             return None
         except:
             return None
     
     def get_cpu_usage(self):
         try:
-            output = subprocess.getoutput("grep 'cpu ' /proc/stat")
-            parts = output.split()
+            parts = self.read_fd(self.stat_fd).split(b'\n', 1)[0].split()
             idle = int(parts[4])
             total = sum(int(p) for p in parts[1:])
             
@@ -625,32 +884,42 @@ class SystemCommandCenter:
     
     def get_cpu_freq(self):
         try:
-            output = subprocess.getoutput("grep 'MHz' /proc/cpuinfo | head -1")
-            match = re.search(r'(\d+)', output)
-            return int(float(match.group(1))) if match else 0
+            # cpufreq reports kHz; not present on every system (e.g. VMs)
+            if self.cpu_freq_fd is not None:
+                return int(self.read_fd(self.cpu_freq_fd)) // 1000
         except:
-            return 0
-    
-    def get_cpu_cores(self):
+            pass
         try:
-            return int(subprocess.getoutput("nproc"))
+            with open("/proc/cpuinfo", "rb") as f:
+                for line in f:
+                    if line.startswith(b'cpu MHz'):
+                        return int(float(line.partition(b':')[2]))
+            return 0
         except:
             return 0
     
+    def get_cpu_cores(self):
+        return os.cpu_count() or 0
+    
     def get_memory_info(self):
         try:
-            output = subprocess.getoutput("free -b")
-            lines = output.split('\n')
+            # Only the four fields the panel shows are converted; SwapFree sits in
+            # the first twenty lines, so the loop stops well before the end
+            info = {}
+            for line in bytes(self.read_fd(self.meminfo_fd)).splitlines():
+                key, _, value = line.partition(b':')
+                if key in MEMINFO_KEYS:
+                    info[key] = int(value.split()[0]) * 1024
+                    if len(info) == len(MEMINFO_KEYS):
+                        break
             
             # RAM
-            mem_parts = lines[1].split()
-            mem_total = int(mem_parts[1])
-            mem_used = int(mem_parts[2])
+            mem_total = info[b'MemTotal']
+            mem_used = mem_total - info[b'MemAvailable']
             
             # Swap
-            swap_parts = lines[2].split()
-            swap_total = int(swap_parts[1])
-            swap_used = int(swap_parts[2])
+            swap_total = info[b'SwapTotal']
+            swap_used = swap_total - info[b'SwapFree']
             
             return {
                 'mem_total': mem_total,
@@ -663,21 +932,51 @@ class SystemCommandCenter:
         except:
             return None
     
+    def get_mounts(self):
+        """Mounted filesystems from /proc/mounts, re-read every MOUNT_CACHE_SECONDS"""
+        now = time.monotonic()
+        if self.mounts_time is None or now - self.mounts_time > MOUNT_CACHE_SECONDS:
+            mounts = []
+            with open("/proc/mounts") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) >= 3 and parts[2] not in IGNORED_FSTYPES:
+                        # Spaces in mount points are escaped as \040
+                        mounts.append((parts[0], parts[1].replace("\\040", " ")))
+            self.mounts = mounts
+            self.mounts_time = now
+        return self.mounts
+    
     def get_storage_info(self):
         try:
-            output = subprocess.getoutput("df -B1 -x tmpfs -x devtmpfs -x squashfs 2>/dev/null | tail -n +2")
             disks = []
-            for line in output.strip().split('\n'):
-                if line:
-                    parts = line.split()
-                    if len(parts) >= 6:
-                        disks.append({
-                            'device': parts[0].split('/')[-1],
-                            'total': int(parts[1]),
-                            'used': int(parts[2]),
-                            'mount': parts[5],
-                            'percent': int(parts[4].replace('%', ''))
-                        })
+            seen = set()
+            for device, mount in self.get_mounts():
+                # Deduplicate by filesystem like df does: bind mounts share st_dev,
+                # btrfs subvolumes mounted from the same device don't
+                try:
+                    dev = os.stat(mount).st_dev
+                    if dev in seen:
+                        continue
+                    st = os.statvfs(mount)
+                except OSError:
+                    continue
+                # Pseudo filesystems (proc, sysfs, cgroup, ...) report no blocks
+                if st.f_blocks == 0:
+                    continue
+                seen.add(dev)
+                total = st.f_blocks * st.f_frsize
+                used = (st.f_blocks - st.f_bfree) * st.f_frsize
+                avail = st.f_bavail * st.f_frsize
+                # Same rounding as df: used / (used + available), rounded up
+                percent = -(-used * 100 // (used + avail)) if used + avail > 0 else 0
+                disks.append({
+                    'device': device.split('/')[-1],
+                    'total': total,
+                    'used': used,
+                    'mount': mount,
+                    'percent': percent
+                })
             return disks
         except:
             return []
@@ -687,336 +986,472 @@ class SystemCommandCenter:
             rx_total = 0
             tx_total = 0
             
-            net_path = Path("/sys/class/net")
-            for iface in net_path.iterdir():
-                if iface.name != 'lo':
-                    rx_file = iface / "statistics/rx_bytes"
-                    tx_file = iface / "statistics/tx_bytes"
-                    if rx_file.exists():
-                        rx_total += int(rx_file.read_text().strip())
-                    if tx_file.exists():
-                        tx_total += int(tx_file.read_text().strip())
+            # One read covers every interface; first two lines are headers
+            for line in self.read_fd(self.net_dev_fd).split(b'\n')[2:]:
+                iface, _, counters = line.partition(b':')
+                if counters and iface.strip() != b'lo':
+                    fields = counters.split()
+                    rx_total += int(fields[0])
+                    tx_total += int(fields[8])
             
-            now = time.time()
-            elapsed = now - self.last_net_time
-            
-            rx_speed = (rx_total - self.last_net_rx) / elapsed if elapsed > 0 else 0
-            tx_speed = (tx_total - self.last_net_tx) / elapsed if elapsed > 0 else 0
+            # Monotonic so sub-second intervals survive wall-clock adjustments
+            now = time.monotonic()
+            last_time = self.last_net_time
+            last_rx = self.last_net_rx
+            last_tx = self.last_net_tx
             
             self.last_net_rx = rx_total
             self.last_net_tx = tx_total
             self.last_net_time = now
             
+            # The first sample only primes the counters; a delta against zero
+            # would plot boot-to-now traffic as one spike that flattens the graph
+            elapsed = now - last_time if last_time is not None else 0
+            if elapsed <= 0:
+                return 0, 0
+            
+            rx_speed = (rx_total - last_rx) / elapsed
+            tx_speed = (tx_total - last_tx) / elapsed
             return max(0, rx_speed), max(0, tx_speed)
         except:
             return 0, 0
     
+    def list_pids(self):
+        """PID directory names under /proc as bytes.
+        
+        Listing with a bytes path skips decoding every name, and only PID
+        entries start with a digit, so one byte compare filters them.
+        """
+        return [name for name in os.listdir(b"/proc") if name[0] <= 0x39]
+    
     def get_top_processes(self):
+        """Top 6 processes by CPU since the last call, read straight from /proc"""
         try:
-            output = subprocess.getoutput("ps aux --sort=-%cpu | head -7 | tail -6")
+            now = time.monotonic()
+            elapsed = now - self.last_proc_time
+            jiffies = {}
             procs = []
-            for line in output.strip().split('\n'):
-                parts = line.split(None, 10)
-                if len(parts) >= 11:
-                    procs.append({
-                        'name': parts[10][:25],
-                        'cpu': parts[2],
-                        'mem': parts[3],
-                        'pid': parts[1]
-                    })
-            return procs
+            
+            for name in self.list_pids():
+                try:
+                    with open(b"/proc/%s/stat" % name, "rb") as f:
+                        stat = f.read()
+                except OSError:
+                    continue  # exited while we were scanning
+                
+                # comm can contain spaces and parens, so split after the last ')'
+                head, _, tail = stat.rpartition(b')')
+                fields = tail.split()
+                pid = int(name)
+                total = int(fields[11]) + int(fields[12])  # utime + stime
+                jiffies[pid] = total
+                
+                prev = self.last_proc_jiffies.get(pid)
+                if prev is not None and elapsed > 0:
+                    cpu = (total - prev) / self.clk_tck / elapsed * 100
+                else:
+                    cpu = 0
+                rss = int(fields[21]) * self.page_size
+                procs.append((cpu, rss, pid, fields[19], head[head.find(b'(') + 1:]))
+            
+            self.last_proc_jiffies = jiffies
+            self.last_proc_time = now
+            
+            # The stat read above is the only per-process I/O; cmdline is only read
+            # when a process enters the top list (pid + start time survives pid reuse)
+            names = {}
+            top = []
+            for cpu, rss, pid, start, comm in heapq.nlargest(6, procs):
+                key = (pid, start)
+                name = self.proc_names.get(key)
+                if name is None:
+                    name = self.get_process_name(pid, comm)
+                names[key] = name
+                top.append({
+                    'name': name,
+                    'cpu': f"{cpu:.1f}",
+                    'mem': f"{rss * 100 / self.mem_total:.1f}",
+                    'pid': str(pid)
+                })
+            self.proc_names = names
+            return top
         except:
             return []
     
+    def get_process_name(self, pid, comm):
+        """Command line like ps shows it; kernel threads fall back to [comm]"""
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read()
+        except OSError:
+            cmdline = b""
+        if cmdline:
+            return cmdline.replace(b"\0", b" ").decode(errors="replace").strip()[:25]
+        return f"[{comm.decode(errors='replace')}]"[:25]
+    
     def get_system_stats(self):
         try:
             # Uptime
-            uptime_sec = float(Path("/proc/uptime").read_text().split()[0])
+            uptime_sec = float(self.read_fd(self.uptime_fd).split()[0])
             hours = int(uptime_sec // 3600)
             mins = int((uptime_sec % 3600) // 60)
             uptime_str = f"{hours}h {mins}m"
             
             # Process count
-            procs = len([p for p in Path("/proc").iterdir() if p.name.isdigit()])
+            procs = len(self.list_pids())
             
             # Load average
-            load = Path("/proc/loadavg").read_text().split()[0]
-            
-            # Users
-            users = subprocess.getoutput("who | wc -l").strip()
+            load = self.read_fd(self.loadavg_fd).split()[0].decode()
             
             return {
                 'uptime': uptime_str,
                 'procs': str(procs),
                 'load': load,
-                'users': users
+                'users': self.get_user_count()
             }
         except:
             return {'uptime': '--', 'procs': '--', 'load': '--', 'users': '--'}
     
+    def get_user_count(self):
+        """Count logged-in sessions the way `who` does, straight from utmp"""
+        try:
+            with open("/var/run/utmp", "rb") as f:
+                data = f.read()
+            users = 0
+            for offset in range(0, len(data) - UTMP_RECORD_SIZE + 1, UTMP_RECORD_SIZE):
+                if UTMP_TYPE.unpack_from(data, offset)[0] == UTMP_USER_PROCESS:
+                    users += 1
+            return str(users)
+        except FileNotFoundError:
+            return "0"
+        except:
+            return "--"
+    
     def format_bytes(self, b):
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if b < 1024:
-                return f"{b:.1f} {unit}"
-            b /= 1024
-        return f"{b:.1f} PB"
+        return format_scaled(b, BYTE_SCALES)
     
     def format_speed(self, bps):
-        for unit in ['B/s', 'KB/s', 'MB/s', 'GB/s']:
-            if bps < 1024:
-                return f"{bps:.1f} {unit}"
-            bps /= 1024
-        return f"{bps:.1f} TB/s"
+        return format_scaled(bps, SPEED_SCALES)
+    
+    # ==================== SAMPLING ====================
+    
+    def collect_metrics(self, now):
+        """Read every data source that is due; runs on the sampler thread, never touches Tk"""
+        snapshot = {}
+        for name, interval in SAMPLE_INTERVALS.items():
+            if now - self.sample_times.get(name, 0) >= interval:
+                self.sample_times[name] = now
+                snapshot[name] = self.samplers[name]()
+        return snapshot
+    
+    def start_sampler(self):
+        thread = threading.Thread(target=self.sampler_loop, daemon=True)
+        thread.start()
+    
+    def sampler_loop(self):
+        next_tick = time.monotonic()
+        while True:
+            try:
+                snapshot = self.collect_metrics(next_tick)
+            except Exception as e:
+                print(f"Sample error: {e}")
+            else:
+                with self.snapshot_lock:
+                    # Merge so a slow render pass never loses a panel's update
+                    if self.snapshot is None:
+                        self.snapshot = snapshot
+                    else:
+                        self.snapshot.update(snapshot)
+                try:
+                    os.write(self.wake_w, b'\0')
+                except BlockingIOError:
+                    pass  # Tk hasn't drained the previous wakeups yet
+            
+            # Sleep to the next tick boundary so sampling time doesn't accumulate as drift
+            next_tick += SAMPLE_TICK
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.monotonic()
     
     # ==================== UI UPDATES ====================
     
     def draw_graph(self, canvas, data, color, max_val=100):
-        canvas.delete("all")
-        w = canvas.winfo_width()
-        h = canvas.winfo_height()
+        """Draw the history as one polyline plus one fill polygon.
+        
+        data is the history, oldest sample first. Both items are created once
+        per canvas size and then only have their coords replaced, so a tick
+        costs two coords calls no matter how long the history is.
+        """
+        w, h = self.canvas_sizes[canvas]
         
-        if w <= 1:
+        if w <= 1 or len(data) < 2 or max_val <= 0:
             return
         
-        # Draw grid lines
-        for i in range(1, 4):
-            y = h * i / 4
-            canvas.create_line(0, y, w, y, fill=self.colors["grid_line"], dash=(2, 4))
-        
-        # Draw data
-        if len(data) > 1 and max_val > 0:
-            points = []
-            for i, val in enumerate(data):
-                x = w * i / (len(data) - 1)
-                y = h - (h * min(val, max_val) / max_val)
-                points.append((x, y))
+        state = self.graph_state.get(canvas)
+        
+        if state is None or state['size'] != (w, h):
+            canvas.delete("all")
+            
+            # Draw grid lines
+            for i in range(1, 4):
+                y = h * i / 4
+                canvas.create_line(0, y, w, y, fill=self.colors["grid_line"], dash=(2, 4))
+            
+            # Flat [0, h, x0, y0, ..., xn, yn, w, h] reused every tick: the
+            # polygon takes all of it, the line the slice without the corners
+            step = w / (len(data) - 1)
+            coords = [0, h]
+            for i in range(len(data)):
+                coords += (i * step, h)
+            coords += (w, h)
             
-            # Fill area
-            fill_points = [(0, h)] + points + [(w, h)]
-            canvas.create_polygon(fill_points, fill=color, stipple="gray25", outline="")
+            state = {
+                'size': (w, h),
+                'coords': coords,
+                'fill': canvas.create_polygon(0, h, w, h, 0, h, fill=color, stipple="gray25", outline=""),
+                'line': canvas.create_line(0, h, w, h, fill=color, width=2),
+                'color': color,
+            }
+            self.graph_state[canvas] = state
+        
+        coords = state['coords']
+        coords[3:-2:2] = scale_graph_values(data, h, max_val)
+        
+        call = self.tk_call
+        call(canvas._w, "coords", state['line'], coords[2:-2])
+        call(canvas._w, "coords", state['fill'], coords)
+        
+        if color != state['color']:
+            canvas.itemconfig(state['line'], fill=color)
+            canvas.itemconfig(state['fill'], fill=color)
+            state['color'] = color
+    
+    def queue_config(self, widget, **options):
+        """Queue a widget config; repeated writes in one pass collapse into one"""
+        self.pending.setdefault(widget, {}).update(options)
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.root.after_idle(self.flush_pending)
+    
+    def queue_itemconfig(self, canvas, tag, **options):
+        self.queue_config((canvas, tag), **options)
+    
+    def flush_pending(self):
+        """Apply queued writes, skipping options whose value Tk already has"""
+        pending, self.pending = self.pending, {}
+        self.flush_scheduled = False
+        call = self.tk_call
+        for target, options in pending.items():
+            applied = self.applied.setdefault(target, {})
+            changed = {k: v for k, v in options.items() if applied.get(k) != v}
+            if not changed:
+                continue
+            applied.update(changed)
             
-            # Line
-            for i in range(len(points) - 1):
-                canvas.create_line(
-                    points[i][0], points[i][1],
-                    points[i+1][0], points[i+1][1],
-                    fill=color, width=2
-                )
+            # Straight to Tcl: skips tkinter's kwarg -> option-list conversion
+            argv = []
+            for key, value in changed.items():
+                argv.append("-" + key)
+                argv.append(value)
+            if isinstance(target, tuple):
+                canvas, tag = target
+                call(canvas._w, "itemconfigure", tag, *argv)
+            else:
+                call(target._w, "configure", *argv)
     
-    def update_thermal(self):
+    def update_thermal(self, cpu_temp, gpu_temp):
         # CPU temp
-        cpu_temp = self.get_cpu_temp()
         if cpu_temp is not None:
-            self.cpu_temp_label.config(text=f"{cpu_temp:.0f}°C")
-            if cpu_temp < 55:
-                color = self.colors["nominal"]
-                status = "● NOMINAL"
-            elif cpu_temp < 75:
-                color = self.colors["warning"]
-                status = "● ELEVATED"
-            else:
-                color = self.colors["critical"]
-                status = "● CRITICAL"
-            self.cpu_temp_label.config(fg=color)
-            self.cpu_temp_status.config(text=status, fg=color)
+            color, status = self.temp_states[(cpu_temp >= 55) + (cpu_temp >= 75)]
+            self.queue_itemconfig(self.cpu_temp_text, "value", text=f"{cpu_temp:.0f}°C", fill=color)
+            self.queue_config(self.cpu_temp_status, text=status, fg=color)
         
         # GPU temp
-        gpu_temp = self.get_gpu_temp()
         if gpu_temp is not None:
-            self.gpu_temp_label.config(text=f"{gpu_temp:.0f}°C", fg=self.colors["nominal"])
-            self.gpu_status.config(text="● NOMINAL", fg=self.colors["nominal"])
+            self.queue_itemconfig(self.gpu_temp_text, "value", text=f"{gpu_temp:.0f}°C", fill=self.colors["nominal"])
+            self.queue_config(self.gpu_status, text="● NOMINAL", fg=self.colors["nominal"])
         else:
-            self.gpu_temp_label.config(text="--°C", fg=self.colors["text_dim"])
-            self.gpu_status.config(text="● NO SENSOR", fg=self.colors["text_dim"])
+            self.queue_itemconfig(self.gpu_temp_text, "value", text="--°C", fill=self.colors["text_dim"])
+            self.queue_config(self.gpu_status, text="● NO SENSOR", fg=self.colors["text_dim"])
     
-    def update_cpu(self):
-        usage = self.get_cpu_usage()
-        freq = self.get_cpu_freq()
-        cores = self.get_cpu_cores()
-        
+    def update_cpu(self, usage, freq):
         # Update history
-        self.cpu_history.pop(0)
         self.cpu_history.append(usage)
         
         # Color based on usage
-        if usage < 50:
-            color = self.colors["accent_green"]
-        elif usage < 80:
-            color = self.colors["warning"]
-        else:
-            color = self.colors["critical"]
+        color = self.usage_colors[(usage >= 50) + (usage >= 80)]
         
-        self.cpu_percent_label.config(text=f"{usage:.0f}%", fg=color)
-        self.cpu_freq_label.config(text=f"{freq} MHz")
-        self.cpu_cores_label.config(text=f"{cores} cores")
+        self.queue_itemconfig(self.cpu_percent_text, "value", text=PERCENT_STRINGS[min(100, max(0, round(usage)))], fill=color)
+        self.queue_config(self.cpu_freq_label, text=f"{freq} MHz")
         
         # Draw graph
         self.draw_graph(self.cpu_canvas, self.cpu_history, color)
     
-    def update_memory(self):
-        mem = self.get_memory_info()
+    def update_memory(self, mem):
         if mem:
             # RAM
-            self.ram_percent.config(text=f"{mem['mem_percent']:.1f}%")
-            self.ram_details.config(
+            self.queue_itemconfig(self.ram_percent_text, "value", text=f"{mem['mem_percent']:.1f}%")
+            self.queue_config(
+                self.ram_details,
                 text=f"{self.format_bytes(mem['mem_used'])} / {self.format_bytes(mem['mem_total'])}"
             )
             
             # RAM bar
-            bar_width = int(self.ram_bar_frame.winfo_width() * mem['mem_percent'] / 100)
-            self.ram_bar.config(width=max(0, bar_width))
+            bar_width = self.canvas_sizes[self.ram_bar_canvas][0] * mem['mem_percent'] / 100
+            self.ram_bar_canvas.coords("fill", 0, 0, max(0, bar_width), 20)
             
             # Swap
-            self.swap_percent.config(text=f"{mem['swap_percent']:.1f}%")
-            self.swap_details.config(
+            self.queue_itemconfig(self.swap_percent_text, "value", text=f"{mem['swap_percent']:.1f}%")
+            self.queue_config(
+                self.swap_details,
                 text=f"{self.format_bytes(mem['swap_used'])} / {self.format_bytes(mem['swap_total'])}"
             )
             
             # Swap bar
-            swap_width = int(self.swap_bar_frame.winfo_width() * mem['swap_percent'] / 100)
-            self.swap_bar.config(width=max(0, swap_width))
+            swap_width = self.canvas_sizes[self.swap_bar_canvas][0] * mem['swap_percent'] / 100
+            self.swap_bar_canvas.coords("fill", 0, 0, max(0, swap_width), 12)
     
-    def update_storage(self):
-        disks = self.get_storage_info()
-        
-        # Clear old
-        for widget in self.storage_frame.winfo_children():
-            widget.destroy()
-        
-        for disk in disks[:4]:  # Show max 4 disks
-            row = tk.Frame(self.storage_frame, bg=self.colors["bg_panel"])
-            row.pack(fill="x", pady=2)
-            
-            # Name and mount
-            tk.Label(
-                row,
-                text=f"{disk['device']} ({disk['mount']})",
-                font=("Monospace", 9),
-                fg=self.colors["text_normal"],
-                bg=self.colors["bg_panel"],
-                width=25,
-                anchor="w"
-            ).pack(side="left")
+    def update_storage(self, disks):
+        # Locals for everything the per-row loop touches
+        colors = self.usage_colors
+        queue_config = self.queue_config
+        queue_itemconfig = self.queue_itemconfig
+        for i, row in enumerate(self.storage_rows):
+            if i >= len(disks):
+                # Unused rows are always a suffix, so re-packing later keeps the order
+                if row['visible']:
+                    row['frame'].pack_forget()
+                    row['visible'] = False
+                continue
             
-            # Percent
+            disk = disks[i]
             percent = disk['percent']
-            if percent < 70:
-                color = self.colors["accent_green"]
-            elif percent < 90:
-                color = self.colors["warning"]
-            else:
-                color = self.colors["critical"]
+            color = colors[(percent >= 70) + (percent >= 90)]
             
-            tk.Label(
-                row,
-                text=f"{percent}%",
-                font=("Monospace", 9, "bold"),
-                fg=color,
-                bg=self.colors["bg_panel"],
-                width=6
-            ).pack(side="right")
+            queue_config(row['name'], text=f"{disk['device']} ({disk['mount']})")
+            queue_config(row['percent'], text=PERCENT_STRINGS[min(100, max(0, percent))], fg=color)
+            if percent != row['bar_percent']:
+                row['bar'].coords("fill", 0, 0, percent, 10)
+                row['bar_percent'] = percent
+            queue_itemconfig(row['bar'], "fill", fill=color)
             
-            # Bar
-            bar_frame = tk.Frame(row, bg=self.colors["bg_card"], height=10, width=100)
-            bar_frame.pack(side="right", padx=5)
-            bar_frame.pack_propagate(False)
-            
-            bar = tk.Frame(bar_frame, bg=color, width=percent)
-            bar.pack(side="left", fill="y")
+            if not row['visible']:
+                row['frame'].pack(fill="x", pady=2)
+                row['visible'] = True
     
-    def update_network(self):
-        rx, tx = self.get_network_speed()
+    def update_network(self, rx, tx):
+        self.queue_itemconfig(self.net_dl_text, "value", text=self.format_speed(rx))
+        self.queue_itemconfig(self.net_ul_text, "value", text=self.format_speed(tx))
         
-        self.net_dl_label.config(text=self.format_speed(rx))
-        self.net_ul_label.config(text=self.format_speed(tx))
+        canvas = self.net_canvas
+        rx_history = self.net_rx_history
+        tx_history = self.net_tx_history
         
         # Update history
-        self.net_rx_history.pop(0)
-        self.net_rx_history.append(rx)
-        self.net_tx_history.pop(0)
-        self.net_tx_history.append(tx)
+        rx_history.append(rx)
+        tx_history.append(tx)
         
         # Draw graph
-        max_net = max(max(self.net_rx_history), max(self.net_tx_history), 1024)
-        self.net_canvas.delete("all")
-        
-        w = self.net_canvas.winfo_width()
-        h = self.net_canvas.winfo_height()
-        
-        if w > 1 and len(self.net_rx_history) > 1:
-            # RX (green)
-            points = []
-            for i, val in enumerate(self.net_rx_history):
-                x = w * i / (len(self.net_rx_history) - 1)
-                y = h - (h * min(val, max_net) / max_net)
-                points.append((x, y))
-            
-            for i in range(len(points) - 1):
-                self.net_canvas.create_line(
-                    points[i][0], points[i][1],
-                    points[i+1][0], points[i+1][1],
-                    fill=self.colors["accent_green"], width=2
-                )
+        max_net = max(max(rx_history), max(tx_history), 1024)
+        
+        w, h = self.canvas_sizes[canvas]
+        
+        if w > 1:
+            # Flat [x0, y0, x1, y1, ...]; xs only change on resize, ys every tick
+            state = self.graph_state.get(canvas)
+            if state is None or state['size'] != (w, h):
+                step = w / (HISTORY_LEN - 1)
+                coords = [0.0] * (2 * HISTORY_LEN)
+                coords[0::2] = [i * step for i in range(HISTORY_LEN)]
+                state = {'size': (w, h), 'coords': coords}
+                self.graph_state[canvas] = state
             
-            # TX (red)
-            points = []
-            for i, val in enumerate(self.net_tx_history):
-                x = w * i / (len(self.net_tx_history) - 1)
-                y = h - (h * min(val, max_net) / max_net)
-                points.append((x, y))
-            
-            for i in range(len(points) - 1):
-                self.net_canvas.create_line(
-                    points[i][0], points[i][1],
-                    points[i+1][0], points[i+1][1],
-                    fill=self.colors["accent_red"], width=2
-                )
+            # max_net bounds every sample, so no clipping is needed here
+            scale = h / max_net
+            call = self.tk_call
+            path = canvas._w
+            coords = state['coords']
+            coords[1::2] = [h - v * scale for v in rx_history]
+            call(path, "coords", self.net_rx_line, coords)
+            coords[1::2] = [h - v * scale for v in tx_history]
+            call(path, "coords", self.net_tx_line, coords)
     
-    def update_processes(self):
-        procs = self.get_top_processes()
-        
-        for i, labels in enumerate(self.process_labels):
-            if i < len(procs):
-                p = procs[i]
-                labels[0].config(text=p['name'])
-                labels[1].config(text=p['cpu'])
-                labels[2].config(text=p['mem'])
-                labels[3].config(text=p['pid'])
-            else:
-                for lbl in labels:
-                    lbl.config(text="--")
+    def update_processes(self, procs):
+        rows = [
+            PROCESS_ROW_FORMAT.format(p['name'], p['cpu'], p['mem'], p['pid'])
+            for p in procs[:PROCESS_ROWS]
+        ]
+        rows += [EMPTY_PROCESS_ROW] * (PROCESS_ROWS - len(rows))
+        table = "\n".join(rows)
+        if table == self.process_table:
+            return
+        self.process_table = table
+        
+        # Read-only except for this swap
+        text = self.process_text
+        text.config(state="normal")
+        text.delete("1.0", "end")
+        text.insert("1.0", table)
+        text.config(state="disabled")
     
-    def update_system_status(self):
-        stats = self.get_system_stats()
+    def update_system_status(self, stats):
         for key, val in stats.items():
             if key in self.status_values:
-                self.status_values[key].config(text=val)
+                self.queue_config(self.status_values[key], text=val)
     
     def update_time(self):
-        now = datetime.now()
-        self.time_label.config(text=now.strftime("%H:%M:%S"))
+        # Guard against an early or doubled wakeup re-formatting the same second
+        now = int(time.time())
+        if now == self.clock_second:
+            return
+        self.clock_second = now
+        self.queue_itemconfig(self.time_text, "value", text=time.strftime("%H:%M:%S", time.localtime(now)))
     
     def blink_status(self):
-        current = self.status_dot.cget("fg")
-        new_color = self.colors["bg_panel"] if current == self.colors["nominal"] else self.colors["nominal"]
-        self.status_dot.config(fg=new_color)
+        self.status_dot_lit = not self.status_dot_lit
+        new_color = self.colors["nominal"] if self.status_dot_lit else self.colors["bg_panel"]
+        self.queue_itemconfig(self.status_dot, "value", fill=new_color)
+        self.root.after(1000, self.blink_status)
+    
+    def update_clock(self):
+        self.update_time()
+        
+        # Aim just past the next second boundary rather than a fixed period,
+        # so the displayed second never lags or drifts by the handler's runtime
+        now = time.time()
+        delay = int((1 - (now - int(now))) * 1000) + 5
+        self.root.after(delay, self.update_clock)
+    
+    def on_sample_ready(self, fd, mask):
+        os.read(fd, 64)
+        self.update_all()
     
     def update_all(self):
+        """Render pass: only touches widgets, all sampling happens in sampler_loop"""
         try:
-            self.update_time()
-            self.update_thermal()
-            self.update_cpu()
-            self.update_memory()
-            self.update_storage()
-            self.update_network()
-            self.update_processes()
-            self.update_system_status()
-            self.blink_status()
+            with self.snapshot_lock:
+                snapshot, self.snapshot = self.snapshot, None
+            
+            if snapshot is not None:
+                # Only panels whose data was sampled since the last pass are redrawn
+                if 'thermal' in snapshot:
+                    self.update_thermal(*snapshot['thermal'])
+                if 'cpu' in snapshot:
+                    self.update_cpu(*snapshot['cpu'])
+                if 'memory' in snapshot:
+                    self.update_memory(snapshot['memory'])
+                if 'storage' in snapshot:
+                    self.update_storage(snapshot['storage'])
+                if 'network' in snapshot:
+                    self.update_network(*snapshot['network'])
+                if 'processes' in snapshot:
+                    self.update_processes(snapshot['processes'])
+                if 'system' in snapshot:
+                    self.update_system_status(snapshot['system'])
         except Exception as e:
             print(f"Update error: {e}")
-        
-        # Schedule next update
-        self.root.after(1000, self.update_all)
 
 
 def main():
@@ -10,16 +10,84 @@ NOTE: Run with sudo for GPU temperature access:
 
 import tkinter as tk
 from tkinter import ttk
-import subprocess
+import socket
 import struct
-import re
 import os
+import heapq
+import bisect
+import mmap
 import time
+import queue
 import threading
+import concurrent.futures
 from pathlib import Path
+from array import array
 from datetime import datetime, timedelta
 
 
+# utmp records (glibc x86_64 layout); ut_type is the leading short
+UTMP_RECORD_SIZE = 384
+UTMP_USER_PROCESS = 7
+UTMP_TYPE = struct.Struct("h")
+
+# Filesystems the storage panel never shows (same set we used to pass to df -x)
+IGNORED_FSTYPES = {"tmpfs", "devtmpfs", "squashfs", "overlay"}
+MOUNT_CACHE_SECONDS = 30
+
+# Preformatted label text for whole-number readings, indexed by value
+PERCENT_STRINGS = tuple(f"{i}%" for i in range(101))
+TEMP_MIN = -20
+TEMP_STRINGS = tuple(f"{i}°C" for i in range(TEMP_MIN, 130))
+
+# rtnetlink multicast group for link add/remove notifications (<linux/rtnetlink.h>)
+RTMGRP_LINK = 1
+
+# Colour bucket boundaries; bisect picks the bucket (nominal, warning, critical)
+CPU_USAGE_THRESHOLDS = (50, 80)
+DISK_THRESHOLDS = (70, 90)
+PROCESS_CPU_THRESHOLDS = (20, 50)  # bisect_left: a process must exceed these
+
+# Samples kept per graph: one minute at one sample per second
+HISTORY_LEN = 60
+
+# Seconds the collector waits on a sensor read before reusing its last value
+SENSOR_TIMEOUT = 0.5
+
+# Collector ticks (1 s each) between refreshes of each source
+COLLECT_EVERY = {
+    'gpu_temps': 1,
+    'gpu_freq': 1,
+    'cpu_usage': 1,
+    'cpu_temp': 1,
+    'cpu_freq': 1,
+    'memory': 1,
+    'network': 1,
+    'processes': 2,
+    'system': 5,
+    'storage': 10,
+}
+
+# What each source shows until its first read lands: the same "no data" values
+# the readers return on failure
+COLLECT_DEFAULTS = {
+    'gpu_temps': (None, None),
+    'gpu_freq': (None, None),
+    'cpu_usage': 0,
+    'cpu_temp': None,
+    'cpu_freq': 0,
+    'memory': None,
+    'network': (0, 0, 0, 0),
+    'processes': [],
+    'system': {'uptime': '--', 'procs': '--', 'threads': '--', 'load': '--', 'users': '--'},
+    'storage': [],
+}
+
+# Intel PMT telemetry: GPU temp sensor 1 at 0xa4, hotspot at 0xa8 (u32 each)
+PMT_TELEM_PATH = '/sys/class/intel_pmt/telem2/telem'
+PMT_MAP_SIZE = 0xb0
+PMT_TEMPS = struct.Struct('<II')
+
+
 class SystemCommandCenter:
     def __init__(self, root):
         self.root = root
@@ -54,21 +122,74 @@ class SystemCommandCenter:
         }
         
         # Data storage
-        self.cpu_history = [0] * 60
-        self.mem_history = [0] * 60
-        self.gpu_temp_history = [0] * 60
-        self.cpu_temp_history = [0] * 60
-        self.net_rx_history = [0] * 60
-        self.net_tx_history = [0] * 60
+        # Packed float32 ring histories (240 bytes each); see push_history().
+        # history_pos[name] is the slot the next sample overwrites, i.e. the oldest.
+        self.history = {
+            name: array('f', bytes(4 * HISTORY_LEN))
+            for name in ('cpu', 'mem', 'gpu_temp', 'cpu_temp', 'net_rx', 'net_tx')
+        }
+        self.history_pos = dict.fromkeys(self.history, 0)
+        self.graph_state = {}  # canvas -> persistent graph items, see graph_items()
+        self.label_fg = {}  # label -> last fg set through set_fg()
+        self.shown_storage = None  # disks list the storage rows were last built from
+        self.shown_time = None  # clock string last written to time_var
+        self.shown_date = None
+        self.usage_colors = (self.colors["accent_green"], self.colors["warning"], self.colors["critical"])
+        self.process_cpu_colors = (self.colors["text_dim"], self.colors["warning"], self.colors["critical"])
+        self.temp_states = (
+            (self.colors["nominal"], "● NOMINAL"),
+            (self.colors["warning"], "● ELEVATED"),
+            (self.colors["critical"], "● CRITICAL"),
+        )
+        self.last_cpu = None  # (idle, total) jiffies from the previous /proc/stat read
         self.last_net_rx = 0
         self.last_net_tx = 0
         self.last_net_time = time.time()
         self.start_time = datetime.now()
+        self.mounts = []
+        self.mounts_time = None
+        self.int_buf = bytearray(32)
+        self.clk_tck = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.last_proc_jiffies = {}
+        self.last_proc_time = time.monotonic()
+        self.link_sock = self.open_link_monitor()
+        self.net_ifaces = []
+        self.net_ifaces = self.get_net_ifaces()
         
         # Check if running as root (needed for GPU temps)
         self.has_root = os.geteuid() == 0
         
+        # Values that don't change while we run, read once
+        self.cpu_info = self.get_cpu_info()
+        self.mem_total, self.swap_total = self.get_memory_totals()
+        
+        # GPU telemetry page, mapped once and read in place every tick
+        self.pmt_map = self.open_pmt()
+        self.cpu_temp_fd = self.open_cpu_temp()
+        
+        # Collector thread hands the newest snapshot to the Tk loop
+        self.metrics_queue = queue.Queue(maxsize=1)
+        self.metrics_cache = dict(COLLECT_DEFAULTS)
+        self.tick = 0
+        self.sensor_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self.sensor_futures = {}
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.collectors = {
+            'gpu_temps': self.get_gpu_temps,
+            'gpu_freq': self.get_gpu_frequency,
+            'cpu_usage': self.get_cpu_usage,
+            'cpu_temp': self.get_cpu_temp,
+            'cpu_freq': self.get_cpu_freq,
+            'memory': self.get_memory_info,
+            'network': self.get_network_speed,
+            'processes': self.get_top_processes,
+            'system': self.get_system_stats,
+            'storage': self.get_storage_info,
+        }
+        
         self.setup_ui()
+        self.start_collector()
         self.update_all()
         self.blink_cycle()
     
@@ -177,18 +298,20 @@ class SystemCommandCenter:
         time_frame = tk.Frame(right, bg=self.colors["bg_panel"])
         time_frame.pack(side="right", pady=10)
         
+        self.time_var = tk.StringVar(value="00:00:00")
         self.time_label = tk.Label(
             time_frame,
-            text="00:00:00",
+            textvariable=self.time_var,
             font=("Monospace", 24, "bold"),
             fg=self.colors["text_bright"],
             bg=self.colors["bg_panel"]
         )
         self.time_label.pack(anchor="e")
         
+        self.date_var = tk.StringVar(value="")
         self.date_label = tk.Label(
             time_frame,
-            text="",
+            textvariable=self.date_var,
             font=("Monospace", 10),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -199,8 +322,8 @@ class SystemCommandCenter:
         center = tk.Frame(header, bg=self.colors["bg_panel"])
         center.pack(side="right", fill="y", padx=30)
         
-        hostname = subprocess.getoutput("hostname").strip()
-        kernel = subprocess.getoutput("uname -r").strip()
+        hostname = socket.gethostname()
+        kernel = os.uname().release
         
         self.hostname_label = tk.Label(
             center,
@@ -276,18 +399,20 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="w")
         
+        self.gpu_temp1_var = tk.StringVar(value="--°C")
         self.gpu_temp1_label = tk.Label(
             temp1_frame,
-            text="--°C",
+            textvariable=self.gpu_temp1_var,
             font=("Monospace", 32, "bold"),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
         )
         self.gpu_temp1_label.pack(anchor="w")
         
+        self.gpu_temp1_status_var = tk.StringVar(value="● STANDBY")
         self.gpu_temp1_status = tk.Label(
             temp1_frame,
-            text="● STANDBY",
+            textvariable=self.gpu_temp1_status_var,
             font=("Monospace", 9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -306,18 +431,20 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="w")
         
+        self.gpu_temp2_var = tk.StringVar(value="--°C")
         self.gpu_temp2_label = tk.Label(
             temp2_frame,
-            text="--°C",
+            textvariable=self.gpu_temp2_var,
             font=("Monospace", 32, "bold"),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
         )
         self.gpu_temp2_label.pack(anchor="w")
         
+        self.gpu_temp2_status_var = tk.StringVar(value="● STANDBY")
         self.gpu_temp2_status = tk.Label(
             temp2_frame,
-            text="● STANDBY",
+            textvariable=self.gpu_temp2_status_var,
             font=("Monospace", 9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -336,18 +463,20 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="e")
         
+        self.gpu_freq_var = tk.StringVar(value="-- MHz")
         self.gpu_freq_label = tk.Label(
             freq_frame,
-            text="-- MHz",
+            textvariable=self.gpu_freq_var,
             font=("Monospace", 24, "bold"),
             fg=self.colors["accent_cyan"],
             bg=self.colors["bg_panel"]
         )
         self.gpu_freq_label.pack(anchor="e")
         
+        self.gpu_freq_max_var = tk.StringVar(value="MAX: -- MHz")
         self.gpu_freq_max = tk.Label(
             freq_frame,
-            text="MAX: -- MHz",
+            textvariable=self.gpu_freq_max_var,
             font=("Monospace", 9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -392,9 +521,10 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="w")
         
+        self.cpu_percent_var = tk.StringVar(value="0%")
         self.cpu_percent_label = tk.Label(
             usage_frame,
-            text="0%",
+            textvariable=self.cpu_percent_var,
             font=("Monospace", 32, "bold"),
             fg=self.colors["accent_green"],
             bg=self.colors["bg_panel"]
@@ -413,18 +543,20 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="w")
         
+        self.cpu_temp_var = tk.StringVar(value="--°C")
         self.cpu_temp_label = tk.Label(
             temp_frame,
-            text="--°C",
+            textvariable=self.cpu_temp_var,
             font=("Monospace", 32, "bold"),
             fg=self.colors["nominal"],
             bg=self.colors["bg_panel"]
         )
         self.cpu_temp_label.pack(anchor="w")
         
+        self.cpu_temp_status_var = tk.StringVar(value="● NOMINAL")
         self.cpu_temp_status = tk.Label(
             temp_frame,
-            text="● NOMINAL",
+            textvariable=self.cpu_temp_status_var,
             font=("Monospace", 9),
             fg=self.colors["nominal"],
             bg=self.colors["bg_panel"]
@@ -443,9 +575,10 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="e")
         
+        self.cpu_freq_var = tk.StringVar(value="0 MHz")
         self.cpu_freq_label = tk.Label(
             info_frame,
-            text="0 MHz",
+            textvariable=self.cpu_freq_var,
             font=("Monospace", 18, "bold"),
             fg=self.colors["text_normal"],
             bg=self.colors["bg_panel"]
@@ -454,7 +587,7 @@ class SystemCommandCenter:
         
         self.cpu_cores_label = tk.Label(
             info_frame,
-            text="0 cores / 0 threads",
+            text=f"{self.cpu_info[0]} cores / {self.cpu_info[1]} threads",
             font=("Monospace", 9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -489,9 +622,10 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(side="left")
         
+        self.ram_percent_var = tk.StringVar(value="0%")
         self.ram_percent = tk.Label(
             ram_header,
-            text="0%",
+            textvariable=self.ram_percent_var,
             font=("Monospace", 11, "bold"),
             fg=self.colors["text_bright"],
             bg=self.colors["bg_panel"]
@@ -506,9 +640,10 @@ class SystemCommandCenter:
         self.ram_bar = tk.Frame(self.ram_bar_frame, bg=self.colors["accent_purple"], width=0)
         self.ram_bar.pack(side="left", fill="y")
         
+        self.ram_details_var = tk.StringVar(value="0 GB / 0 GB")
         self.ram_details = tk.Label(
             ram_frame,
-            text="0 GB / 0 GB",
+            textvariable=self.ram_details_var,
             font=("Monospace", 9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -530,9 +665,10 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(side="left")
         
+        self.swap_percent_var = tk.StringVar(value="0%")
         self.swap_percent = tk.Label(
             swap_header,
-            text="0%",
+            textvariable=self.swap_percent_var,
             font=("Monospace", 11, "bold"),
             fg=self.colors["text_bright"],
             bg=self.colors["bg_panel"]
@@ -547,9 +683,10 @@ class SystemCommandCenter:
         self.swap_bar = tk.Frame(self.swap_bar_frame, bg=self.colors["accent_yellow"], width=0)
         self.swap_bar.pack(side="left", fill="y")
         
+        self.swap_details_var = tk.StringVar(value="0 GB / 0 GB")
         self.swap_details = tk.Label(
             swap_frame,
-            text="0 GB / 0 GB",
+            textvariable=self.swap_details_var,
             font=("Monospace", 9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -586,15 +723,16 @@ class SystemCommandCenter:
                 bg=self.colors["bg_panel"]
             ).pack()
             
+            val_var = tk.StringVar(value="--")
             val_label = tk.Label(
                 frame,
-                text="--",
+                textvariable=val_var,
                 font=("Monospace", 16, "bold"),
                 fg=color,
                 bg=self.colors["bg_panel"]
             )
             val_label.pack()
-            self.status_values[key] = val_label
+            self.status_values[key] = val_var
     
     def create_storage_panel(self, parent):
         """Storage panel"""
@@ -623,18 +761,20 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="w")
         
+        self.net_dl_var = tk.StringVar(value="0 B/s")
         self.net_dl_label = tk.Label(
             dl_frame,
-            text="0 B/s",
+            textvariable=self.net_dl_var,
             font=("Monospace", 18, "bold"),
             fg=self.colors["accent_green"],
             bg=self.colors["bg_panel"]
         )
         self.net_dl_label.pack(anchor="w")
         
+        self.net_dl_total_var = tk.StringVar(value="Total: 0 B")
         self.net_dl_total = tk.Label(
             dl_frame,
-            text="Total: 0 B",
+            textvariable=self.net_dl_total_var,
             font=("Monospace", 9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -653,18 +793,20 @@ class SystemCommandCenter:
             bg=self.colors["bg_panel"]
         ).pack(anchor="e")
         
+        self.net_ul_var = tk.StringVar(value="0 B/s")
         self.net_ul_label = tk.Label(
             ul_frame,
-            text="0 B/s",
+            textvariable=self.net_ul_var,
             font=("Monospace", 18, "bold"),
             fg=self.colors["accent_red"],
             bg=self.colors["bg_panel"]
         )
         self.net_ul_label.pack(anchor="e")
         
+        self.net_ul_total_var = tk.StringVar(value="Total: 0 B")
         self.net_ul_total = tk.Label(
             ul_frame,
-            text="Total: 0 B",
+            textvariable=self.net_ul_total_var,
             font=("Monospace", 9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
@@ -709,17 +851,20 @@ class SystemCommandCenter:
         self.process_frame.pack(fill="both", expand=True)
         
         self.process_labels = []
+        self.process_vars = []
         for i in range(8):
             row = tk.Frame(self.process_frame, bg=self.colors["bg_panel"])
             row.pack(fill="x", pady=2)
             
             labels = []
+            text_vars = []
             widths = [30, 8, 8, 10]
             for j, w in enumerate(widths):
                 color = self.colors["text_normal"] if j == 0 else self.colors["text_dim"]
+                var = tk.StringVar(value="--")
                 lbl = tk.Label(
                     row,
-                    text="--",
+                    textvariable=var,
                     font=("Monospace", 9),
                     fg=color,
                     bg=self.colors["bg_panel"],
@@ -728,28 +873,54 @@ class SystemCommandCenter:
                 )
                 lbl.pack(side="left")
                 labels.append(lbl)
+                text_vars.append(var)
             self.process_labels.append(labels)
+            self.process_vars.append(text_vars)
     
     # ==================== DATA FETCHING ====================
     
+    def open_pmt(self):
+        """Map the PMT telemetry region once; None if it can't be mapped"""
+        if not self.has_root:
+            return None
+        try:
+            fd = os.open(PMT_TELEM_PATH, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            return mmap.mmap(fd, PMT_MAP_SIZE, prot=mmap.PROT_READ)
+        except (OSError, ValueError):
+            return None
+        finally:
+            os.close(fd)  # the mapping keeps its own reference
+    
     def get_gpu_temps(self):
         """Get Intel Arc GPU temperatures from PMT telemetry"""
         if not self.has_root:
             return None, None
         
-        try:
-            with open('/sys/class/intel_pmt/telem2/telem', 'rb') as f:
-                data = f.read()
-                # Offset 0xa4: GPU temp sensor 1
-                # Offset 0xa8: GPU temp sensor 2 (hotspot)
-                temp1 = struct.unpack('<I', data[0xa4:0xa8])[0]
-                temp2 = struct.unpack('<I', data[0xa8:0xac])[0]
-                
-                # Sanity check - temps should be reasonable
+        # Mapped: two loads from the shared page, no syscalls
+        if self.pmt_map is not None:
+            try:
+                temp1, temp2 = PMT_TEMPS.unpack_from(self.pmt_map, 0xa4)
                 if 0 < temp1 < 120 and 0 < temp2 < 120:
                     return temp1, temp2
+                return None, None
+            except (ValueError, struct.error):
+                return None, None
+        
+        try:
+            with open(PMT_TELEM_PATH, 'rb') as f:
+                data = f.read(PMT_MAP_SIZE)
+            # Offset 0xa4: GPU temp sensor 1
+            # Offset 0xa8: GPU temp sensor 2 (hotspot)
+            temp1, temp2 = PMT_TEMPS.unpack_from(data, 0xa4)
+            
+            # Sanity check - temps should be reasonable
+            if 0 < temp1 < 120 and 0 < temp2 < 120:
+                return temp1, temp2
             return None, None
-        except:
+        except (OSError, struct.error):
             return None, None
     
     def get_gpu_frequency(self):
@@ -758,73 +929,110 @@ class SystemCommandCenter:
             cur_freq = Path("/sys/class/drm/card1/device/tile0/gt0/freq0/act_freq").read_text().strip()
             max_freq = Path("/sys/class/drm/card1/device/tile0/gt0/freq0/max_freq").read_text().strip()
             return int(cur_freq), int(max_freq)
-        except:
+        except (OSError, ValueError):
             return None, None
     
+    def open_cpu_temp(self):
+        """Open the k10temp temp1_input once; hwmonN numbering isn't stable across boots"""
+        try:
+            with os.scandir("/sys/class/hwmon") as it:
+                for entry in it:
+                    try:
+                        with open(f"{entry.path}/name", "rb") as f:
+                            if f.read().strip() == b"k10temp":
+                                return os.open(f"{entry.path}/temp1_input", os.O_RDONLY)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return None
+    
     def get_cpu_temp(self):
         """Get AMD Ryzen CPU temperature from hwmon (k10temp)"""
-        try:
-            temp_file = Path("/sys/class/hwmon/hwmon2/temp1_input")
-            if temp_file.exists():
-                return int(temp_file.read_text().strip()) / 1000
+        if self.cpu_temp_fd is None:
             return None
-        except:
+        try:
+            return int(os.pread(self.cpu_temp_fd, 16, 0)) / 1000
+        except (OSError, ValueError):
             return None
     
     def get_cpu_usage(self):
         try:
-            output = subprocess.getoutput("grep 'cpu ' /proc/stat")
-            parts = output.split()
-            idle = int(parts[4])
-            total = sum(int(p) for p in parts[1:])
+            # Aggregate "cpu" line is always first
+            with open("/proc/stat", "rb") as f:
+                _, user, nice, system, idle, iowait, irq, softirq, steal, *_ = f.readline().split()
+            # iowait is idle time; guest time is already folded into user/nice
+            idle_all = int(idle) + int(iowait)
+            total = idle_all + int(user) + int(nice) + int(system) + int(irq) + int(softirq) + int(steal)
             
-            if hasattr(self, 'last_cpu_idle'):
-                diff_idle = idle - self.last_cpu_idle
-                diff_total = total - self.last_cpu_total
+            if self.last_cpu is not None:
+                last_idle, last_total = self.last_cpu
+                diff_idle = idle_all - last_idle
+                diff_total = total - last_total
                 usage = 100 * (1 - diff_idle / diff_total) if diff_total > 0 else 0
             else:
                 usage = 0
             
-            self.last_cpu_idle = idle
-            self.last_cpu_total = total
+            self.last_cpu = (idle_all, total)
             return max(0, min(100, usage))
-        except:
+        except (OSError, ValueError, IndexError):
             return 0
     
     def get_cpu_freq(self):
         try:
             freqs = []
-            output = subprocess.getoutput("grep 'MHz' /proc/cpuinfo")
-            for line in output.split('\n'):
-                match = re.search(r':\s*(\d+)', line)
-                if match:
-                    freqs.append(int(float(match.group(1))))
+            with open("/proc/cpuinfo", "rb") as f:
+                for line in f.read().split(b'\n'):
+                    if line.startswith(b'cpu MHz'):
+                        freqs.append(int(float(line.partition(b':')[2])))
             return int(sum(freqs) / len(freqs)) if freqs else 0
-        except:
+        except (OSError, ValueError):
             return 0
     
     def get_cpu_info(self):
+        """Physical cores and logical CPUs; static, so only called once from __init__"""
         try:
-            cores = int(subprocess.getoutput("grep -c 'processor' /proc/cpuinfo"))
-            physical = subprocess.getoutput("grep 'cpu cores' /proc/cpuinfo | head -1")
-            match = re.search(r'(\d+)', physical)
-            phys_cores = int(match.group(1)) if match else cores // 2
+            with open("/proc/cpuinfo", "rb") as f:
+                cpuinfo = f.read()
+            cores = cpuinfo.count(b"processor\t")
+            phys_cores = cores // 2
+            for line in cpuinfo.split(b'\n'):
+                if line.startswith(b'cpu cores'):
+                    phys_cores = int(line.partition(b':')[2])
+                    break
             return phys_cores, cores
-        except:
+        except (OSError, ValueError):
+            return 0, 0
+    
+    def read_meminfo(self, keys):
+        """Byte values for the given /proc/meminfo fields; stops once all are found"""
+        info = {}
+        with open("/proc/meminfo") as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in keys:
+                    info[key] = int(value.split()[0]) * 1024
+                    if len(info) == len(keys):
+                        break
+        return info
+    
+    def get_memory_totals(self):
+        try:
+            info = self.read_meminfo(('MemTotal', 'SwapTotal'))
+            return info['MemTotal'], info['SwapTotal']
+        except (OSError, ValueError, KeyError):
             return 0, 0
     
     def get_memory_info(self):
         try:
-            output = subprocess.getoutput("free -b")
-            lines = output.split('\n')
+            info = self.read_meminfo(('MemAvailable', 'SwapFree'))
             
-            mem_parts = lines[1].split()
-            mem_total = int(mem_parts[1])
-            mem_used = int(mem_parts[2])
+            # Same "used" as free(1): everything the kernel can't hand back
+            mem_total = self.mem_total
+            mem_used = mem_total - info['MemAvailable']
             
-            swap_parts = lines[2].split()
-            swap_total = int(swap_parts[1])
-            swap_used = int(swap_parts[2])
+            swap_total = self.swap_total
+            swap_used = swap_total - info['SwapFree']
             
             return {
                 'mem_total': mem_total,
@@ -834,44 +1042,125 @@ class SystemCommandCenter:
                 'swap_used': swap_used,
                 'swap_percent': (swap_used / swap_total * 100) if swap_total > 0 else 0
             }
-        except:
+        except (OSError, ValueError, KeyError):
             return None
     
+    def get_mounts(self):
+        """Mounted filesystems from /proc/mounts, re-read every MOUNT_CACHE_SECONDS"""
+        now = time.monotonic()
+        if self.mounts_time is None or now - self.mounts_time > MOUNT_CACHE_SECONDS:
+            mounts = []
+            with open("/proc/mounts") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) >= 3 and parts[2] not in IGNORED_FSTYPES:
+                        # Spaces in mount points are escaped as \040
+                        mounts.append((parts[0], parts[1].replace("\\040", " ")))
+            self.mounts = mounts
+            self.mounts_time = now
+        return self.mounts
+    
     def get_storage_info(self):
         try:
-            output = subprocess.getoutput("df -B1 -x tmpfs -x devtmpfs -x squashfs -x overlay 2>/dev/null | tail -n +2")
             disks = []
-            seen_mounts = set()
-            for line in output.strip().split('\n'):
-                if line:
-                    parts = line.split()
-                    if len(parts) >= 6 and parts[5] not in seen_mounts:
-                        seen_mounts.add(parts[5])
-                        disks.append({
-                            'device': parts[0].split('/')[-1],
-                            'total': int(parts[1]),
-                            'used': int(parts[2]),
-                            'mount': parts[5],
-                            'percent': int(parts[4].replace('%', ''))
-                        })
+            seen = set()
+            for device, mount in self.get_mounts():
+                # Deduplicate by filesystem like df does: bind mounts share st_dev,
+                # btrfs subvolumes mounted from the same device don't
+                try:
+                    dev = os.stat(mount).st_dev
+                    if dev in seen:
+                        continue
+                    st = os.statvfs(mount)
+                except OSError:
+                    continue
+                # Pseudo filesystems (proc, sysfs, cgroup, ...) report no blocks
+                if st.f_blocks == 0:
+                    continue
+                seen.add(dev)
+                total = st.f_blocks * st.f_frsize
+                used = (st.f_blocks - st.f_bfree) * st.f_frsize
+                avail = st.f_bavail * st.f_frsize
+                # Same rounding as df: used / (used + available), rounded up
+                percent = -(-used * 100 // (used + avail)) if used + avail > 0 else 0
+                disks.append({
+                    'device': device.split('/')[-1],
+                    'total': total,
+                    'used': used,
+                    'mount': mount,
+                    'percent': percent
+                })
             return disks
-        except:
+        except OSError:
             return []
     
+    def open_link_monitor(self):
+        """Netlink socket that becomes readable when a network link is added or removed"""
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW | socket.SOCK_NONBLOCK,
+                                 socket.NETLINK_ROUTE)
+            sock.bind((0, RTMGRP_LINK))
+            return sock
+        except OSError:
+            return None
+    
+    def links_changed(self):
+        """Drain pending link notifications; True if there were any"""
+        if self.link_sock is None:
+            return False
+        changed = False
+        while True:
+            try:
+                self.link_sock.recv(65536)
+            except BlockingIOError:
+                return changed
+            except OSError:
+                # Overflowed (ENOBUFS): events were lost, so rescan anyway
+                return True
+            changed = True
+    
+    def get_net_ifaces(self):
+        """Open counter fds for every interface we count (not lo/docker0/veth*)"""
+        for rx_fd, tx_fd in self.net_ifaces:
+            os.close(rx_fd)
+            os.close(tx_fd)
+        ifaces = []
+        with os.scandir("/sys/class/net") as it:
+            for entry in it:
+                name = entry.name
+                if name not in ('lo', 'docker0') and not name.startswith('veth'):
+                    try:
+                        rx_fd = os.open(f"{entry.path}/statistics/rx_bytes", os.O_RDONLY)
+                    except OSError:
+                        continue
+                    try:
+                        tx_fd = os.open(f"{entry.path}/statistics/tx_bytes", os.O_RDONLY)
+                    except OSError:
+                        os.close(rx_fd)
+                        continue
+                    ifaces.append((rx_fd, tx_fd))
+        return ifaces
+    
+    def read_int(self, fd):
+        """Re-read a sysfs counter into the shared buffer; 0 if its device is gone"""
+        try:
+            n = os.preadv(fd, [self.int_buf], 0)
+        except OSError:
+            return 0
+        return int(self.int_buf[:n])
+    
     def get_network_speed(self):
         try:
             rx_total = 0
             tx_total = 0
             
-            net_path = Path("/sys/class/net")
-            for iface in net_path.iterdir():
-                if iface.name not in ('lo', 'docker0') and not iface.name.startswith('veth'):
-                    rx_file = iface / "statistics/rx_bytes"
-                    tx_file = iface / "statistics/tx_bytes"
-                    if rx_file.exists():
-                        rx_total += int(rx_file.read_text().strip())
-                    if tx_file.exists():
-                        tx_total += int(tx_file.read_text().strip())
+            if self.links_changed():
+                self.net_ifaces = self.get_net_ifaces()
+                self.last_net_rx = self.last_net_tx = 0  # totals jump; skip one delta
+            
+            for rx_fd, tx_fd in self.net_ifaces:
+                rx_total += self.read_int(rx_fd)
+                tx_total += self.read_int(tx_fd)
             
             now = time.time()
             elapsed = now - self.last_net_time
@@ -884,66 +1173,122 @@ class SystemCommandCenter:
             self.last_net_time = now
             
             return max(0, rx_speed), max(0, tx_speed), rx_total, tx_total
-        except:
+        except (OSError, ValueError):
             return 0, 0, 0, 0
     
-    def get_top_processes(self):
+    def get_top_processes(self, n=8):
+        """Top n processes by CPU since the last call, read straight from /proc"""
         try:
-            output = subprocess.getoutput("ps aux --sort=-%cpu | head -9 | tail -8")
+            now = time.monotonic()
+            elapsed = now - self.last_proc_time
+            jiffies = {}
             procs = []
-            for line in output.strip().split('\n'):
-                parts = line.split(None, 10)
-                if len(parts) >= 11:
-                    name = parts[10].split()[0].split('/')[-1][:28]
-                    procs.append({
-                        'name': name,
-                        'cpu': parts[2],
-                        'mem': parts[3],
-                        'pid': parts[1]
-                    })
-            return procs
-        except:
+            
+            with os.scandir("/proc") as it:
+                for entry in it:
+                    if not entry.name.isdigit():
+                        continue
+                    try:
+                        with open(f"/proc/{entry.name}/stat", "rb") as f:
+                            stat = f.read()
+                    except OSError:
+                        continue  # exited while we were scanning
+                    
+                    # comm can contain spaces and parens, so split after the last ')'
+                    head, _, tail = stat.rpartition(b')')
+                    fields = tail.split()
+                    pid = int(entry.name)
+                    total = int(fields[11]) + int(fields[12])  # utime + stime
+                    jiffies[pid] = total
+                    
+                    prev = self.last_proc_jiffies.get(pid)
+                    if prev is not None and elapsed > 0:
+                        cpu = (total - prev) / self.clk_tck / elapsed * 100
+                    else:
+                        cpu = 0
+                    rss = int(fields[21]) * self.page_size
+                    procs.append((cpu, rss, pid, head[head.find(b'(') + 1:]))
+            
+            self.last_proc_jiffies = jiffies
+            self.last_proc_time = now
+            
+            top = []
+            for cpu, rss, pid, comm in heapq.nlargest(n, procs):
+                top.append({
+                    'name': self.get_process_name(pid, comm),
+                    'cpu': f"{cpu:.1f}",
+                    'mem': f"{rss * 100 / self.mem_total:.1f}" if self.mem_total else "0.0",
+                    'pid': str(pid)
+                })
+            return top
+        except (OSError, ValueError, IndexError):
             return []
     
+    def get_process_name(self, pid, comm):
+        """Executable name like the ps COMMAND column; kernel threads show [comm]"""
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                argv0 = f.read().split(b"\0", 1)[0]
+        except OSError:
+            argv0 = b""
+        # Processes that rewrite their title can leave spaces in argv[0]
+        words = argv0.decode(errors="replace").split()
+        if words:
+            return words[0].split('/')[-1][:28]
+        return f"[{comm.decode(errors='replace')}]"[:28]
+    
+    def read_first_line(self, path):
+        """First line of a small /proc file, without building a file object"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.read(fd, 256).split(b"\n", 1)[0]
+        finally:
+            os.close(fd)
+    
     def get_system_stats(self):
         try:
             # Uptime
-            uptime_sec = float(Path("/proc/uptime").read_text().split()[0])
-            days = int(uptime_sec // 86400)
-            hours = int((uptime_sec % 86400) // 3600)
-            mins = int((uptime_sec % 3600) // 60)
+            uptime_sec = float(self.read_first_line("/proc/uptime").split()[0])
+            days, rem = divmod(int(uptime_sec), 86400)
+            hours, rem = divmod(rem, 3600)
+            mins = rem // 60
             if days > 0:
                 uptime_str = f"{days}d {hours}h"
             else:
                 uptime_str = f"{hours}h {mins}m"
             
-            # Process and thread count
-            procs = 0
-            threads = 0
-            for p in Path("/proc").iterdir():
-                if p.name.isdigit():
-                    procs += 1
-                    try:
-                        threads += len(list((p / "task").iterdir()))
-                    except:
-                        pass
-            
-            # Load average
-            load = Path("/proc/loadavg").read_text().split()[0]
+            # Load average; the fourth field is running/total scheduling entities (threads)
+            fields = self.read_first_line("/proc/loadavg").split()
+            load = fields[0].decode()
+            threads = fields[3].rpartition(b"/")[2].decode()
             
-            # Users
-            users = subprocess.getoutput("who | wc -l").strip()
+            procs = sum(1 for name in os.listdir(b"/proc") if name.isdigit())
             
             return {
                 'uptime': uptime_str,
                 'procs': str(procs),
-                'threads': str(threads),
+                'threads': threads,
                 'load': load,
-                'users': users
+                'users': self.get_user_count()
             }
-        except:
+        except (OSError, ValueError, IndexError):
             return {'uptime': '--', 'procs': '--', 'threads': '--', 'load': '--', 'users': '--'}
     
+    def get_user_count(self):
+        """Count logged-in sessions the way `who` does, straight from utmp"""
+        try:
+            with open("/var/run/utmp", "rb") as f:
+                data = f.read()
+            users = 0
+            for offset in range(0, len(data) - UTMP_RECORD_SIZE + 1, UTMP_RECORD_SIZE):
+                if UTMP_TYPE.unpack_from(data, offset)[0] == UTMP_USER_PROCESS:
+                    users += 1
+            return str(users)
+        except FileNotFoundError:
+            return "0"
+        except (OSError, struct.error):
+            return "--"
+    
     def format_bytes(self, b):
         for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
             if b < 1024:
@@ -958,180 +1303,258 @@ class SystemCommandCenter:
             bps /= 1024
         return f"{bps:.1f} TB/s"
     
+    def format_temp(self, temp):
+        """Whole-degree label text, from the prebuilt table when it's in range"""
+        degrees = round(temp)
+        if TEMP_MIN <= degrees < TEMP_MIN + len(TEMP_STRINGS):
+            return TEMP_STRINGS[degrees - TEMP_MIN]
+        return f"{degrees}°C"
+    
     def get_temp_color_status(self, temp, thresholds=(55, 75)):
         """Get color and status based on temperature"""
         if temp is None:
             return self.colors["text_dim"], "● OFFLINE"
         
-        low, high = thresholds
-        if temp < low:
-            return self.colors["nominal"], "● NOMINAL"
-        elif temp < high:
-            return self.colors["warning"], "● ELEVATED"
-        else:
-            return self.colors["critical"], "● CRITICAL"
+        return self.temp_states[bisect.bisect_right(thresholds, temp)]
+    
+    # ==================== SAMPLING ====================
+    
+    def collect_metrics(self):
+        """Refresh whichever sources are due this tick; runs on the collector thread.
+        
+        Due sources are read concurrently on the sensor pool, so a tick costs
+        about as long as the slowest read rather than the sum of them. Sources
+        that aren't due, don't answer in time or fail keep their last value
+        (COLLECT_DEFAULTS before the first read), so every snapshot is complete.
+        """
+        for name, every in COLLECT_EVERY.items():
+            if self.tick % every == 0:
+                # Don't stack a second read behind one that is still stuck
+                pending = self.sensor_futures.get(name)
+                if pending is None or pending.done():
+                    self.sensor_futures[name] = self.sensor_pool.submit(self.collectors[name])
+        self.tick += 1
+        
+        concurrent.futures.wait(self.sensor_futures.values(), timeout=SENSOR_TIMEOUT)
+        for name, future in list(self.sensor_futures.items()):
+            if future.done():
+                del self.sensor_futures[name]
+                try:
+                    self.metrics_cache[name] = future.result()
+                except Exception as e:
+                    print(f"Collect error ({name}): {e}")
+        return dict(self.metrics_cache)
+    
+    def close(self):
+        """Window closed: drop queued sensor reads and leave the Tk loop"""
+        self.sensor_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
+    def sensors_stuck(self):
+        """True while a sensor read is still running (e.g. statvfs on a dead NFS mount)"""
+        return any(not future.done() for future in list(self.sensor_futures.values()))
+    
+    def start_collector(self):
+        thread = threading.Thread(target=self.collect_loop, daemon=True)
+        thread.start()
+    
+    def collect_loop(self):
+        while True:
+            try:
+                metrics = self.collect_metrics()
+            except Exception as e:
+                print(f"Collect error: {e}")
+            else:
+                # Single-slot queue: replace a snapshot the UI hasn't picked up yet
+                try:
+                    self.metrics_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self.metrics_queue.put(metrics)
+            time.sleep(1)
     
     # ==================== DRAWING ====================
     
-    def draw_graph(self, canvas, data, color, max_val=100):
-        canvas.delete("all")
+    def push_history(self, name, value):
+        """Overwrite the oldest sample of a ring history with value"""
+        pos = self.history_pos[name]
+        self.history[name][pos] = value
+        self.history_pos[name] = (pos + 1) % HISTORY_LEN
+    
+    def scale_history(self, data, h, max_val, start=0):
+        """Canvas y per sample, oldest first from data[start]; scale factor hoisted out of the loop"""
+        scale = h / max_val
+        ys = [h - (v if v < max_val else max_val) * scale for v in data]
+        return ys[start:] + ys[:start]
+    
+    def graph_items(self, canvas, n, specs):
+        """Persistent items for a graph, rebuilt only when the canvas size changes.
+        
+        specs lists the items to create as (kind, options) pairs; the returned
+        state holds their ids plus a flat coords list with the x values filled in.
+        """
         w = canvas.winfo_width()
         h = canvas.winfo_height()
+        state = self.graph_state.get(canvas)
+        if state is not None and state['size'] == (w, h):
+            return state
         
-        if w <= 1:
-            return
+        canvas.delete("all")
         
         # Draw grid lines
         for i in range(1, 4):
             y = h * i / 4
             canvas.create_line(0, y, w, y, fill=self.colors["grid_line"], dash=(2, 4))
         
-        # Draw data
-        if len(data) > 1 and max_val > 0:
-            points = []
-            for i, val in enumerate(data):
-                x = w * i / (len(data) - 1)
-                y = h - (h * min(val, max_val) / max_val)
-                points.append((x, y))
-            
-            # Fill area
-            fill_points = [(0, h)] + points + [(w, h)]
-            canvas.create_polygon(fill_points, fill=color, stipple="gray25", outline="")
-            
-            # Line
-            for i in range(len(points) - 1):
-                canvas.create_line(
-                    points[i][0], points[i][1],
-                    points[i+1][0], points[i+1][1],
-                    fill=color, width=2
-                )
+        step = w / (n - 1)
+        coords = [0.0] * (2 * n)
+        coords[0::2] = [i * step for i in range(n)]
+        
+        items = []
+        for kind, options in specs:
+            if kind == "polygon":
+                items.append(canvas.create_polygon(0, h, w, h, 0, h, **options))
+            else:
+                items.append(canvas.create_line(0, h, w, h, **options))
+        
+        state = {'size': (w, h), 'coords': coords, 'items': items, 'colors': {}}
+        self.graph_state[canvas] = state
+        return state
     
-    def draw_dual_graph(self, canvas, data1, color1, data2, color2, max_val=100):
-        canvas.delete("all")
-        w = canvas.winfo_width()
-        h = canvas.winfo_height()
+    def set_item_color(self, canvas, state, item, color):
+        if state['colors'].get(item) != color:
+            canvas.itemconfig(item, fill=color)
+            state['colors'][item] = color
+    
+    def draw_graph(self, canvas, data, color, max_val=100, start=0):
+        if canvas.winfo_width() <= 1 or len(data) < 2 or max_val <= 0:
+            return
+        
+        state = self.graph_items(canvas, len(data), [
+            ("polygon", {'fill': color, 'stipple': "gray25", 'outline': ""}),
+            ("line", {'fill': color, 'width': 2}),
+        ])
+        fill, line = state['items']
+        w, h = state['size']
         
-        if w <= 1:
+        coords = state['coords']
+        coords[1::2] = self.scale_history(data, h, max_val, start)
+        canvas.coords(line, coords)
+        canvas.coords(fill, [0, h] + coords + [w, h])
+        
+        self.set_item_color(canvas, state, fill, color)
+        self.set_item_color(canvas, state, line, color)
+    
+    def draw_dual_graph(self, canvas, data1, color1, data2, color2, max_val=100, start=0):
+        if canvas.winfo_width() <= 1 or len(data1) < 2 or max_val <= 0:
             return
         
-        # Draw grid
-        for i in range(1, 4):
-            y = h * i / 4
-            canvas.create_line(0, y, w, y, fill=self.colors["grid_line"], dash=(2, 4))
+        state = self.graph_items(canvas, len(data1), [
+            ("line", {'fill': color1, 'width': 2}),
+            ("line", {'fill': color2, 'width': 2}),
+        ])
+        h = state['size'][1]
         
-        # Draw both lines
-        for data, color in [(data1, color1), (data2, color2)]:
-            if len(data) > 1 and max_val > 0:
-                points = []
-                for i, val in enumerate(data):
-                    x = w * i / (len(data) - 1)
-                    y = h - (h * min(val, max_val) / max_val)
-                    points.append((x, y))
-                
-                for i in range(len(points) - 1):
-                    canvas.create_line(
-                        points[i][0], points[i][1],
-                        points[i+1][0], points[i+1][1],
-                        fill=color, width=2
-                    )
+        coords = state['coords']
+        for item, data in zip(state['items'], (data1, data2)):
+            coords[1::2] = self.scale_history(data, h, max_val, start)
+            canvas.coords(item, coords)
     
     # ==================== UI UPDATES ====================
     
-    def update_gpu(self):
+    def update_gpu(self, temps, freqs):
         # Temperatures
-        temp1, temp2 = self.get_gpu_temps()
+        temp1, temp2 = temps
         
         if temp1 is not None:
-            self.gpu_temp1_label.config(text=f"{temp1}°C")
+            self.gpu_temp1_var.set(self.format_temp(temp1))
             color, status = self.get_temp_color_status(temp1, (55, 80))
-            self.gpu_temp1_label.config(fg=color)
-            self.gpu_temp1_status.config(text=status, fg=color)
+            self.set_fg(self.gpu_temp1_label, color)
+            self.gpu_temp1_status_var.set(status)
+            self.set_fg(self.gpu_temp1_status, color)
             
-            self.gpu_temp_history.pop(0)
-            self.gpu_temp_history.append(temp1)
+            self.push_history('gpu_temp', temp1)
         else:
-            self.gpu_temp1_label.config(text="--°C", fg=self.colors["text_dim"])
-            self.gpu_temp1_status.config(text="● NO ACCESS", fg=self.colors["text_dim"])
+            self.gpu_temp1_var.set("--°C")
+            self.set_fg(self.gpu_temp1_label, self.colors["text_dim"])
+            self.gpu_temp1_status_var.set("● NO ACCESS")
+            self.set_fg(self.gpu_temp1_status, self.colors["text_dim"])
         
         if temp2 is not None:
-            self.gpu_temp2_label.config(text=f"{temp2}°C")
+            self.gpu_temp2_var.set(self.format_temp(temp2))
             color, status = self.get_temp_color_status(temp2, (60, 85))
-            self.gpu_temp2_label.config(fg=color)
-            self.gpu_temp2_status.config(text=status, fg=color)
+            self.set_fg(self.gpu_temp2_label, color)
+            self.gpu_temp2_status_var.set(status)
+            self.set_fg(self.gpu_temp2_status, color)
         else:
-            self.gpu_temp2_label.config(text="--°C", fg=self.colors["text_dim"])
-            self.gpu_temp2_status.config(text="● NO ACCESS", fg=self.colors["text_dim"])
+            self.gpu_temp2_var.set("--°C")
+            self.set_fg(self.gpu_temp2_label, self.colors["text_dim"])
+            self.gpu_temp2_status_var.set("● NO ACCESS")
+            self.set_fg(self.gpu_temp2_status, self.colors["text_dim"])
         
         # Frequency
-        cur_freq, max_freq = self.get_gpu_frequency()
+        cur_freq, max_freq = freqs
         if cur_freq is not None:
-            self.gpu_freq_label.config(text=f"{cur_freq} MHz")
-            self.gpu_freq_max.config(text=f"MAX: {max_freq} MHz")
+            self.gpu_freq_var.set(f"{cur_freq} MHz")
+            self.gpu_freq_max_var.set(f"MAX: {max_freq} MHz")
         
         # Draw temp graph
-        self.draw_graph(self.gpu_temp_canvas, self.gpu_temp_history, self.colors["accent_blue"], max_val=100)
+        self.draw_graph(self.gpu_temp_canvas, self.history['gpu_temp'], self.colors["accent_blue"],
+                        max_val=100, start=self.history_pos['gpu_temp'])
     
-    def update_cpu(self):
-        usage = self.get_cpu_usage()
-        temp = self.get_cpu_temp()
-        freq = self.get_cpu_freq()
-        cores, threads = self.get_cpu_info()
+    def update_cpu(self, usage, temp, freq):
         
         # Update history
-        self.cpu_history.pop(0)
-        self.cpu_history.append(usage)
+        self.push_history('cpu', usage)
         
         if temp:
-            self.cpu_temp_history.pop(0)
-            self.cpu_temp_history.append(temp)
+            self.push_history('cpu_temp', temp)
         
         # Usage color
-        if usage < 50:
-            usage_color = self.colors["accent_green"]
-        elif usage < 80:
-            usage_color = self.colors["warning"]
-        else:
-            usage_color = self.colors["critical"]
+        usage_color = self.usage_colors[bisect.bisect_right(CPU_USAGE_THRESHOLDS, usage)]
         
-        self.cpu_percent_label.config(text=f"{usage:.0f}%", fg=usage_color)
+        self.cpu_percent_var.set(PERCENT_STRINGS[round(usage)])
+        self.set_fg(self.cpu_percent_label, usage_color)
         
         # Temp
         if temp is not None:
-            self.cpu_temp_label.config(text=f"{temp:.0f}°C")
+            self.cpu_temp_var.set(self.format_temp(temp))
             color, status = self.get_temp_color_status(temp, (55, 75))
-            self.cpu_temp_label.config(fg=color)
-            self.cpu_temp_status.config(text=status, fg=color)
+            self.set_fg(self.cpu_temp_label, color)
+            self.cpu_temp_status_var.set(status)
+            self.set_fg(self.cpu_temp_status, color)
         
         # Info
-        self.cpu_freq_label.config(text=f"{freq} MHz")
-        self.cpu_cores_label.config(text=f"{cores} cores / {threads} threads")
+        self.cpu_freq_var.set(f"{freq} MHz")
         
         # Draw graph
-        self.draw_graph(self.cpu_canvas, self.cpu_history, usage_color)
+        self.draw_graph(self.cpu_canvas, self.history['cpu'], usage_color, start=self.history_pos['cpu'])
     
-    def update_memory(self):
-        mem = self.get_memory_info()
+    def update_memory(self, mem):
         if mem:
             # RAM
-            self.ram_percent.config(text=f"{mem['mem_percent']:.1f}%")
-            self.ram_details.config(
-                text=f"{self.format_bytes(mem['mem_used'])} / {self.format_bytes(mem['mem_total'])}"
+            self.ram_percent_var.set(f"{mem['mem_percent']:.1f}%")
+            self.ram_details_var.set(
+                f"{self.format_bytes(mem['mem_used'])} / {self.format_bytes(mem['mem_total'])}"
             )
             
             bar_width = int(self.ram_bar_frame.winfo_width() * mem['mem_percent'] / 100)
             self.ram_bar.config(width=max(0, bar_width))
             
             # Swap
-            self.swap_percent.config(text=f"{mem['swap_percent']:.1f}%")
-            self.swap_details.config(
-                text=f"{self.format_bytes(mem['swap_used'])} / {self.format_bytes(mem['swap_total'])}"
+            self.swap_percent_var.set(f"{mem['swap_percent']:.1f}%")
+            self.swap_details_var.set(
+                f"{self.format_bytes(mem['swap_used'])} / {self.format_bytes(mem['swap_total'])}"
             )
             
             swap_width = int(self.swap_bar_frame.winfo_width() * mem['swap_percent'] / 100)
             self.swap_bar.config(width=max(0, swap_width))
     
-    def update_storage(self):
-        disks = self.get_storage_info()
+    def update_storage(self, disks):
+        # Storage refreshes every COLLECT_EVERY['storage'] ticks; rebuild only when it changed
+        if disks == self.shown_storage:
+            return
+        self.shown_storage = disks
         
         for widget in self.storage_frame.winfo_children():
             widget.destroy()
@@ -1154,12 +1577,7 @@ class SystemCommandCenter:
             
             # Percent
             percent = disk['percent']
-            if percent < 70:
-                color = self.colors["accent_green"]
-            elif percent < 90:
-                color = self.colors["warning"]
-            else:
-                color = self.colors["critical"]
+            color = self.usage_colors[bisect.bisect_right(DISK_THRESHOLDS, percent)]
             
             tk.Label(
                 row,
@@ -1187,64 +1605,73 @@ class SystemCommandCenter:
             bar = tk.Frame(bar_frame, bg=color, width=int(80 * percent / 100))
             bar.pack(side="left", fill="y")
     
-    def update_network(self):
-        rx, tx, rx_total, tx_total = self.get_network_speed()
+    def update_network(self, rx, tx, rx_total, tx_total):
         
-        self.net_dl_label.config(text=self.format_speed(rx))
-        self.net_ul_label.config(text=self.format_speed(tx))
-        self.net_dl_total.config(text=f"Total: {self.format_bytes(rx_total)}")
-        self.net_ul_total.config(text=f"Total: {self.format_bytes(tx_total)}")
+        self.net_dl_var.set(self.format_speed(rx))
+        self.net_ul_var.set(self.format_speed(tx))
+        self.net_dl_total_var.set(f"Total: {self.format_bytes(rx_total)}")
+        self.net_ul_total_var.set(f"Total: {self.format_bytes(tx_total)}")
         
-        self.net_rx_history.pop(0)
-        self.net_rx_history.append(rx)
-        self.net_tx_history.pop(0)
-        self.net_tx_history.append(tx)
+        self.push_history('net_rx', rx)
+        self.push_history('net_tx', tx)
         
-        max_net = max(max(self.net_rx_history), max(self.net_tx_history), 1024)
+        rxs, txs = self.history['net_rx'], self.history['net_tx']
+        max_net = max(max(rxs), max(txs), 1024)
         self.draw_dual_graph(
             self.net_canvas,
-            self.net_rx_history, self.colors["accent_green"],
-            self.net_tx_history, self.colors["accent_red"],
-            max_val=max_net
+            rxs, self.colors["accent_green"],
+            txs, self.colors["accent_red"],
+            max_val=max_net, start=self.history_pos['net_rx']
         )
     
-    def update_processes(self):
-        procs = self.get_top_processes()
+    def update_processes(self, procs):
         
-        for i, labels in enumerate(self.process_labels):
+        for i, (labels, text_vars) in enumerate(zip(self.process_labels, self.process_vars)):
             if i < len(procs):
                 p = procs[i]
-                labels[0].config(text=p['name'], fg=self.colors["text_normal"])
+                text_vars[0].set(p['name'])
+                self.set_fg(labels[0], self.colors["text_normal"])
                 
                 # Color CPU usage
                 try:
                     cpu_val = float(p['cpu'])
-                    if cpu_val > 50:
-                        cpu_color = self.colors["critical"]
-                    elif cpu_val > 20:
-                        cpu_color = self.colors["warning"]
-                    else:
-                        cpu_color = self.colors["text_dim"]
-                except:
+                    cpu_color = self.process_cpu_colors[bisect.bisect_left(PROCESS_CPU_THRESHOLDS, cpu_val)]
+                except ValueError:
                     cpu_color = self.colors["text_dim"]
                 
-                labels[1].config(text=p['cpu'], fg=cpu_color)
-                labels[2].config(text=p['mem'])
-                labels[3].config(text=p['pid'])
+                text_vars[1].set(p['cpu'])
+                self.set_fg(labels[1], cpu_color)
+                text_vars[2].set(p['mem'])
+                text_vars[3].set(p['pid'])
             else:
-                for lbl in labels:
-                    lbl.config(text="--", fg=self.colors["text_dim"])
+                for lbl, var in zip(labels, text_vars):
+                    var.set("--")
+                    self.set_fg(lbl, self.colors["text_dim"])
     
-    def update_system_status(self):
-        stats = self.get_system_stats()
+    def update_system_status(self, stats):
         for key, val in stats.items():
             if key in self.status_values:
-                self.status_values[key].config(text=val)
+                self.status_values[key].set(val)
+    
+    def set_fg(self, label, color):
+        """Recolour a label only when its colour bucket actually changes"""
+        if self.label_fg.get(label) != color:
+            label.config(fg=color)
+            self.label_fg[label] = color
     
     def update_time(self):
+        # Called every 250 ms; only touch the Tcl variables when the second ticks over
         now = datetime.now()
-        self.time_label.config(text=now.strftime("%H:%M:%S"))
-        self.date_label.config(text=now.strftime("%A, %B %d, %Y"))
+        clock = now.strftime("%H:%M:%S")
+        if clock == self.shown_time:
+            return
+        self.shown_time = clock
+        self.time_var.set(clock)
+        
+        date = now.strftime("%A, %B %d, %Y")
+        if date != self.shown_date:
+            self.shown_date = date
+            self.date_var.set(date)
     
     def blink_cycle(self):
         current = self.status_dot.cget("fg")
@@ -1253,19 +1680,27 @@ class SystemCommandCenter:
         self.root.after(800, self.blink_cycle)
     
     def update_all(self):
+        """Render pass: only touches widgets, all sampling happens in collect_loop"""
         try:
             self.update_time()
-            self.update_gpu()
-            self.update_cpu()
-            self.update_memory()
-            self.update_storage()
-            self.update_network()
-            self.update_processes()
-            self.update_system_status()
+            
+            try:
+                metrics = self.metrics_queue.get_nowait()
+            except queue.Empty:
+                metrics = None
+            
+            if metrics is not None:
+                self.update_gpu(metrics['gpu_temps'], metrics['gpu_freq'])
+                self.update_cpu(metrics['cpu_usage'], metrics['cpu_temp'], metrics['cpu_freq'])
+                self.update_memory(metrics['memory'])
+                self.update_storage(metrics['storage'])
+                self.update_network(*metrics['network'])
+                self.update_processes(metrics['processes'])
+                self.update_system_status(metrics['system'])
         except Exception as e:
             print(f"Update error: {e}")
         
-        self.root.after(1000, self.update_all)
+        self.root.after(250, self.update_all)
 
 
 def main():
@@ -1280,6 +1715,11 @@ def main():
     root = tk.Tk()
     app = SystemCommandCenter(root)
     root.mainloop()
+    
+    # The pool's exit hook joins its workers, and a read blocked in the kernel
+    # never returns, so don't wait for it once the window is gone
+    if app.sensors_stuck():
+        os._exit(0)
 
 
 if __name__ == "__main__":
@@ -19,14 +19,37 @@ NOTE: Run with sudo for full functionality:
 import tkinter as tk
 from tkinter import ttk
 import subprocess
+import socket
 import struct
 import re
 import os
+import heapq
 import time
+import queue
 import threading
 from pathlib import Path
+from collections import deque
 from datetime import datetime, timedelta
 
+# hwmon driver names for the CPU package sensor and the GPU (fans)
+HWMON_CPU_DRIVERS = ("k10temp", "zenpower")
+HWMON_GPU_DRIVERS = ("xe", "i915")
+
+# Units for format_bytes/format_speed, each 1024 times the one before
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+SPEED_UNITS = ('B/s', 'KB/s', 'MB/s', 'GB/s', 'TB/s')
+
+# Collector pacing: back off once QUIET_TICKS snapshots in a row show no
+# visible change, and return to COLLECT_INTERVAL as soon as something moves
+COLLECT_INTERVAL = 1.0
+QUIET_INTERVAL = 2.5
+QUIET_TICKS = 5
+QUIET_CPU_STEP = 2  # CPU % buckets; moving within one still counts as quiet
+QUIET_IO_BYTES = 64 * 1024  # disk or network bytes/s that counts as activity
+
+# Samples kept for each graph (one per update, so 60 s)
+HISTORY_LEN = 60
+
 
 class SystemCommandCenter:
     def __init__(self, root):
@@ -63,12 +86,20 @@ class SystemCommandCenter:
         }
         
         # Data storage
-        self.cpu_history = [0] * 60
-        self.gpu_temp_history = [0] * 60
-        self.net_rx_history = [0] * 60
-        self.net_tx_history = [0] * 60
-        self.disk_read_history = [0] * 60
-        self.disk_write_history = [0] * 60
+        self.cpu_history = deque([0] * HISTORY_LEN, maxlen=HISTORY_LEN)
+        self.gpu_temp_history = deque([0] * HISTORY_LEN, maxlen=HISTORY_LEN)
+        self.net_rx_history = deque([0] * HISTORY_LEN, maxlen=HISTORY_LEN)
+        self.net_tx_history = deque([0] * HISTORY_LEN, maxlen=HISTORY_LEN)
+        self.disk_read_history = deque([0] * HISTORY_LEN, maxlen=HISTORY_LEN)
+        self.disk_write_history = deque([0] * HISTORY_LEN, maxlen=HISTORY_LEN)
+        
+        # Running maxima of the I/O histories for graph scaling, see push_peak()
+        self.net_samples = 0
+        self.net_rx_peaks = deque()
+        self.net_tx_peaks = deque()
+        self.disk_samples = 0
+        self.disk_read_peaks = deque()
+        self.disk_write_peaks = deque()
         
         self.last_net_rx = 0
         self.last_net_tx = 0
@@ -80,18 +111,52 @@ class SystemCommandCenter:
         
         self.start_time = datetime.now()
         
-        # Get CPU core count
-        try:
-            self.num_cores = int(subprocess.getoutput("nproc"))
-        except:
-            self.num_cores = 8
+        # CPU topology is fixed while we run; nproc's count is the affinity mask
+        self.num_cores = len(os.sched_getaffinity(0))
+        self.cpu_info = self.get_cpu_info()
         
         self.last_core_stats = {}
+        self.graph_buffers = {}  # (width, points) -> coordinate buffer, see graph_coords()
+        self.widget_sizes = {}  # widget -> (width, height), kept current by <Configure>
+        self.widget_state = {}  # widget -> options last applied by set_widget()
+        self.panel_inputs = {}  # panel -> inputs it last rendered, see unchanged()
+        
+        # Per-process CPU deltas for the top processes panel
+        self.clk_tck = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.mem_total = self.get_mem_total()
+        self.last_proc_jiffies = {}
+        self.last_proc_time = time.monotonic()
+        self.proc_counts = (0, 0)  # (processes, threads) from the last /proc scan
+        
+        # /proc files re-read every tick stay open; pread from offset 0 regenerates them
+        self.read_buf = bytearray(16384)
+        self.stat_fd = os.open("/proc/stat", os.O_RDONLY)
+        self.meminfo_fd = os.open("/proc/meminfo", os.O_RDONLY)
+        self.uptime_fd = os.open("/proc/uptime", os.O_RDONLY)
+        self.loadavg_fd = os.open("/proc/loadavg", os.O_RDONLY)
+        
+        # Sensor files are found once and stay open; see probe_hwmon()
+        self.cpu_temp_fd, self.nvme_temp_fd, self.gpu_fan_fds = self.probe_hwmon()
+        self.cpu_freq_fds = [fd for fd in (
+            self.open_fd(f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_cur_freq")
+            for cpu in sorted(os.sched_getaffinity(0))
+        ) if fd is not None]
         
         # Check if running as root (needed for GPU temps)
         self.has_root = os.geteuid() == 0
         
+        # Sampling runs on a collector thread; the Tk loop only renders snapshots
+        self.metrics_queue = queue.Queue(maxsize=1)
+        self.quiet_ticks = 0
+        self.last_signature = None
+        
+        # Status dot starts lit; blink_colors[lit] is its next colour
+        self.status_dot_lit = True
+        self.blink_colors = (self.colors["bg_panel"], self.colors["nominal"])
+        
         self.setup_ui()
+        self.start_collector()
         self.update_all()
         self.blink_cycle()
     
@@ -228,8 +293,8 @@ class SystemCommandCenter:
         center = tk.Frame(header, bg=self.colors["bg_panel"])
         center.pack(side="right", fill="y", padx=30)
         
-        hostname = subprocess.getoutput("hostname").strip()
-        kernel = subprocess.getoutput("uname -r").strip()
+        hostname = socket.gethostname()
+        kernel = os.uname().release
         
         self.hostname_label = tk.Label(
             center,
@@ -249,6 +314,17 @@ class SystemCommandCenter:
         )
         self.kernel_label.pack()
     
+    def track_size(self, widget, on_resize=None):
+        """Cache a widget's size from <Configure> so updates never query Tk for it"""
+        self.widget_sizes[widget] = (0, 0)
+        
+        def on_configure(event):
+            self.widget_sizes[widget] = (event.width, event.height)
+            if on_resize is not None:
+                on_resize(widget, event.width, event.height)
+        
+        widget.bind("<Configure>", on_configure)
+    
     def create_panel(self, parent, title, height=None, expand=False):
         """Create a styled panel with title"""
         container = tk.Frame(parent, bg=self.colors["bg_dark"])
@@ -382,6 +458,7 @@ class SystemCommandCenter:
         
         self.gpu_temp_canvas = tk.Canvas(content, bg=self.colors["bg_card"], height=50, highlightthickness=0)
         self.gpu_temp_canvas.pack(fill="x")
+        self.track_size(self.gpu_temp_canvas, self.draw_grid)
     
     def create_cpu_panel(self, parent):
         """CPU monitoring panel"""
@@ -440,13 +517,14 @@ class SystemCommandCenter:
                 fg=self.colors["text_normal"], bg=self.colors["bg_panel"])
         self.cpu_freq_label.pack(side="left")
         
-        self.cpu_cores_label = tk.Label(info_row, text="0 cores / 0 threads", font=("Monospace", 9),
+        self.cpu_cores_label = tk.Label(info_row, text=f"{self.cpu_info[0]} cores / {self.cpu_info[1]} threads", font=("Monospace", 9),
                 fg=self.colors["text_dim"], bg=self.colors["bg_panel"])
         self.cpu_cores_label.pack(side="right")
         
         # CPU Graph
         self.cpu_canvas = tk.Canvas(content, bg=self.colors["bg_card"], height=45, highlightthickness=0)
         self.cpu_canvas.pack(fill="x", pady=(5, 0))
+        self.track_size(self.cpu_canvas, self.draw_grid)
     
     def create_cpu_cores_panel(self, parent):
         """Per-core CPU utilization"""
@@ -479,6 +557,7 @@ class SystemCommandCenter:
             bar_frame = tk.Frame(core_frame, bg=self.colors["bg_card"], height=16)
             bar_frame.pack(side="left", fill="x", expand=True, padx=(3, 3))
             bar_frame.pack_propagate(False)
+            self.track_size(bar_frame)
             
             bar = tk.Frame(bar_frame, bg=self.colors["accent_green"], width=0)
             bar.pack(side="left", fill="y")
@@ -512,6 +591,7 @@ class SystemCommandCenter:
         self.ram_bar_frame = tk.Frame(ram_frame, bg=self.colors["bg_card"], height=18)
         self.ram_bar_frame.pack(fill="x", pady=(4, 0))
         self.ram_bar_frame.pack_propagate(False)
+        self.track_size(self.ram_bar_frame)
         
         self.ram_bar = tk.Frame(self.ram_bar_frame, bg=self.colors["accent_purple"], width=0)
         self.ram_bar.pack(side="left", fill="y")
@@ -537,6 +617,7 @@ class SystemCommandCenter:
         self.swap_bar_frame = tk.Frame(swap_frame, bg=self.colors["bg_card"], height=12)
         self.swap_bar_frame.pack(fill="x", pady=(4, 0))
         self.swap_bar_frame.pack_propagate(False)
+        self.track_size(self.swap_bar_frame)
         
         self.swap_bar = tk.Frame(self.swap_bar_frame, bg=self.colors["accent_yellow"], width=0)
         self.swap_bar.pack(side="left", fill="y")
@@ -551,6 +632,34 @@ class SystemCommandCenter:
         
         self.storage_frame = tk.Frame(content, bg=self.colors["bg_panel"])
         self.storage_frame.pack(fill="both", expand=True)
+        
+        # Fixed pool of rows, reconfigured each update; unused ones are unpacked
+        self.storage_rows = []
+        for _ in range(4):
+            row = tk.Frame(self.storage_frame, bg=self.colors["bg_panel"])
+            
+            mount = tk.Label(row, text="", font=("Monospace", 9), fg=self.colors["text_normal"],
+                    bg=self.colors["bg_panel"], width=15, anchor="w")
+            mount.pack(side="left")
+            
+            percent = tk.Label(row, text="", font=("Monospace", 9, "bold"),
+                    bg=self.colors["bg_panel"], width=5)
+            percent.pack(side="right")
+            
+            size = tk.Label(row, text="", font=("Monospace", 8), fg=self.colors["text_dim"],
+                    bg=self.colors["bg_panel"])
+            size.pack(side="right", padx=5)
+            
+            bar_frame = tk.Frame(row, bg=self.colors["bg_card"], height=10, width=60)
+            bar_frame.pack(side="right", padx=3)
+            bar_frame.pack_propagate(False)
+            bar = tk.Frame(bar_frame, width=0)
+            bar.pack(side="left", fill="y")
+            
+            self.storage_rows.append({
+                'frame': row, 'mount': mount, 'percent': percent, 'size': size,
+                'bar_frame': bar_frame, 'bar': bar, 'visible': False
+            })
     
     def create_system_status_panel(self, parent):
         """System status overview"""
@@ -613,6 +722,7 @@ class SystemCommandCenter:
         # Graph
         self.disk_canvas = tk.Canvas(content, bg=self.colors["bg_card"], height=40, highlightthickness=0)
         self.disk_canvas.pack(fill="x", pady=(8, 0))
+        self.track_size(self.disk_canvas, self.draw_grid)
     
     def create_network_panel(self, parent):
         """Network panel"""
@@ -646,6 +756,7 @@ class SystemCommandCenter:
         # Graph
         self.net_canvas = tk.Canvas(content, bg=self.colors["bg_card"], height=40, highlightthickness=0)
         self.net_canvas.pack(fill="x", pady=(8, 0))
+        self.track_size(self.net_canvas, self.draw_grid)
     
     def create_processes_panel(self, parent):
         """Top processes panel"""
@@ -720,36 +831,66 @@ class SystemCommandCenter:
     
     def get_gpu_fans(self):
         """Get GPU fan speeds"""
-        try:
-            fans = []
-            for i in range(1, 4):
-                try:
-                    rpm = int(Path(f"/sys/class/hwmon/hwmon3/fan{i}_input").read_text().strip())
-                    fans.append(rpm)
-                except:
-                    pass
-            return max(fans) if fans else 0
-        except:
-            return 0
+        rpms = [rpm for rpm in map(self.read_sensor, self.gpu_fan_fds) if rpm is not None]
+        return max(rpms) if rpms else 0
     
     def get_cpu_temp(self):
         """Get CPU temp from k10temp"""
-        try:
-            return int(Path("/sys/class/hwmon/hwmon2/temp1_input").read_text().strip()) / 1000
-        except:
-            return None
+        millideg = self.read_sensor(self.cpu_temp_fd)
+        return millideg / 1000 if millideg is not None else None
     
     def get_nvme_temp(self):
         """Get NVMe temperature"""
+        millideg = self.read_sensor(self.nvme_temp_fd)
+        return millideg / 1000 if millideg is not None else None
+    
+    def probe_hwmon(self):
+        """Open the CPU, NVMe and GPU fan sensors once, found by hwmon driver name.
+        
+        hwmonN numbering follows driver probe order and can change between
+        boots, so match on each device's name file instead.
+        """
+        cpu_fd = nvme_fd = None
+        fan_fds = []
         try:
-            return int(Path("/sys/class/hwmon/hwmon1/temp1_input").read_text().strip()) / 1000
-        except:
+            entries = sorted(os.scandir("/sys/class/hwmon"), key=lambda e: e.name)
+        except OSError:
+            return None, None, []
+        for entry in entries:
+            try:
+                with open(f"{entry.path}/name") as f:
+                    name = f.read().strip()
+            except OSError:
+                continue
+            if cpu_fd is None and name in HWMON_CPU_DRIVERS:
+                cpu_fd = self.open_fd(f"{entry.path}/temp1_input")
+            elif nvme_fd is None and name == "nvme":
+                nvme_fd = self.open_fd(f"{entry.path}/temp1_input")
+            elif not fan_fds and name in HWMON_GPU_DRIVERS:
+                fan_fds = [fd for fd in (self.open_fd(f"{entry.path}/fan{i}_input") for i in range(1, 4))
+                           if fd is not None]
+        return cpu_fd, nvme_fd, fan_fds
+    
+    def open_fd(self, path):
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+    
+    def read_sensor(self, fd):
+        """Integer value of an open sysfs sensor file, or None"""
+        if fd is None:
+            return None
+        try:
+            return int(os.pread(fd, 32, 0))
+        except (OSError, ValueError):
             return None
     
     def get_cpu_usage(self):
         """Get total CPU usage"""
         try:
-            parts = Path("/proc/stat").read_text().split('\n')[0].split()
+            # Aggregate "cpu" line is always first
+            parts = self.read_fd(self.stat_fd).split(b'\n', 1)[0].split()
             idle = int(parts[4])
             total = sum(int(p) for p in parts[1:])
             
@@ -769,7 +910,7 @@ class SystemCommandCenter:
     def get_per_core_usage(self):
         """Get per-core CPU usage"""
         try:
-            lines = Path("/proc/stat").read_text().split('\n')
+            lines = self.read_fd(self.stat_fd).split(b'\n', self.num_cores + 1)
             usages = []
             
             for i in range(self.num_cores):
@@ -795,6 +936,9 @@ class SystemCommandCenter:
     
     def get_cpu_freq(self):
         """Get average CPU frequency"""
+        if self.cpu_freq_fds:
+            khz = [f for f in map(self.read_sensor, self.cpu_freq_fds) if f is not None]
+            return sum(khz) // len(khz) // 1000 if khz else 0
         try:
             freqs = []
             for line in Path("/proc/cpuinfo").read_text().split('\n'):
@@ -807,29 +951,45 @@ class SystemCommandCenter:
             return 0
     
     def get_cpu_info(self):
-        """Get CPU core/thread count"""
+        """Physical cores and logical CPUs; static, so only called once from __init__"""
         try:
-            threads = int(subprocess.getoutput("grep -c 'processor' /proc/cpuinfo"))
-            physical = subprocess.getoutput("grep 'cpu cores' /proc/cpuinfo | head -1")
-            match = re.search(r'(\d+)', physical)
-            cores = int(match.group(1)) if match else threads // 2
+            with open("/proc/cpuinfo", "rb") as f:
+                cpuinfo = f.read()
+            threads = cpuinfo.count(b"processor\t")
+            cores = threads // 2
+            for line in cpuinfo.split(b'\n'):
+                if line.startswith(b'cpu cores'):
+                    cores = int(line.partition(b':')[2])
+                    break
             return cores, threads
-        except:
+        except (OSError, ValueError):
             return 0, 0
     
+    def meminfo_field(self, buf, key):
+        """Bytes value of one "Key:   1234 kB" line, found without splitting the rest"""
+        start = buf.find(key)
+        if start < 0:
+            raise ValueError(f"{key!r} missing from /proc/meminfo")
+        start += len(key)
+        return int(buf[start:buf.find(b' kB', start)]) * 1024
+    
     def get_memory_info(self):
         """Get RAM and swap usage"""
         try:
-            lines = subprocess.getoutput("free -b").split('\n')
-            mem = lines[1].split()
-            swap = lines[2].split()
+            buf = self.read_fd(self.meminfo_fd)
+            
+            # Same "used" as free(1): everything the kernel can't hand back
+            mem_total = self.meminfo_field(buf, b'MemTotal:')
+            mem_used = mem_total - self.meminfo_field(buf, b'MemAvailable:')
+            swap_total = self.meminfo_field(buf, b'SwapTotal:')
+            swap_used = swap_total - self.meminfo_field(buf, b'SwapFree:')
             return {
-                'mem_total': int(mem[1]), 'mem_used': int(mem[2]),
-                'mem_percent': int(mem[2]) / int(mem[1]) * 100 if int(mem[1]) > 0 else 0,
-                'swap_total': int(swap[1]), 'swap_used': int(swap[2]),
-                'swap_percent': int(swap[2]) / int(swap[1]) * 100 if int(swap[1]) > 0 else 0
+                'mem_total': mem_total, 'mem_used': mem_used,
+                'mem_percent': mem_used / mem_total * 100 if mem_total > 0 else 0,
+                'swap_total': swap_total, 'swap_used': swap_used,
+                'swap_percent': swap_used / swap_total * 100 if swap_total > 0 else 0
             }
-        except:
+        except (OSError, ValueError):
             return None
     
     def get_storage_info(self):
@@ -925,61 +1085,105 @@ class SystemCommandCenter:
         except:
             return "N/A"
     
-    def get_top_processes(self):
-        """Get top processes by CPU"""
+    def get_top_processes(self, n=10):
+        """Top n processes by CPU since the last call, read straight from /proc"""
         try:
-            output = subprocess.getoutput("ps aux --sort=-%cpu | head -11 | tail -10")
+            now = time.monotonic()
+            elapsed = now - self.last_proc_time
+            jiffies = {}
             procs = []
-            for line in output.strip().split('\n'):
-                parts = line.split(None, 10)
-                if len(parts) >= 11:
-                    name = parts[10].split()[0].split('/')[-1][:22]
-                    procs.append({'name': name, 'cpu': parts[2], 'mem': parts[3], 'pid': parts[1]})
-            return procs
-        except:
+            threads = 0
+            
+            with os.scandir("/proc") as it:
+                for entry in it:
+                    if not entry.name.isdigit():
+                        continue
+                    try:
+                        with open(f"/proc/{entry.name}/stat", "rb") as f:
+                            stat = f.read()
+                    except OSError:
+                        continue  # exited while we were scanning
+                    
+                    # comm can contain spaces and parens, so split after the last ')'
+                    # Only fields up to rss are needed, so stop splitting there
+                    head, _, tail = stat.rpartition(b')')
+                    fields = tail.split(None, 22)
+                    pid = int(entry.name)
+                    total = int(fields[11]) + int(fields[12])  # utime + stime
+                    jiffies[pid] = total
+                    threads += int(fields[17])  # num_threads
+                    
+                    prev = self.last_proc_jiffies.get(pid)
+                    if prev is not None and elapsed > 0:
+                        cpu = (total - prev) / self.clk_tck / elapsed * 100
+                    else:
+                        cpu = 0
+                    rss = int(fields[21]) * self.page_size
+                    procs.append((cpu, rss, pid, head))
+            
+            self.last_proc_jiffies = jiffies
+            self.last_proc_time = now
+            # Reused by get_system_stats so it doesn't walk /proc again
+            self.proc_counts = (len(procs), threads)
+            
+            top = []
+            for cpu, rss, pid, head in heapq.nlargest(n, procs):
+                # comm is only cut out of "pid (comm" for the rows we show
+                comm = head[head.find(b'(') + 1:]
+                top.append({
+                    'name': comm.decode(errors="replace")[:22],
+                    'cpu': f"{cpu:.1f}",
+                    'mem': f"{rss * 100 / self.mem_total:.1f}" if self.mem_total else "0.0",
+                    'pid': str(pid)
+                })
+            return top
+        except (OSError, ValueError, IndexError):
             return []
     
+    def get_mem_total(self):
+        """MemTotal in bytes; fixed for the life of the process"""
+        try:
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    if line.startswith("MemTotal:"):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError):
+            pass
+        return 0
+    
+    def read_fd(self, fd):
+        """Re-read an open /proc file into the shared buffer (collector thread only)"""
+        n = os.preadv(fd, [self.read_buf], 0)
+        return self.read_buf[:n]
+    
     def get_system_stats(self):
         """Get system stats"""
         try:
             # Uptime
-            uptime_sec = float(Path("/proc/uptime").read_text().split()[0])
-            days = int(uptime_sec // 86400)
-            hours = int((uptime_sec % 86400) // 3600)
-            mins = int((uptime_sec % 3600) // 60)
+            uptime_sec = float(self.read_fd(self.uptime_fd).split()[0])
+            days, rem = divmod(int(uptime_sec), 86400)
+            hours, rem = divmod(rem, 3600)
+            mins = rem // 60
             uptime = f"{days}d{hours}h" if days > 0 else f"{hours}h{mins}m"
             
-            # Processes/threads
-            procs = 0
-            threads = 0
-            for p in Path("/proc").iterdir():
-                if p.name.isdigit():
-                    procs += 1
-                    try:
-                        threads += len(list((p / "task").iterdir()))
-                    except:
-                        pass
+            load = self.read_fd(self.loadavg_fd).split()[0].decode()
             
-            load = Path("/proc/loadavg").read_text().split()[0]
+            # Counted during this tick's top-processes scan
+            procs, threads = self.proc_counts
             wifi = self.get_wifi_signal()
             
             return {'uptime': uptime, 'procs': str(procs), 'threads': str(threads), 'load': load, 'wifi': wifi}
-        except:
+        except (OSError, ValueError, IndexError):
             return {'uptime': '--', 'procs': '--', 'threads': '--', 'load': '--', 'wifi': '--'}
     
     def format_bytes(self, b):
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if b < 1024:
-                return f"{b:.1f} {unit}"
-            b /= 1024
-        return f"{b:.1f} PB"
+        # Each unit is 2**10 of the last, so the bit length picks it directly
+        i = min(max(int(b).bit_length() - 1, 0) // 10, len(BYTE_UNITS) - 1)
+        return f"{b / (1 << (10 * i)):.1f} {BYTE_UNITS[i]}"
     
     def format_speed(self, bps):
-        for unit in ['B/s', 'KB/s', 'MB/s', 'GB/s']:
-            if bps < 1024:
-                return f"{bps:.1f} {unit}"
-            bps /= 1024
-        return f"{bps:.1f} TB/s"
+        i = min(max(int(bps).bit_length() - 1, 0) // 10, len(SPEED_UNITS) - 1)
+        return f"{bps / (1 << (10 * i)):.1f} {SPEED_UNITS[i]}"
     
     def get_temp_color_status(self, temp, thresholds=(55, 75)):
         if temp is None:
@@ -994,102 +1198,161 @@ class SystemCommandCenter:
     
     # ==================== DRAWING ====================
     
+    def draw_grid(self, canvas, w, h):
+        """Background grid for a graph canvas; redrawn only when it's resized"""
+        canvas.delete("grid")
+        for i in range(1, 4):
+            y = h * i / 4
+            canvas.create_line(0, y, w, y, fill=self.colors["grid_line"], dash=(2, 4), tags="grid")
+        canvas.tag_lower("grid")
+    
+    def graph_coords(self, data, w, h, max_val):
+        """Flat x0, y0, x1, y1, ... polyline for data.
+        
+        Returns a buffer shared per (width, length) whose x slots are filled
+        once; only the y slots are rewritten, so use it before the next call.
+        """
+        n = len(data)
+        coords = self.graph_buffers.get((w, n))
+        if coords is None:
+            coords = self.graph_buffers[(w, n)] = [0.0] * (2 * n)
+            coords[0::2] = [w * i / (n - 1) for i in range(n)]
+        scale = h / max_val
+        coords[1::2] = [h - (v if v < max_val else max_val) * scale for v in data]
+        return coords
+    
     def draw_graph(self, canvas, data, color, max_val=100):
-        canvas.delete("all")
-        w = canvas.winfo_width()
-        h = canvas.winfo_height()
+        canvas.delete("data")
+        w, h = self.widget_sizes[canvas]
         if w <= 1:
             return
         
-        for i in range(1, 4):
-            y = h * i / 4
-            canvas.create_line(0, y, w, y, fill=self.colors["grid_line"], dash=(2, 4))
-        
         if len(data) > 1 and max_val > 0:
-            points = [(w * i / (len(data) - 1), h - h * min(v, max_val) / max_val) for i, v in enumerate(data)]
-            canvas.create_polygon([(0, h)] + points + [(w, h)], fill=color, stipple="gray25", outline="")
-            for i in range(len(points) - 1):
-                canvas.create_line(points[i][0], points[i][1], points[i+1][0], points[i+1][1], fill=color, width=2)
+            coords = self.graph_coords(data, w, h, max_val)
+            canvas.create_polygon(0, h, *coords, w, h, fill=color, stipple="gray25", outline="", tags="data")
+            canvas.create_line(*coords, fill=color, width=2, tags="data")
     
     def draw_dual_graph(self, canvas, data1, color1, data2, color2, max_val=100):
-        canvas.delete("all")
-        w = canvas.winfo_width()
-        h = canvas.winfo_height()
+        canvas.delete("data")
+        w, h = self.widget_sizes[canvas]
         if w <= 1:
             return
         
-        for i in range(1, 4):
-            y = h * i / 4
-            canvas.create_line(0, y, w, y, fill=self.colors["grid_line"], dash=(2, 4))
-        
         for data, color in [(data1, color1), (data2, color2)]:
             if len(data) > 1 and max_val > 0:
-                points = [(w * i / (len(data) - 1), h - h * min(v, max_val) / max_val) for i, v in enumerate(data)]
-                for i in range(len(points) - 1):
-                    canvas.create_line(points[i][0], points[i][1], points[i+1][0], points[i+1][1], fill=color, width=2)
+                canvas.create_line(*self.graph_coords(data, w, h, max_val), fill=color, width=2, tags="data")
+    
+    # ==================== SAMPLING ====================
+    
+    def collect_metrics(self):
+        """Read every source once; runs on the collector thread, never touches Tk"""
+        return {
+            'gpu_temps': self.get_gpu_temps(),
+            'gpu_freq': self.get_gpu_frequency(),
+            'gpu_vram': self.get_gpu_vram(),
+            'gpu_fans': self.get_gpu_fans(),
+            'cpu_usage': self.get_cpu_usage(),
+            'cpu_temp': self.get_cpu_temp(),
+            'nvme_temp': self.get_nvme_temp(),
+            'cpu_freq': self.get_cpu_freq(),
+            'core_usage': self.get_per_core_usage(),
+            'memory': self.get_memory_info(),
+            'storage': self.get_storage_info(),
+            'disk_io': self.get_disk_io(),
+            'network': self.get_network_speed(),
+            # Before 'system': the scan also counts processes and threads for it
+            'processes': self.get_top_processes(),
+            'system': self.get_system_stats(),
+        }
+    
+    def is_quiet(self, metrics):
+        """True if nothing visible moved since the previous snapshot"""
+        signature = (
+            round(metrics['cpu_usage'] / QUIET_CPU_STEP),
+            tuple(p['pid'] for p in metrics['processes']),
+            metrics['gpu_temps'],
+        )
+        idle_io = max(*metrics['network'], *metrics['disk_io']) < QUIET_IO_BYTES
+        quiet = idle_io and signature == self.last_signature
+        self.last_signature = signature
+        return quiet
+    
+    def start_collector(self):
+        thread = threading.Thread(target=self.collect_loop, daemon=True)
+        thread.start()
+    
+    def collect_loop(self):
+        while True:
+            try:
+                metrics = self.collect_metrics()
+            except Exception as e:
+                print(f"Collect error: {e}")
+            else:
+                # Single-slot queue: replace a snapshot the UI hasn't picked up yet
+                try:
+                    self.metrics_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self.metrics_queue.put(metrics)
+                
+                if self.is_quiet(metrics):
+                    self.quiet_ticks += 1
+                else:
+                    self.quiet_ticks = 0
+            time.sleep(QUIET_INTERVAL if self.quiet_ticks >= QUIET_TICKS else COLLECT_INTERVAL)
     
     # ==================== UI UPDATES ====================
     
-    def update_gpu(self):
+    def update_gpu(self, temps, freqs, vram, rpm):
         # Temps
-        t1, t2 = self.get_gpu_temps()
+        t1, t2 = temps
         if t1 is not None:
-            self.gpu_temp1_label.config(text=f"{t1}°C")
             c, s = self.get_temp_color_status(t1, (55, 80))
-            self.gpu_temp1_label.config(fg=c)
-            self.gpu_temp1_status.config(text=s, fg=c)
-            self.gpu_temp_history.pop(0)
+            self.set_widget(self.gpu_temp1_label, text=f"{t1}°C", fg=c)
+            self.set_widget(self.gpu_temp1_status, text=s, fg=c)
             self.gpu_temp_history.append(t1)
         else:
-            self.gpu_temp1_label.config(text="--°C", fg=self.colors["text_dim"])
-            self.gpu_temp1_status.config(text="● NO ACCESS", fg=self.colors["text_dim"])
+            self.set_widget(self.gpu_temp1_label, text="--°C", fg=self.colors["text_dim"])
+            self.set_widget(self.gpu_temp1_status, text="● NO ACCESS", fg=self.colors["text_dim"])
         
         if t2 is not None:
-            self.gpu_temp2_label.config(text=f"{t2}°C")
             c, s = self.get_temp_color_status(t2, (60, 85))
-            self.gpu_temp2_label.config(fg=c)
-            self.gpu_temp2_status.config(text=s, fg=c)
+            self.set_widget(self.gpu_temp2_label, text=f"{t2}°C", fg=c)
+            self.set_widget(self.gpu_temp2_status, text=s, fg=c)
         else:
-            self.gpu_temp2_label.config(text="--°C", fg=self.colors["text_dim"])
-            self.gpu_temp2_status.config(text="● NO ACCESS", fg=self.colors["text_dim"])
+            self.set_widget(self.gpu_temp2_label, text="--°C", fg=self.colors["text_dim"])
+            self.set_widget(self.gpu_temp2_status, text="● NO ACCESS", fg=self.colors["text_dim"])
         
         # Frequency
-        cur, max_f = self.get_gpu_frequency()
+        cur, max_f = freqs
         if cur is not None:
-            self.gpu_freq_label.config(text=f"{cur} MHz")
-            self.gpu_freq_max.config(text=f"MAX: {max_f} MHz")
+            self.set_widget(self.gpu_freq_label, text=f"{cur} MHz")
+            self.set_widget(self.gpu_freq_max, text=f"MAX: {max_f} MHz")
         
         # VRAM
-        used, total = self.get_gpu_vram()
+        used, total = vram
         if used is not None:
             used_gb = used / (1024**3)
             total_gb = total / (1024**3)
             pct = used / total * 100 if total > 0 else 0
-            self.vram_label.config(text=f"{used_gb:.1f} / {total_gb:.0f} GB")
+            self.set_widget(self.vram_label, text=f"{used_gb:.1f} / {total_gb:.0f} GB")
             bar_w = int(150 * pct / 100)
-            self.vram_bar.config(width=max(0, bar_w))
+            self.set_widget(self.vram_bar, width=max(0, bar_w))
         else:
-            self.vram_label.config(text="-- / -- GB")
+            self.set_widget(self.vram_label, text="-- / -- GB")
         
         # Fans
-        rpm = self.get_gpu_fans()
-        self.fan_label.config(text=f"{rpm} RPM")
+        self.set_widget(self.fan_label, text=f"{rpm} RPM")
         if rpm > 0:
-            self.fan_status.config(text="● ACTIVE", fg=self.colors["accent_teal"])
+            self.set_widget(self.fan_status, text="● ACTIVE", fg=self.colors["accent_teal"])
         else:
-            self.fan_status.config(text="● IDLE", fg=self.colors["text_dim"])
+            self.set_widget(self.fan_status, text="● IDLE", fg=self.colors["text_dim"])
         
         # Graph
         self.draw_graph(self.gpu_temp_canvas, self.gpu_temp_history, self.colors["accent_blue"], 100)
     
-    def update_cpu(self):
-        usage = self.get_cpu_usage()
-        temp = self.get_cpu_temp()
-        nvme_temp = self.get_nvme_temp()
-        freq = self.get_cpu_freq()
-        cores, threads = self.get_cpu_info()
+    def update_cpu(self, usage, temp, nvme_temp, freq):
         
-        self.cpu_history.pop(0)
         self.cpu_history.append(usage)
         
         # Usage
@@ -1099,31 +1362,27 @@ class SystemCommandCenter:
             color = self.colors["warning"]
         else:
             color = self.colors["critical"]
-        self.cpu_percent_label.config(text=f"{usage:.0f}%", fg=color)
+        self.set_widget(self.cpu_percent_label, text=f"{usage:.0f}%", fg=color)
         
         # CPU Temp
         if temp is not None:
-            self.cpu_temp_label.config(text=f"{temp:.0f}°C")
             c, s = self.get_temp_color_status(temp, (55, 75))
-            self.cpu_temp_label.config(fg=c)
-            self.cpu_temp_status.config(text=s, fg=c)
+            self.set_widget(self.cpu_temp_label, text=f"{temp:.0f}°C", fg=c)
+            self.set_widget(self.cpu_temp_status, text=s, fg=c)
         
         # NVMe Temp
         if nvme_temp is not None:
-            self.nvme_temp_label.config(text=f"{nvme_temp:.0f}°C")
             c, s = self.get_temp_color_status(nvme_temp, (50, 70))
-            self.nvme_temp_label.config(fg=c)
-            self.nvme_status.config(text=s, fg=c)
+            self.set_widget(self.nvme_temp_label, text=f"{nvme_temp:.0f}°C", fg=c)
+            self.set_widget(self.nvme_status, text=s, fg=c)
         
         # Info
-        self.cpu_freq_label.config(text=f"{freq} MHz")
-        self.cpu_cores_label.config(text=f"{cores} cores / {threads} threads")
+        self.set_widget(self.cpu_freq_label, text=f"{freq} MHz")
         
         # Graph
         self.draw_graph(self.cpu_canvas, self.cpu_history, color)
     
-    def update_cpu_cores(self):
-        usages = self.get_per_core_usage()
+    def update_cpu_cores(self, usages):
         
         for i, usage in enumerate(usages):
             if i < len(self.core_bars):
@@ -1138,91 +1397,108 @@ class SystemCommandCenter:
                     color = self.colors["critical"]
                 
                 # Update bar
-                bar_w = int(bar_frame.winfo_width() * usage / 100)
-                bar.config(width=max(0, bar_w), bg=color)
+                bar_w = int(self.widget_sizes[bar_frame][0] * usage / 100)
+                self.set_widget(bar, width=max(0, bar_w), bg=color)
                 
                 # Update label
-                self.core_labels[i].config(text=f"{usage:.0f}%", fg=color)
+                self.set_widget(self.core_labels[i], text=f"{usage:.0f}%", fg=color)
     
-    def update_memory(self):
-        mem = self.get_memory_info()
+    def update_memory(self, mem):
         if mem:
-            self.ram_percent.config(text=f"{mem['mem_percent']:.1f}%")
-            self.ram_details.config(text=f"{self.format_bytes(mem['mem_used'])} / {self.format_bytes(mem['mem_total'])}")
-            bar_w = int(self.ram_bar_frame.winfo_width() * mem['mem_percent'] / 100)
-            self.ram_bar.config(width=max(0, bar_w))
+            self.set_widget(self.ram_percent, text=f"{mem['mem_percent']:.1f}%")
+            self.set_widget(self.ram_details, text=f"{self.format_bytes(mem['mem_used'])} / {self.format_bytes(mem['mem_total'])}")
+            bar_w = int(self.widget_sizes[self.ram_bar_frame][0] * mem['mem_percent'] / 100)
+            self.set_widget(self.ram_bar, width=max(0, bar_w))
             
-            self.swap_percent.config(text=f"{mem['swap_percent']:.1f}%")
-            self.swap_details.config(text=f"{self.format_bytes(mem['swap_used'])} / {self.format_bytes(mem['swap_total'])}")
-            swap_w = int(self.swap_bar_frame.winfo_width() * mem['swap_percent'] / 100)
-            self.swap_bar.config(width=max(0, swap_w))
+            self.set_widget(self.swap_percent, text=f"{mem['swap_percent']:.1f}%")
+            self.set_widget(self.swap_details, text=f"{self.format_bytes(mem['swap_used'])} / {self.format_bytes(mem['swap_total'])}")
+            swap_w = int(self.widget_sizes[self.swap_bar_frame][0] * mem['swap_percent'] / 100)
+            self.set_widget(self.swap_bar, width=max(0, swap_w))
     
-    def update_storage(self):
-        disks = self.get_storage_info()
-        
-        for w in self.storage_frame.winfo_children():
-            w.destroy()
+    def update_storage(self, disks):
+        if self.unchanged('storage', tuple((d['mount'], d['percent'], d['used'], d['total']) for d in disks[:4])):
+            return
         
-        for disk in disks[:4]:
-            row = tk.Frame(self.storage_frame, bg=self.colors["bg_panel"])
-            row.pack(fill="x", pady=2)
+        for i, row in enumerate(self.storage_rows):
+            if i >= len(disks):
+                # Unused rows are always a suffix, so re-packing later keeps the order
+                if row['visible']:
+                    row['frame'].pack_forget()
+                    row['visible'] = False
+                continue
             
+            disk = disks[i]
             mount = disk['mount'] if len(disk['mount']) <= 15 else disk['mount'][:12] + "..."
-            tk.Label(row, text=mount, font=("Monospace", 9), fg=self.colors["text_normal"],
-                    bg=self.colors["bg_panel"], width=15, anchor="w").pack(side="left")
-            
             pct = disk['percent']
             color = self.colors["accent_green"] if pct < 70 else self.colors["warning"] if pct < 90 else self.colors["critical"]
             
-            tk.Label(row, text=f"{pct}%", font=("Monospace", 9, "bold"), fg=color,
-                    bg=self.colors["bg_panel"], width=5).pack(side="right")
+            self.set_widget(row['mount'], text=mount)
+            self.set_widget(row['percent'], text=f"{pct}%", fg=color)
+            self.set_widget(row['size'], text=f"{self.format_bytes(disk['used'])}/{self.format_bytes(disk['total'])}")
+            self.set_widget(row['bar'], width=int(60 * pct / 100), bg=color)
             
-            tk.Label(row, text=f"{self.format_bytes(disk['used'])}/{self.format_bytes(disk['total'])}",
-                    font=("Monospace", 8), fg=self.colors["text_dim"],
-                    bg=self.colors["bg_panel"]).pack(side="right", padx=5)
-            
-            bar_f = tk.Frame(row, bg=self.colors["bg_card"], height=10, width=60)
-            bar_f.pack(side="right", padx=3)
-            bar_f.pack_propagate(False)
-            tk.Frame(bar_f, bg=color, width=int(60 * pct / 100)).pack(side="left", fill="y")
+            if not row['visible']:
+                row['frame'].pack(fill="x", pady=2)
+                row['visible'] = True
     
-    def update_disk_io(self):
-        read, write = self.get_disk_io()
-        
-        self.disk_read_label.config(text=self.format_speed(read))
-        self.disk_write_label.config(text=self.format_speed(write))
+    def unchanged(self, panel, signature):
+        """True if panel's inputs match last tick's, so its update can be skipped"""
+        if self.panel_inputs.get(panel) == signature:
+            return True
+        self.panel_inputs[panel] = signature
+        return False
+    
+    def set_widget(self, widget, **options):
+        """Configure only the options that changed since the last call, in one Tcl call"""
+        last = self.widget_state.setdefault(widget, {})
+        changed = {key: value for key, value in options.items() if last.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            last.update(changed)
+    
+    def push_peak(self, peaks, seq, value):
+        """Max of the last HISTORY_LEN samples, kept in a monotonic deque of (seq, value)"""
+        while peaks and peaks[-1][1] <= value:
+            peaks.pop()
+        peaks.append((seq, value))
+        if peaks[0][0] <= seq - HISTORY_LEN:
+            peaks.popleft()
+        return peaks[0][1]
+    
+    def update_disk_io(self, read, write):
+        self.set_widget(self.disk_read_label, text=self.format_speed(read))
+        self.set_widget(self.disk_write_label, text=self.format_speed(write))
         
-        self.disk_read_history.pop(0)
         self.disk_read_history.append(read)
-        self.disk_write_history.pop(0)
         self.disk_write_history.append(write)
         
-        max_io = max(max(self.disk_read_history), max(self.disk_write_history), 1024)
+        self.disk_samples += 1
+        max_io = max(self.push_peak(self.disk_read_peaks, self.disk_samples, read),
+                     self.push_peak(self.disk_write_peaks, self.disk_samples, write), 1024)
         self.draw_dual_graph(self.disk_canvas, self.disk_read_history, self.colors["accent_green"],
                             self.disk_write_history, self.colors["accent_orange"], max_io)
     
-    def update_network(self):
-        rx, tx = self.get_network_speed()
-        
-        self.net_dl_label.config(text=self.format_speed(rx))
-        self.net_ul_label.config(text=self.format_speed(tx))
+    def update_network(self, rx, tx):
+        self.set_widget(self.net_dl_label, text=self.format_speed(rx))
+        self.set_widget(self.net_ul_label, text=self.format_speed(tx))
         
-        self.net_rx_history.pop(0)
         self.net_rx_history.append(rx)
-        self.net_tx_history.pop(0)
         self.net_tx_history.append(tx)
         
-        max_net = max(max(self.net_rx_history), max(self.net_tx_history), 1024)
+        self.net_samples += 1
+        max_net = max(self.push_peak(self.net_rx_peaks, self.net_samples, rx),
+                      self.push_peak(self.net_tx_peaks, self.net_samples, tx), 1024)
         self.draw_dual_graph(self.net_canvas, self.net_rx_history, self.colors["accent_green"],
                             self.net_tx_history, self.colors["accent_red"], max_net)
     
-    def update_processes(self):
-        procs = self.get_top_processes()
+    def update_processes(self, procs):
+        if self.unchanged('processes', tuple((p['name'], p['cpu'], p['mem'], p['pid']) for p in procs)):
+            return
         
         for i, labels in enumerate(self.process_labels):
             if i < len(procs):
                 p = procs[i]
-                labels[0].config(text=p['name'], fg=self.colors["text_normal"])
+                self.set_widget(labels[0], text=p['name'], fg=self.colors["text_normal"])
                 
                 try:
                     cpu = float(p['cpu'])
@@ -1230,46 +1506,55 @@ class SystemCommandCenter:
                 except:
                     cpu_color = self.colors["text_dim"]
                 
-                labels[1].config(text=p['cpu'], fg=cpu_color)
-                labels[2].config(text=p['mem'])
-                labels[3].config(text=p['pid'])
+                self.set_widget(labels[1], text=p['cpu'], fg=cpu_color)
+                self.set_widget(labels[2], text=p['mem'])
+                self.set_widget(labels[3], text=p['pid'])
             else:
                 for lbl in labels:
-                    lbl.config(text="--", fg=self.colors["text_dim"])
+                    self.set_widget(lbl, text="--", fg=self.colors["text_dim"])
     
-    def update_system_status(self):
-        stats = self.get_system_stats()
+    def update_system_status(self, stats):
+        if self.unchanged('system', tuple(stats.values())):
+            return
+        
         for key, val in stats.items():
             if key in self.status_values:
-                self.status_values[key].config(text=val)
+                self.set_widget(self.status_values[key], text=val)
     
     def update_time(self):
         now = datetime.now()
-        self.time_label.config(text=now.strftime("%H:%M:%S"))
-        self.date_label.config(text=now.strftime("%A, %B %d, %Y"))
+        self.set_widget(self.time_label, text=now.strftime("%H:%M:%S"))
+        self.set_widget(self.date_label, text=now.strftime("%A, %B %d, %Y"))
     
     def blink_cycle(self):
-        current = self.status_dot.cget("fg")
-        new = self.colors["bg_panel"] if current == self.colors["nominal"] else self.colors["nominal"]
-        self.status_dot.config(fg=new)
+        self.status_dot_lit = not self.status_dot_lit
+        self.status_dot.config(fg=self.blink_colors[self.status_dot_lit])
         self.root.after(800, self.blink_cycle)
     
     def update_all(self):
+        """Render pass: only touches widgets, all sampling happens in collect_loop"""
         try:
             self.update_time()
-            self.update_gpu()
-            self.update_cpu()
-            self.update_cpu_cores()
-            self.update_memory()
-            self.update_storage()
-            self.update_disk_io()
-            self.update_network()
-            self.update_processes()
-            self.update_system_status()
+            
+            try:
+                metrics = self.metrics_queue.get_nowait()
+            except queue.Empty:
+                metrics = None
+            
+            if metrics is not None:
+                self.update_gpu(metrics['gpu_temps'], metrics['gpu_freq'], metrics['gpu_vram'], metrics['gpu_fans'])
+                self.update_cpu(metrics['cpu_usage'], metrics['cpu_temp'], metrics['nvme_temp'], metrics['cpu_freq'])
+                self.update_cpu_cores(metrics['core_usage'])
+                self.update_memory(metrics['memory'])
+                self.update_storage(metrics['storage'])
+                self.update_disk_io(*metrics['disk_io'])
+                self.update_network(*metrics['network'])
+                self.update_processes(metrics['processes'])
+                self.update_system_status(metrics['system'])
         except Exception as e:
             print(f"Update error: {e}")
         
-        self.root.after(1000, self.update_all)
+        self.root.after(250, self.update_all)
 
 
 def main():
@@ -17,16 +17,64 @@ NOTE: Run with sudo for full functionality:
 
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 import subprocess
+import socket
 import struct
 import re
 import os
 import time
 import math
 import threading
+import atexit
+from array import array
 from pathlib import Path
 from datetime import datetime, timedelta
 
+# Intel PMT telemetry: two little-endian u32 temps at 0xa4 (GPU, hotspot)
+PMT_TELEM_PATH = '/sys/class/intel_pmt/telem2/telem'
+PMT_TEMPS_OFFSET = 0xa4
+PMT_TEMPS = struct.Struct('<II')
+
+# Whole NVMe namespaces in /proc/diskstats; partitions would count their I/O twice
+NVME_DISK = re.compile(rb'nvme\d+n\d+')
+
+# Samples kept per graph: one minute at the default poll interval
+HISTORY_LEN = 60
+
+def poll_interval(default=1.0):
+    """SCC_POLL_INTERVAL in seconds; default unless it's finite and at least MIN_POLL_INTERVAL"""
+    try:
+        interval = float(os.environ.get("SCC_POLL_INTERVAL", default))
+    except ValueError:
+        return default
+    return interval if MIN_POLL_INTERVAL <= interval < math.inf else default
+
+
+# Shortest collector period accepted from SCC_POLL_INTERVAL; anything faster just spins
+MIN_POLL_INTERVAL = 0.1
+
+
+# Seconds between samples on the collector thread; the UI repaints on its own timer
+POLL_INTERVAL = poll_interval()
+
+# Interfaces left out of the network totals
+NET_SKIP_IFACES = (b'lo', b'docker0')
+
+# Gradient bar segment colours for normal / >50% / >80%
+BAR_GRADIENTS = (
+    ("#00aa55", "#00ff88", "#44ffaa"),
+    ("#ff8c00", "#ffaa00", "#ffcc00"),
+    ("#ff0040", "#ff4444", "#ff6666"),
+)
+
+# Per-core grid on the cores canvas
+CORE_COLS = 4
+CORE_ROW_H = 24
+CORE_BAR_H = 18
+CORE_LABEL_W = 28
+CORE_PCT_W = 36
+
 
 class SystemCommandCenter:
     def __init__(self, root):
@@ -76,13 +124,17 @@ class SystemCommandCenter:
         self.alert_flash = False
         self.scan_line_pos = 0
         
-        # Data storage
-        self.cpu_history = [0] * 60
-        self.gpu_temp_history = [0] * 60
-        self.net_rx_history = [0] * 60
-        self.net_tx_history = [0] * 60
-        self.disk_read_history = [0] * 60
-        self.disk_write_history = [0] * 60
+        # Data storage: fixed ring buffers, percent/°C in bytes and rates in u64.
+        # history_pos[name] is the slot the next sample overwrites, i.e. the oldest.
+        self.history = {
+            'cpu': array('B', bytes(HISTORY_LEN)),
+            'gpu_temp': array('B', bytes(HISTORY_LEN)),
+            'net_rx': array('Q', [0]) * HISTORY_LEN,
+            'net_tx': array('Q', [0]) * HISTORY_LEN,
+            'disk_read': array('Q', [0]) * HISTORY_LEN,
+            'disk_write': array('Q', [0]) * HISTORY_LEN,
+        }
+        self.history_pos = dict.fromkeys(self.history, 0)
         
         self.last_net_rx = 0
         self.last_net_tx = 0
@@ -92,13 +144,18 @@ class SystemCommandCenter:
         self.last_disk_write = 0
         self.last_disk_time = time.time()
         
-        # CPU cores
-        try:
-            self.num_cores = int(subprocess.getoutput("nproc"))
-        except:
-            self.num_cores = 8
+        # CPU topology is fixed while we run; nproc's count is the affinity mask
+        self.num_cores = len(os.sched_getaffinity(0))
+        # Per-core slots are indexed by CPU number, so a gap (offline CPU) stays at C{n}
+        self.core_slots = max(os.sched_getaffinity(0)) + 1
+        self.cpu_info = self.get_cpu_info()
+        # One kept fd per CPU's cpufreq node (read through read_sensor); empty without cpufreq
+        self.cpu_freq_paths = [path for path in (
+            f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_cur_freq"
+            for cpu in sorted(os.sched_getaffinity(0))
+        ) if os.path.exists(path)]
         
-        self.last_core_stats = {}
+        self.last_core_stats = {}  # CPU number -> (idle, total)
         
         # Root check
         self.has_root = os.geteuid() == 0
@@ -109,10 +166,48 @@ class SystemCommandCenter:
         self.current_cpu_usage = 0
         self.is_critical = False
         
+        self.fonts = {}  # (size, weight) -> tkfont.Font, see font()
+        self.widget_state = {}  # widget -> options last applied by set_widget()
+        
+        # Graph canvases keep persistent items that draw_graph() moves with coords()
+        self.graph_items = {}  # canvas -> item ids
+        self.graph_colors = {}  # canvas -> current trace colour
+        self.graph_sizes = {}  # canvas -> (w, h) its grid was drawn at
+        self.graph_buffers = {}  # (width, samples) -> coords list, see graph_coords()
+        
+        # sysfs path -> fd (None if it couldn't be opened), kept for the life of the process; see sysfs_fd()
+        self.fd_cache = {}
+        self.pmt_buf = bytearray(PMT_TEMPS.size)
+        self.read_buf = bytearray(65536)  # /proc files, see read_proc()
+        atexit.register(self.close_fds)
+        
+        # Sampling runs on a collector thread; the Tk loop only renders snapshots.
+        # The collector replaces this (seq, metrics) tuple in one assignment, so
+        # the UI always sees a whole snapshot without a lock or queue.
+        self.snapshot = (0, None)
+        self.rendered_seq = 0
+        
         self.setup_ui()
+        self.start_collector()
         self.animate()
         self.update_all()
     
+    def set_widget(self, widget, **options):
+        """Configure only the options that changed since the last call, in one Tcl call"""
+        last = self.widget_state.setdefault(widget, {})
+        changed = {key: value for key, value in options.items() if last.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            last.update(changed)
+    
+    def font(self, size, weight="normal"):
+        """Shared named Monospace font, so Tk resolves each size/weight only once"""
+        key = (size, weight)
+        named = self.fonts.get(key)
+        if named is None:
+            named = self.fonts[key] = tkfont.Font(family="Monospace", size=size, weight=weight)
+        return named
+    
     def toggle_fullscreen(self, event=None):
         self.is_fullscreen = not self.is_fullscreen
         self.root.attributes("-fullscreen", self.is_fullscreen)
@@ -183,7 +278,7 @@ class SystemCommandCenter:
         title = tk.Label(
             title_frame,
             text="◆ SYSTEM COMMAND CENTER",
-            font=("Monospace", 20, "bold"),
+            font=self.font(20, "bold"),
             fg=self.colors["accent_cyan"],
             bg=self.colors["bg_panel"]
         )
@@ -192,7 +287,7 @@ class SystemCommandCenter:
         subtitle = tk.Label(
             title_frame,
             text="INTEL ARC B580 + AMD RYZEN 7 • FULL TELEMETRY • F11 FULLSCREEN",
-            font=("Monospace", 9),
+            font=self.font(9),
             fg=self.colors["text_dim"],
             bg=self.colors["bg_panel"]
         )
@@ -203,20 +298,20 @@ class SystemCommandCenter:
         status_frame.pack(side="left", padx=(30, 0), pady=15)
         
         self.status_dot = tk.Label(
-            status_frame, text="●", font=("Monospace", 16),
+            status_frame, text="●", font=self.font(16),
             fg=self.colors["nominal"], bg=self.colors["bg_panel"]
         )
         self.status_dot.pack(side="left")
         
         self.status_text = tk.Label(
-            status_frame, text="ALL SYSTEMS NOMINAL", font=("Monospace", 11, "bold"),
+            status_frame, text="ALL SYSTEMS NOMINAL", font=self.font(11, "bold"),
             fg=self.colors["nominal"], bg=self.colors["bg_panel"]
         )
         self.status_text.pack(side="left", padx=(8, 0))
         
         if not self.has_root:
             tk.Label(
-                status_frame, text="  ⚠ sudo required for GPU temps", font=("Monospace", 9),
+                status_frame, text="  ⚠ sudo required for GPU temps", font=self.font(9),
                 fg=self.colors["warning"], bg=self.colors["bg_panel"]
             ).pack(side="left", padx=(15, 0))
         
@@ -228,13 +323,13 @@ class SystemCommandCenter:
         time_frame.pack(side="right", pady=10)
         
         self.time_label = tk.Label(
-            time_frame, text="00:00:00", font=("Monospace", 28, "bold"),
+            time_frame, text="00:00:00", font=self.font(28, "bold"),
             fg=self.colors["text_bright"], bg=self.colors["bg_panel"]
         )
         self.time_label.pack(anchor="e")
         
         self.date_label = tk.Label(
-            time_frame, text="", font=("Monospace", 10),
+            time_frame, text="", font=self.font(10),
             fg=self.colors["text_dim"], bg=self.colors["bg_panel"]
         )
         self.date_label.pack(anchor="e")
@@ -243,17 +338,17 @@ class SystemCommandCenter:
         center = tk.Frame(header, bg=self.colors["bg_panel"])
         center.pack(side="right", fill="y", padx=30)
         
-        hostname = subprocess.getoutput("hostname").strip()
-        kernel = subprocess.getoutput("uname -r").strip()
+        hostname = socket.gethostname()
+        kernel = os.uname().release
         
         self.hostname_label = tk.Label(
-            center, text=f"◈ {hostname.upper()}", font=("Monospace", 13, "bold"),
+            center, text=f"◈ {hostname.upper()}", font=self.font(13, "bold"),
             fg=self.colors["accent_orange"], bg=self.colors["bg_panel"]
         )
         self.hostname_label.pack(pady=(18, 0))
         
         tk.Label(
-            center, text=f"KERNEL {kernel}", font=("Monospace", 9),
+            center, text=f"KERNEL {kernel}", font=self.font(9),
             fg=self.colors["text_dim"], bg=self.colors["bg_panel"]
         ).pack()
     
@@ -277,7 +372,7 @@ class SystemCommandCenter:
         
         # Draw gradient on title
         title_bar.create_text(
-            12, 15, text=f"▸ {title}", font=("Monospace", 10, "bold"),
+            12, 15, text=f"▸ {title}", font=self.font(10, "bold"),
             fill=self.colors["accent_cyan"], anchor="w"
         )
         
@@ -301,7 +396,7 @@ class SystemCommandCenter:
         
         # Label
         lbl = tk.Label(
-            frame, text=label, font=("Monospace", 8),
+            frame, text=label, font=self.font(8),
             fg=self.colors["text_dim"], bg=self.colors["bg_panel"]
         )
         lbl.pack()
@@ -370,13 +465,13 @@ class SystemCommandCenter:
         # Value text
         canvas.create_text(
             cx, cy - 5, text=f"{value:.0f}",
-            font=("Monospace", 18, "bold"), fill=color
+            font=self.font(18, "bold"), fill=color
         )
         
         # Unit text
         canvas.create_text(
             cx, cy + 18, text=label,
-            font=("Monospace", 8), fill=self.colors["text_dim"]
+            font=self.font(8), fill=self.colors["text_dim"]
         )
     
     def create_gpu_panel(self, parent):
@@ -390,7 +485,7 @@ class SystemCommandCenter:
         gauge_frame1 = tk.Frame(gauges_row, bg=self.colors["bg_panel"])
         gauge_frame1.pack(side="left", expand=True)
         
-        tk.Label(gauge_frame1, text="GPU TEMP", font=("Monospace", 8),
+        tk.Label(gauge_frame1, text="GPU TEMP", font=self.font(8),
                 fg=self.colors["accent_blue"], bg=self.colors["bg_panel"]).pack()
         
         self.gpu_temp_canvas = tk.Canvas(
@@ -399,7 +494,7 @@ class SystemCommandCenter:
         )
         self.gpu_temp_canvas.pack()
         
-        self.gpu_temp_status = tk.Label(gauge_frame1, text="● STANDBY", font=("Monospace", 8),
+        self.gpu_temp_status = tk.Label(gauge_frame1, text="● STANDBY", font=self.font(8),
                 fg=self.colors["text_dim"], bg=self.colors["bg_panel"])
         self.gpu_temp_status.pack()
         
@@ -407,7 +502,7 @@ class SystemCommandCenter:
         gauge_frame2 = tk.Frame(gauges_row, bg=self.colors["bg_panel"])
         gauge_frame2.pack(side="left", expand=True)
         
-        tk.Label(gauge_frame2, text="HOTSPOT", font=("Monospace", 8),
+        tk.Label(gauge_frame2, text="HOTSPOT", font=self.font(8),
                 fg=self.colors["accent_pink"], bg=self.colors["bg_panel"]).pack()
         
         self.gpu_hotspot_canvas = tk.Canvas(
@@ -416,7 +511,7 @@ class SystemCommandCenter:
         )
         self.gpu_hotspot_canvas.pack()
         
-        self.gpu_hotspot_status = tk.Label(gauge_frame2, text="● STANDBY", font=("Monospace", 8),
+        self.gpu_hotspot_status = tk.Label(gauge_frame2, text="● STANDBY", font=self.font(8),
                 fg=self.colors["text_dim"], bg=self.colors["bg_panel"])
         self.gpu_hotspot_status.pack()
         
@@ -424,14 +519,14 @@ class SystemCommandCenter:
         freq_frame = tk.Frame(gauges_row, bg=self.colors["bg_panel"])
         freq_frame.pack(side="right", expand=True, fill="y")
         
-        tk.Label(freq_frame, text="GPU CLOCK", font=("Monospace", 8),
+        tk.Label(freq_frame, text="GPU CLOCK", font=self.font(8),
                 fg=self.colors["accent_cyan"], bg=self.colors["bg_panel"]).pack(anchor="e")
         
-        self.gpu_freq_label = tk.Label(freq_frame, text="-- MHz", font=("Monospace", 22, "bold"),
+        self.gpu_freq_label = tk.Label(freq_frame, text="-- MHz", font=self.font(22, "bold"),
                 fg=self.colors["accent_cyan"], bg=self.colors["bg_panel"])
         self.gpu_freq_label.pack(anchor="e")
         
-        self.gpu_freq_max = tk.Label(freq_frame, text="MAX: --", font=("Monospace", 8),
+        self.gpu_freq_max = tk.Label(freq_frame, text="MAX: --", font=self.font(8),
                 fg=self.colors["text_dim"], bg=self.colors["bg_panel"])
         self.gpu_freq_max.pack(anchor="e")
         
@@ -443,10 +538,10 @@ class SystemCommandCenter:
         vram_frame = tk.Frame(row2, bg=self.colors["bg_panel"])
         vram_frame.pack(side="left", expand=True, fill="x")
         
-        tk.Label(vram_frame, text="VRAM", font=("Monospace", 8),
+        tk.Label(vram_frame, text="VRAM", font=self.font(8),
                 fg=self.colors["accent_purple"], bg=self.colors["bg_panel"]).pack(anchor="w")
         
-        self.vram_label = tk.Label(vram_frame, text="-- / -- GB", font=("Monospace", 12, "bold"),
+        self.vram_label = tk.Label(vram_frame, text="-- / -- GB", font=self.font(12, "bold"),
                 fg=self.colors["accent_purple"], bg=self.colors["bg_panel"])
         self.vram_label.pack(anchor="w")
         
@@ -457,19 +552,19 @@ class SystemCommandCenter:
         fan_frame = tk.Frame(row2, bg=self.colors["bg_panel"])
         fan_frame.pack(side="right", expand=True, fill="x")
         
-        tk.Label(fan_frame, text="FANS", font=("Monospace", 8),
+        tk.Label(fan_frame, text="FANS", font=self.font(8),
                 fg=self.colors["accent_teal"], bg=self.colors["bg_panel"]).pack(anchor="e")
         
-        self.fan_label = tk.Label(fan_frame, text="0 RPM", font=("Monospace", 12, "bold"),
+        self.fan_label = tk.Label(fan_frame, text="0 RPM", font=self.font(12, "bold"),
                 fg=self.colors["accent_teal"], bg=self.colors["bg_panel"])
         self.fan_label.pack(anchor="e")
         
-        self.fan_status = tk.Label(fan_frame, text="● IDLE", font=("Monospace", 8),
+        self.fan_status = tk.Label(fan_frame, text="● IDLE", font=self.font(8),
                 fg=self.colors["text_dim"], bg=self.colors["bg_panel"])
         self.fan_status.pack(anchor="e")
         
         # Thermal graph
-        tk.Label(content, text="THERMAL HISTORY", font=("Monospace", 8),
+        tk.Label(content, text="THERMAL HISTORY", font=self.font(8),
                 fg=self.colors["text_dim"], bg=self.colors["bg_panel"]).pack(anchor="w", pady=(5, 2))
         
         self.gpu_graph_canvas = tk.Canvas(content, height=45, bg=self.colors["bg_card"], highlightthickness=0)
@@ -486,7 +581,7 @@ class SystemCommandCenter:
         gauge_frame1 = tk.Frame(gauges_row, bg=self.colors["bg_panel"])
         gauge_frame1.pack(side="left", expand=True)
         
-        tk.Label(gauge_frame1, text="UTILIZATION", font=("Monospace", 8),
+        tk.Label(gauge_frame1, text="UTILIZATION", font=self.font(8),
                 fg=self.colors["accent_orange"], bg=self.colors["bg_panel"]).pack()
         
         self.cpu_usage_canvas = tk.Canvas(
@@ -499,7 +594,7 @@ class SystemCommandCenter:
         gauge_frame2 = tk.Frame(gauges_row, bg=self.colors["bg_panel"])
         gauge_frame2.pack(side="left", expand=True)
         
-        tk.Label(gauge_frame2, text="CPU TEMP", font=("Monospace", 8),
+        tk.Label(gauge_frame2, text="CPU TEMP", font=self.font(8),
                 fg=self.colors["accent_orange"], bg=self.colors["bg_panel"]).pack()
         
         self.cpu_temp_canvas = tk.Canvas(
@@ -508,7 +603,7 @@ class SystemCommandCenter:
         )
         self.cpu_temp_canvas.pack()
         
-        self.cpu_temp_status = tk.Label(gauge_frame2, text="● NOMINAL", font=("Monospace", 8),
+        self.cpu_temp_status = tk.Label(gauge_frame2, text="● NOMINAL", font=self.font(8),
                 fg=self.colors["nominal"], bg=self.colors["bg_panel"])
         self.cpu_temp_status.pack()
         
@@ -516,18 +611,18 @@ class SystemCommandCenter:
         info_frame = tk.Frame(gauges_row, bg=self.colors["bg_panel"])
         info_frame.pack(side="right", expand=True, fill="y")
         
-        tk.Label(info_frame, text="NVMe TEMP", font=("Monospace", 8),
+        tk.Label(info_frame, text="NVMe TEMP", font=self.font(8),
                 fg=self.colors["accent_yellow"], bg=self.colors["bg_panel"]).pack(anchor="e")
         
-        self.nvme_temp_label = tk.Label(info_frame, text="--°C", font=("Monospace", 18, "bold"),
+        self.nvme_temp_label = tk.Label(info_frame, text="--°C", font=self.font(18, "bold"),
                 fg=self.colors["accent_yellow"], bg=self.colors["bg_panel"])
         self.nvme_temp_label.pack(anchor="e")
         
-        self.cpu_freq_label = tk.Label(info_frame, text="-- MHz", font=("Monospace", 10),
+        self.cpu_freq_label = tk.Label(info_frame, text="-- MHz", font=self.font(10),
                 fg=self.colors["text_normal"], bg=self.colors["bg_panel"])
         self.cpu_freq_label.pack(anchor="e", pady=(10, 0))
         
-        self.cpu_cores_label = tk.Label(info_frame, text="-- cores", font=("Monospace", 8),
+        self.cpu_cores_label = tk.Label(info_frame, text=f"{self.cpu_info[0]}C / {self.cpu_info[1]}T", font=self.font(8),
                 fg=self.colors["text_dim"], bg=self.colors["bg_panel"])
         self.cpu_cores_label.pack(anchor="e")
         
@@ -538,37 +633,41 @@ class SystemCommandCenter:
     def create_cpu_cores_panel(self, parent):
         content = self.create_panel(parent, "CPU CORE UTILIZATION", height=200)
         
-        self.core_bars = []
-        self.core_labels = []
-        self.core_canvases = []
-        
-        cores_frame = tk.Frame(content, bg=self.colors["bg_panel"])
-        cores_frame.pack(fill="both", expand=True)
-        
-        cols = 4
-        
-        for i in range(self.num_cores):
-            row = i // cols
-            col = i % cols
-            
-            core_frame = tk.Frame(cores_frame, bg=self.colors["bg_panel"])
-            core_frame.grid(row=row, column=col, padx=4, pady=3, sticky="ew")
-            cores_frame.columnconfigure(col, weight=1)
-            
-            label = tk.Label(core_frame, text=f"C{i}", font=("Monospace", 8),
-                    fg=self.colors["text_dim"], bg=self.colors["bg_panel"], width=3)
-            label.pack(side="left")
-            
-            # Gradient bar canvas
-            bar_canvas = tk.Canvas(core_frame, height=18, bg=self.colors["bg_card"], highlightthickness=0)
-            bar_canvas.pack(side="left", fill="x", expand=True, padx=2)
-            
-            pct_label = tk.Label(core_frame, text="0%", font=("Monospace", 8),
-                    fg=self.colors["text_dim"], bg=self.colors["bg_panel"], width=4)
-            pct_label.pack(side="right")
-            
-            self.core_canvases.append(bar_canvas)
-            self.core_labels.append(pct_label)
+        rows = -(-self.core_slots // CORE_COLS)
+        self.cores_canvas = tk.Canvas(content, height=rows * CORE_ROW_H, bg=self.colors["bg_panel"], highlightthickness=0)
+        self.cores_canvas.pack(fill="both", expand=True)
+        
+        # Per core: (label, track, three gradient segments, glow, percent text), placed by layout_cores()
+        self.core_items = []
+        for i in range(self.core_slots):
+            label = self.cores_canvas.create_text(0, 0, text=f"C{i}", anchor="w", font=self.font(8),
+                    fill=self.colors["text_dim"])
+            track = self.cores_canvas.create_rectangle(0, 0, 0, 0, fill=self.colors["bg_card"], outline="")
+            segments = tuple(self.cores_canvas.create_rectangle(0, 0, 0, 0, outline="") for _ in range(3))
+            glow = self.cores_canvas.create_rectangle(0, 0, 0, 0, outline="")
+            pct = self.cores_canvas.create_text(0, 0, text="0%", anchor="e", font=self.font(8),
+                    fill=self.colors["text_dim"])
+            self.core_items.append((label, track, segments, glow, pct))
+        self.core_spans = []  # per core: bar x0, y0, x1, y1
+        self.core_state = [None] * self.core_slots  # per core: (fill width, level, text) last drawn
+        self.cores_canvas.bind("<Configure>", self.layout_cores)
+    
+    def layout_cores(self, event):
+        """Place every core's label, track and percent text for the new canvas width"""
+        canvas = self.cores_canvas
+        cell_w = event.width / CORE_COLS
+        self.core_spans = []
+        for i, (label, track, segments, glow, pct) in enumerate(self.core_items):
+            x0 = (i % CORE_COLS) * cell_w + 4
+            x1 = x0 + cell_w - 8
+            y0 = (i // CORE_COLS) * CORE_ROW_H + (CORE_ROW_H - CORE_BAR_H) / 2
+            y1 = y0 + CORE_BAR_H
+            canvas.coords(label, x0, (y0 + y1) / 2)
+            canvas.coords(pct, x1, (y0 + y1) / 2)
+            span = (x0 + CORE_LABEL_W, y0, max(x0 + CORE_LABEL_W, x1 - CORE_PCT_W), y1)
+            canvas.coords(track, *span)
+            self.core_spans.append(span)
+        self.core_state = [None] * len(self.core_items)
     
     def draw_gradient_bar(self, canvas, value, max_val=100):
         """Draw a gradient progress bar"""
@@ -585,12 +684,7 @@ class SystemCommandCenter:
         
         if fill_width > 0:
             # Create gradient effect
-            if pct > 0.8:
-                colors = ["#ff0040", "#ff4444", "#ff6666"]
-            elif pct > 0.5:
-                colors = ["#ff8c00", "#ffaa00", "#ffcc00"]
-            else:
-                colors = ["#00aa55", "#00ff88", "#44ffaa"]
+            colors = BAR_GRADIENTS[2 if pct > 0.8 else 1 if pct > 0.5 else 0]
             
             # Draw gradient segments
             seg_width = fill_width // 3 if fill_width > 3 else fill_width
@@ -617,17 +711,17 @@ class SystemCommandCenter:
         ram_header = tk.Frame(ram_frame, bg=self.colors["bg_panel"])
         ram_header.pack(fill="x")
         
-        tk.Label(ram_header, text="RAM", font=("Monospace", 10, "bold"),
+        tk.Label(ram_header, text="RAM", font=self.font(10, "bold"),
                 fg=self.colors["accent_purple"], bg=self.colors["bg_panel"]).pack(side="left")
         
-        self.ram_percent = tk.Label(ram_header, text="0%", font=("Monospace", 10, "bold"),
+        self.ram_percent = tk.Label(ram_header, text="0%", font=self.font(10, "bold"),
                 fg=self.colors["text_bright"], bg=self.colors["bg_panel"])
         self.ram_percent.pack(side="right")
         
         self.ram_canvas = tk.Canvas(ram_frame, height=20, bg=self.colors["bg_card"], highlightthickness=0)
         self.ram_canvas.pack(fill="x", pady=(4, 0))
         
-        self.ram_details = tk.Label(ram_frame, text="0 GB / 0 GB", font=("Monospace", 9),
+        self.ram_details = tk.Label(ram_frame, text="0 GB / 0 GB", font=self.font(9),
                 fg=self.colors["text_dim"], bg=self.colors["bg_panel"])
         self.ram_details.pack(anchor="w", pady=(2, 0))
         
@@ -638,17 +732,17 @@ class SystemCommandCenter:
         swap_header = tk.Frame(swap_frame, bg=self.colors["bg_panel"])
         swap_header.pack(fill="x")
         
-        tk.Label(swap_header, text="SWAP", font=("Monospace", 10, "bold"),
+        tk.Label(swap_header, text="SWAP", font=self.font(10, "bold"),
                 fg=self.colors["accent_yellow"], bg=self.colors["bg_panel"]).pack(side="left")
         
-        self.swap_percent = tk.Label(swap_header, text="0%", font=("Monospace", 10, "bold"),
+        self.swap_percent = tk.Label(swap_header, text="0%", font=self.font(10, "bold"),
                 fg=self.colors["text_bright"], bg=self.colors["bg_panel"])
         self.swap_percent.pack(side="right")
         
         self.swap_canvas = tk.Canvas(swap_frame, height=14, bg=self.colors["bg_card"], highlightthickness=0)
         self.swap_canvas.pack(fill="x", pady=(4, 0))
         
-        self.swap_details = tk.Label(swap_frame, text="0 GB / 0 GB", font=("Monospace", 9),
+        self.swap_details = tk.Label(swap_frame, text="0 GB / 0 GB", font=self.font(9),
                 fg=self.colors["text_dim"], bg=self.colors["bg_panel"])
         self.swap_details.pack(anchor="w", pady=(2, 0))
     
@@ -678,10 +772,10 @@ class SystemCommandCenter:
             frame = tk.Frame(grid, bg=self.colors["bg_panel"])
             frame.pack(side="left", expand=True, fill="both", padx=3)
             
-            tk.Label(frame, text=label, font=("Monospace", 8),
+            tk.Label(frame, text=label, font=self.font(8),
                     fg=self.colors["text_dim"], bg=self.colors["bg_panel"]).pack()
             
-            val_label = tk.Label(frame, text="--", font=("Monospace", 14, "bold"),
+            val_label = tk.Label(frame, text="--", font=self.font(14, "bold"),
                     fg=color, bg=self.colors["bg_panel"])
             val_label.pack()
             self.status_values[key] = val_label
@@ -695,20 +789,20 @@ class SystemCommandCenter:
         read_frame = tk.Frame(stats, bg=self.colors["bg_panel"])
         read_frame.pack(side="left", expand=True, fill="x")
         
-        tk.Label(read_frame, text="▼ READ", font=("Monospace", 9),
+        tk.Label(read_frame, text="▼ READ", font=self.font(9),
                 fg=self.colors["accent_green"], bg=self.colors["bg_panel"]).pack(anchor="w")
         
-        self.disk_read_label = tk.Label(read_frame, text="0 B/s", font=("Monospace", 16, "bold"),
+        self.disk_read_label = tk.Label(read_frame, text="0 B/s", font=self.font(16, "bold"),
                 fg=self.colors["accent_green"], bg=self.colors["bg_panel"])
         self.disk_read_label.pack(anchor="w")
         
         write_frame = tk.Frame(stats, bg=self.colors["bg_panel"])
         write_frame.pack(side="right", expand=True, fill="x")
         
-        tk.Label(write_frame, text="▲ WRITE", font=("Monospace", 9),
+        tk.Label(write_frame, text="▲ WRITE", font=self.font(9),
                 fg=self.colors["accent_orange"], bg=self.colors["bg_panel"]).pack(anchor="e")
         
-        self.disk_write_label = tk.Label(write_frame, text="0 B/s", font=("Monospace", 16, "bold"),
+        self.disk_write_label = tk.Label(write_frame, text="0 B/s", font=self.font(16, "bold"),
                 fg=self.colors["accent_orange"], bg=self.colors["bg_panel"])
         self.disk_write_label.pack(anchor="e")
         
@@ -724,20 +818,20 @@ class SystemCommandCenter:
         dl_frame = tk.Frame(stats, bg=self.colors["bg_panel"])
         dl_frame.pack(side="left", expand=True, fill="x")
         
-        tk.Label(dl_frame, text="▼ DOWNLOAD", font=("Monospace", 9),
+        tk.Label(dl_frame, text="▼ DOWNLOAD", font=self.font(9),
                 fg=self.colors["accent_green"], bg=self.colors["bg_panel"]).pack(anchor="w")
         
-        self.net_dl_label = tk.Label(dl_frame, text="0 B/s", font=("Monospace", 16, "bold"),
+        self.net_dl_label = tk.Label(dl_frame, text="0 B/s", font=self.font(16, "bold"),
                 fg=self.colors["accent_green"], bg=self.colors["bg_panel"])
         self.net_dl_label.pack(anchor="w")
         
         ul_frame = tk.Frame(stats, bg=self.colors["bg_panel"])
         ul_frame.pack(side="right", expand=True, fill="x")
         
-        tk.Label(ul_frame, text="▲ UPLOAD", font=("Monospace", 9),
+        tk.Label(ul_frame, text="▲ UPLOAD", font=self.font(9),
                 fg=self.colors["accent_red"], bg=self.colors["bg_panel"]).pack(anchor="e")
         
-        self.net_ul_label = tk.Label(ul_frame, text="0 B/s", font=("Monospace", 16, "bold"),
+        self.net_ul_label = tk.Label(ul_frame, text="0 B/s", font=self.font(16, "bold"),
                 fg=self.colors["accent_red"], bg=self.colors["bg_panel"])
         self.net_ul_label.pack(anchor="e")
         
@@ -752,7 +846,7 @@ class SystemCommandCenter:
         
         cols = [("PROCESS", 25), ("CPU%", 7), ("MEM%", 7), ("PID", 8)]
         for text, width in cols:
-            tk.Label(header, text=text, font=("Monospace", 8, "bold"),
+            tk.Label(header, text=text, font=self.font(8, "bold"),
                     fg=self.colors["text_dim"], bg=self.colors["bg_panel"],
                     width=width, anchor="w").pack(side="left")
         
@@ -769,7 +863,7 @@ class SystemCommandCenter:
             labels = []
             widths = [25, 7, 7, 8]
             for j, w in enumerate(widths):
-                lbl = tk.Label(row, text="--", font=("Monospace", 9),
+                lbl = tk.Label(row, text="--", font=self.font(9),
                         fg=self.colors["text_normal"] if j == 0 else self.colors["text_dim"],
                         bg=self.colors["bg_panel"], width=w, anchor="w")
                 lbl.pack(side="left")
@@ -778,64 +872,92 @@ class SystemCommandCenter:
     
     # ==================== DATA FETCHING ====================
     
+    def sysfs_fd(self, path):
+        """fd for a sysfs node, opened on first use and kept for the process lifetime.
+        
+        A node that can't be opened is remembered as None, so absent sensors
+        cost one failed open rather than one per tick.
+        """
+        if path in self.fd_cache:
+            return self.fd_cache[path]
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            fd = None
+        self.fd_cache[path] = fd
+        return fd
+    
+    def read_sensor(self, path):
+        """Integer value of a sysfs sensor node, or None"""
+        fd = self.sysfs_fd(path)
+        if fd is None:
+            return None
+        try:
+            return int(os.pread(fd, 32, 0))
+        except (OSError, ValueError):
+            return None
+    
+    def read_proc(self, path):
+        """Re-read a /proc file through its kept fd into the shared buffer (collector thread only)"""
+        fd = self.sysfs_fd(path)
+        if fd is None:
+            raise FileNotFoundError(path)
+        n = os.preadv(fd, [self.read_buf], 0)
+        return self.read_buf[:n]
+    
+    def close_fds(self):
+        for fd in self.fd_cache.values():
+            if fd is not None:
+                os.close(fd)
+        self.fd_cache.clear()
+    
     def get_gpu_temps(self):
         if not self.has_root:
             return None, None
         try:
-            with open('/sys/class/intel_pmt/telem2/telem', 'rb') as f:
-                data = f.read()
-                t1 = struct.unpack('<I', data[0xa4:0xa8])[0]
-                t2 = struct.unpack('<I', data[0xa8:0xac])[0]
-                if 0 < t1 < 120 and 0 < t2 < 120:
-                    return t1, t2
+            # Only the 8 bytes holding both temps, into the same buffer every tick
+            fd = self.sysfs_fd(PMT_TELEM_PATH)
+            if fd is None or os.preadv(fd, [self.pmt_buf], PMT_TEMPS_OFFSET) < PMT_TEMPS.size:
+                return None, None
+            t1, t2 = PMT_TEMPS.unpack_from(self.pmt_buf)
+            if 0 < t1 < 120 and 0 < t2 < 120:
+                return t1, t2
             return None, None
-        except:
+        except (OSError, struct.error):
             return None, None
     
     def get_gpu_frequency(self):
-        try:
-            cur = int(Path("/sys/class/drm/card1/device/tile0/gt0/freq0/act_freq").read_text().strip())
-            max_f = int(Path("/sys/class/drm/card1/device/tile0/gt0/freq0/max_freq").read_text().strip())
-            return cur, max_f
-        except:
+        cur = self.read_sensor("/sys/class/drm/card1/device/tile0/gt0/freq0/act_freq")
+        max_f = self.read_sensor("/sys/class/drm/card1/device/tile0/gt0/freq0/max_freq")
+        if cur is None or max_f is None:
             return None, None
+        return cur, max_f
     
     def get_gpu_vram(self):
-        try:
-            used = int(Path("/sys/class/drm/card1/device/mem_info_vram_used").read_text().strip())
-            total = int(Path("/sys/class/drm/card1/device/mem_info_vram_total").read_text().strip())
-            return used, total
-        except:
+        used = self.read_sensor("/sys/class/drm/card1/device/mem_info_vram_used")
+        total = self.read_sensor("/sys/class/drm/card1/device/mem_info_vram_total")
+        if used is None or total is None:
             return None, None
+        return used, total
     
     def get_gpu_fans(self):
-        try:
-            fans = []
-            for i in range(1, 4):
-                try:
-                    rpm = int(Path(f"/sys/class/hwmon/hwmon3/fan{i}_input").read_text().strip())
-                    fans.append(rpm)
-                except:
-                    pass
-            return max(fans) if fans else 0
-        except:
-            return 0
+        fans = [rpm for rpm in (
+            self.read_sensor(f"/sys/class/hwmon/hwmon3/fan{i}_input") for i in range(1, 4)
+        ) if rpm is not None]
+        return max(fans) if fans else 0
     
     def get_cpu_temp(self):
-        try:
-            return int(Path("/sys/class/hwmon/hwmon2/temp1_input").read_text().strip()) / 1000
-        except:
-            return None
+        millidegrees = self.read_sensor("/sys/class/hwmon/hwmon2/temp1_input")
+        return millidegrees / 1000 if millidegrees is not None else None
     
     def get_nvme_temp(self):
-        try:
-            return int(Path("/sys/class/hwmon/hwmon1/temp1_input").read_text().strip()) / 1000
-        except:
-            return None
+        millidegrees = self.read_sensor("/sys/class/hwmon/hwmon1/temp1_input")
+        return millidegrees / 1000 if millidegrees is not None else None
     
     def get_cpu_usage(self):
         try:
-            parts = Path("/proc/stat").read_text().split('\n')[0].split()
+            # Aggregate "cpu" line is always first
+            parts = self.read_proc("/proc/stat").split(b'\n', 1)[0].split()
             idle = int(parts[4])
             total = sum(int(p) for p in parts[1:])
             
@@ -854,31 +976,39 @@ class SystemCommandCenter:
     
     def get_per_core_usage(self):
         try:
-            lines = Path("/proc/stat").read_text().split('\n')
-            usages = []
-            
-            for i in range(self.num_cores):
-                line = lines[i + 1]
+            usages = [0] * self.core_slots
+            # "cpuN" lines follow the aggregate one; the "intr" line ends them.
+            # Offline CPUs have no line, so place each by its number, not its position.
+            for line in self.read_proc("/proc/stat").split(b'\n')[1:]:
+                if not line.startswith(b'cpu'):
+                    break
                 parts = line.split()
+                cpu = int(parts[0][3:])
+                if cpu >= self.core_slots:
+                    continue
                 idle = int(parts[4])
                 total = sum(int(p) for p in parts[1:])
                 
-                key = f"core{i}"
-                if key in self.last_core_stats:
-                    d_idle = idle - self.last_core_stats[key]['idle']
-                    d_total = total - self.last_core_stats[key]['total']
-                    usage = 100 * (1 - d_idle / d_total) if d_total > 0 else 0
+                last = self.last_core_stats.get(cpu)
+                if last:
+                    d_total = total - last[1]
+                    usage = 100 * (1 - (idle - last[0]) / d_total) if d_total > 0 else 0
                 else:
                     usage = 0
                 
-                self.last_core_stats[key] = {'idle': idle, 'total': total}
-                usages.append(max(0, min(100, usage)))
+                self.last_core_stats[cpu] = (idle, total)
+                usages[cpu] = max(0, min(100, usage))
             
             return usages
-        except:
-            return [0] * self.num_cores
+        except (OSError, ValueError, IndexError):
+            return [0] * self.core_slots
     
     def get_cpu_freq(self):
+        if self.cpu_freq_paths:
+            # kHz per CPU from the kernel's cached APERF/MPERF sample; no cpuinfo formatting
+            khz = [f for f in map(self.read_sensor, self.cpu_freq_paths) if f is not None]
+            if khz:
+                return sum(khz) // len(khz) // 1000
         try:
             freqs = []
             for line in Path("/proc/cpuinfo").read_text().split('\n'):
@@ -891,27 +1021,44 @@ class SystemCommandCenter:
             return 0
     
     def get_cpu_info(self):
+        """Physical cores and logical CPUs; static, so only called once from __init__"""
         try:
-            threads = int(subprocess.getoutput("grep -c 'processor' /proc/cpuinfo"))
-            physical = subprocess.getoutput("grep 'cpu cores' /proc/cpuinfo | head -1")
-            match = re.search(r'(\d+)', physical)
-            cores = int(match.group(1)) if match else threads // 2
+            with open("/proc/cpuinfo", "rb") as f:
+                cpuinfo = f.read()
+            threads = cpuinfo.count(b"processor\t")
+            cores = threads // 2
+            for line in cpuinfo.split(b'\n'):
+                if line.startswith(b'cpu cores'):
+                    cores = int(line.partition(b':')[2])
+                    break
             return cores, threads
-        except:
+        except (OSError, ValueError):
             return 0, 0
     
+    def meminfo_field(self, buf, key):
+        """Bytes value of one "Key:   1234 kB" line, found without splitting the rest"""
+        start = buf.find(key)
+        if start < 0:
+            raise ValueError(f"{key!r} missing from /proc/meminfo")
+        start += len(key)
+        return int(buf[start:buf.find(b' kB', start)]) * 1024
+    
     def get_memory_info(self):
         try:
-            lines = subprocess.getoutput("free -b").split('\n')
-            mem = lines[1].split()
-            swap = lines[2].split()
+            buf = self.read_proc("/proc/meminfo")
+            
+            # Same "used" as free(1): everything the kernel can't hand back
+            mem_total = self.meminfo_field(buf, b'MemTotal:')
+            mem_used = mem_total - self.meminfo_field(buf, b'MemAvailable:')
+            swap_total = self.meminfo_field(buf, b'SwapTotal:')
+            swap_used = swap_total - self.meminfo_field(buf, b'SwapFree:')
             return {
-                'mem_total': int(mem[1]), 'mem_used': int(mem[2]),
-                'mem_percent': int(mem[2]) / int(mem[1]) * 100 if int(mem[1]) > 0 else 0,
-                'swap_total': int(swap[1]), 'swap_used': int(swap[2]),
-                'swap_percent': int(swap[2]) / int(swap[1]) * 100 if int(swap[1]) > 0 else 0
+                'mem_total': mem_total, 'mem_used': mem_used,
+                'mem_percent': mem_used / mem_total * 100 if mem_total > 0 else 0,
+                'swap_total': swap_total, 'swap_used': swap_used,
+                'swap_percent': swap_used / swap_total * 100 if swap_total > 0 else 0
             }
-        except:
+        except (OSError, ValueError):
             return None
     
     def get_storage_info(self):
@@ -935,13 +1082,13 @@ class SystemCommandCenter:
     
     def get_disk_io(self):
         try:
-            stats = Path("/proc/diskstats").read_text()
             read_bytes = 0
             write_bytes = 0
             
-            for line in stats.split('\n'):
-                parts = line.split()
-                if len(parts) >= 14 and parts[2].startswith('nvme'):
+            # major minor name reads merged sectors_read ms writes merged sectors_written ...
+            for line in self.read_proc("/proc/diskstats").split(b'\n'):
+                parts = line.split(None, 10)
+                if len(parts) >= 10 and NVME_DISK.fullmatch(parts[2]):
                     read_bytes += int(parts[5]) * 512
                     write_bytes += int(parts[9]) * 512
             
@@ -956,7 +1103,7 @@ class SystemCommandCenter:
             self.last_disk_time = now
             
             return max(0, read_speed), max(0, write_speed)
-        except:
+        except (OSError, ValueError):
             return 0, 0
     
     def get_network_speed(self):
@@ -964,13 +1111,16 @@ class SystemCommandCenter:
             rx_total = 0
             tx_total = 0
             
-            for iface in Path("/sys/class/net").iterdir():
-                if iface.name not in ('lo', 'docker0') and not iface.name.startswith('veth'):
-                    try:
-                        rx_total += int((iface / "statistics/rx_bytes").read_text().strip())
-                        tx_total += int((iface / "statistics/tx_bytes").read_text().strip())
-                    except:
-                        pass
+            # "iface: rx_bytes packets errs drop fifo frame compressed multicast tx_bytes ..."
+            # after two header lines, all interfaces in a single read
+            for line in self.read_proc("/proc/net/dev").split(b'\n')[2:]:
+                name, sep, counters = line.partition(b':')
+                name = name.strip()
+                if not sep or name in NET_SKIP_IFACES or name.startswith(b'veth'):
+                    continue
+                fields = counters.split(None, 9)
+                rx_total += int(fields[0])
+                tx_total += int(fields[8])
             
             now = time.time()
             elapsed = now - self.last_net_time
@@ -983,7 +1133,7 @@ class SystemCommandCenter:
             self.last_net_time = now
             
             return max(0, rx_speed), max(0, tx_speed)
-        except:
+        except (OSError, ValueError, IndexError):
             return 0, 0
     
     def get_wifi_signal(self):
@@ -1065,50 +1215,88 @@ class SystemCommandCenter:
     
     # ==================== DRAWING ====================
     
-    def draw_graph(self, canvas, data, color, max_val=100):
-        canvas.delete("all")
-        w = canvas.winfo_width()
-        h = canvas.winfo_height()
-        if w <= 1:
-            return
-        
-        # Grid
+    def draw_grid(self, canvas, w, h):
+        """Background grid for a graph canvas; redrawn only when it's resized"""
+        canvas.delete("grid")
         for i in range(1, 4):
             y = h * i / 4
-            canvas.create_line(0, y, w, y, fill=self.colors["grid_line"], dash=(2, 4))
-        
-        if len(data) > 1 and max_val > 0:
-            points = [(w * i / (len(data) - 1), h - h * min(v, max_val) / max_val) for i, v in enumerate(data)]
-            
-            # Gradient fill
-            canvas.create_polygon([(0, h)] + points + [(w, h)], fill=color, stipple="gray25", outline="")
-            
-            # Main line
-            for i in range(len(points) - 1):
-                canvas.create_line(points[i][0], points[i][1], points[i+1][0], points[i+1][1], fill=color, width=2)
-            
-            # Glow effect on recent data
-            if len(points) > 5:
-                for i in range(len(points) - 5, len(points) - 1):
-                    canvas.create_line(points[i][0], points[i][1], points[i+1][0], points[i+1][1],
-                                      fill=self.colors["text_bright"], width=1)
+            canvas.create_line(0, y, w, y, fill=self.colors["grid_line"], dash=(2, 4), tags="grid")
+        canvas.tag_lower("grid")
     
-    def draw_dual_graph(self, canvas, data1, color1, data2, color2, max_val=100):
-        canvas.delete("all")
+    def push_history(self, name, value):
+        """Overwrite the oldest sample of a ring history with value"""
+        pos = self.history_pos[name]
+        self.history[name][pos] = value
+        self.history_pos[name] = (pos + 1) % HISTORY_LEN
+    
+    def graph_coords(self, data, w, h, max_val, start=0):
+        """Flat x0, y0, x1, y1, ... polyline for data, oldest sample at data[start].
+        
+        Returns a buffer shared per (width, length) whose x slots are filled
+        once; only the y slots are rewritten, so use it before the next call.
+        """
+        n = len(data)
+        coords = self.graph_buffers.get((w, n))
+        if coords is None:
+            coords = self.graph_buffers[(w, n)] = [0.0] * (2 * n)
+            coords[0::2] = [w * i / (n - 1) for i in range(n)]
+        scale = h / max_val
+        ys = [h - (v if v < max_val else max_val) * scale for v in data]
+        coords[1::2] = ys[start:] + ys[:start]
+        return coords
+    
+    def graph_size(self, canvas):
+        """Current canvas size, redrawing its grid when that changed; None until mapped"""
         w = canvas.winfo_width()
         h = canvas.winfo_height()
         if w <= 1:
+            return None
+        if self.graph_sizes.get(canvas) != (w, h):
+            self.graph_sizes[canvas] = (w, h)
+            self.draw_grid(canvas, w, h)
+        return w, h
+    
+    def draw_graph(self, canvas, data, color, max_val=100, start=0):
+        size = self.graph_size(canvas)
+        if size is None or len(data) < 2 or max_val <= 0:
             return
+        w, h = size
+        
+        items = self.graph_items.get(canvas)
+        if items is None:
+            # Fill, main line and the glow over the most recent samples, moved with coords()
+            items = self.graph_items[canvas] = (
+                canvas.create_polygon(0, 0, 0, 0, 0, 0, fill=color, stipple="gray25", outline=""),
+                canvas.create_line(0, 0, 0, 0, fill=color, width=2),
+                canvas.create_line(0, 0, 0, 0, fill=self.colors["text_bright"], width=1),
+            )
+        fill, line, glow = items
+        if self.graph_colors.get(canvas) != color:
+            self.graph_colors[canvas] = color
+            canvas.itemconfigure(fill, fill=color)
+            canvas.itemconfigure(line, fill=color)
+        
+        coords = self.graph_coords(data, w, h, max_val, start)
+        canvas.coords(fill, 0, h, *coords, w, h)
+        canvas.coords(line, *coords)
+        if len(data) > 5:
+            canvas.coords(glow, *coords[-10:])
+    
+    def draw_dual_graph(self, canvas, data1, color1, data2, color2, max_val=100, start=0):
+        size = self.graph_size(canvas)
+        if size is None or max_val <= 0:
+            return
+        w, h = size
         
-        for i in range(1, 4):
-            y = h * i / 4
-            canvas.create_line(0, y, w, y, fill=self.colors["grid_line"], dash=(2, 4))
-        
-        for data, color in [(data1, color1), (data2, color2)]:
-            if len(data) > 1 and max_val > 0:
-                points = [(w * i / (len(data) - 1), h - h * min(v, max_val) / max_val) for i, v in enumerate(data)]
-                for i in range(len(points) - 1):
-                    canvas.create_line(points[i][0], points[i][1], points[i+1][0], points[i+1][1], fill=color, width=2)
+        items = self.graph_items.get(canvas)
+        if items is None:
+            items = self.graph_items[canvas] = (
+                canvas.create_line(0, 0, 0, 0, fill=color1, width=2),
+                canvas.create_line(0, 0, 0, 0, fill=color2, width=2),
+            )
+        for item, data in zip(items, (data1, data2)):
+            if len(data) > 1:
+                canvas.coords(item, *self.graph_coords(data, w, h, max_val, start))
     
     def draw_vram_bar(self, canvas, used, total):
         canvas.delete("all")
@@ -1131,6 +1319,49 @@ class SystemCommandCenter:
                 color = f"#{r:02x}{g:02x}{b:02x}"
                 canvas.create_line(i, 0, i, h, fill=color)
     
+    # ==================== SAMPLING ====================
+    
+    def collect_metrics(self):
+        """Read every source once; runs on the collector thread, never touches Tk"""
+        return {
+            'gpu_temps': self.get_gpu_temps(),
+            'gpu_freq': self.get_gpu_frequency(),
+            'gpu_vram': self.get_gpu_vram(),
+            'gpu_fans': self.get_gpu_fans(),
+            'cpu_usage': self.get_cpu_usage(),
+            'cpu_temp': self.get_cpu_temp(),
+            'nvme_temp': self.get_nvme_temp(),
+            'cpu_freq': self.get_cpu_freq(),
+            'core_usage': self.get_per_core_usage(),
+            'memory': self.get_memory_info(),
+            'storage': self.get_storage_info(),
+            'disk_io': self.get_disk_io(),
+            'network': self.get_network_speed(),
+            'processes': self.get_top_processes(),
+            'system': self.get_system_stats(),
+        }
+    
+    def start_collector(self):
+        thread = threading.Thread(target=self.collect_loop, daemon=True)
+        thread.start()
+    
+    def collect_loop(self):
+        seq = 0
+        deadline = time.monotonic()
+        while True:
+            try:
+                metrics = self.collect_metrics()
+            except Exception as e:
+                print(f"Collect error: {e}")
+            else:
+                # Replaces a snapshot the UI hasn't picked up yet
+                seq += 1
+                self.snapshot = (seq, metrics)
+            # Fixed rate, however long the sensors took to answer
+            deadline += POLL_INTERVAL
+            time.sleep(max(0, deadline - time.monotonic()))
+            deadline = max(deadline, time.monotonic())
+    
     # ==================== ANIMATIONS ====================
     
     def animate(self):
@@ -1148,23 +1379,23 @@ class SystemCommandCenter:
         
         # Pulse status dot
         if self.is_critical and self.alert_flash:
-            self.status_dot.config(fg=self.colors["critical"])
-            self.status_text.config(fg=self.colors["critical"])
+            self.set_widget(self.status_dot, fg=self.colors["critical"])
+            self.set_widget(self.status_text, fg=self.colors["critical"])
         elif self.is_critical:
-            self.status_dot.config(fg=self.colors["bg_panel"])
+            self.set_widget(self.status_dot, fg=self.colors["bg_panel"])
         else:
             pulse = abs(10 - self.pulse_state) / 10
             if pulse > 0.5:
-                self.status_dot.config(fg=self.colors["nominal"])
+                self.set_widget(self.status_dot, fg=self.colors["nominal"])
             else:
-                self.status_dot.config(fg=self.colors["glow_green"])
+                self.set_widget(self.status_dot, fg=self.colors["glow_green"])
         
         self.root.after(50, self.animate)
     
     # ==================== UI UPDATES ====================
     
-    def update_gpu(self):
-        t1, t2 = self.get_gpu_temps()
+    def update_gpu(self, temps, freqs, vram, rpm):
+        t1, t2 = temps
         
         # Check for critical state
         self.is_critical = False
@@ -1173,60 +1404,52 @@ class SystemCommandCenter:
             self.current_gpu_temp = t1
             self.draw_gauge(self.gpu_temp_canvas, t1, 100, label="°C")
             c, s = self.get_temp_color_status(t1, (55, 80))
-            self.gpu_temp_status.config(text=s, fg=c)
-            self.gpu_temp_history.pop(0)
-            self.gpu_temp_history.append(t1)
+            self.set_widget(self.gpu_temp_status, text=s, fg=c)
+            self.push_history('gpu_temp', int(t1))
             if t1 > 80:
                 self.is_critical = True
         else:
             self.draw_gauge(self.gpu_temp_canvas, 0, 100, label="°C")
-            self.gpu_temp_status.config(text="● NO ACCESS", fg=self.colors["text_dim"])
+            self.set_widget(self.gpu_temp_status, text="● NO ACCESS", fg=self.colors["text_dim"])
         
         if t2 is not None:
             self.draw_gauge(self.gpu_hotspot_canvas, t2, 100, label="°C")
             c, s = self.get_temp_color_status(t2, (60, 85))
-            self.gpu_hotspot_status.config(text=s, fg=c)
+            self.set_widget(self.gpu_hotspot_status, text=s, fg=c)
             if t2 > 85:
                 self.is_critical = True
         else:
             self.draw_gauge(self.gpu_hotspot_canvas, 0, 100, label="°C")
-            self.gpu_hotspot_status.config(text="● NO ACCESS", fg=self.colors["text_dim"])
+            self.set_widget(self.gpu_hotspot_status, text="● NO ACCESS", fg=self.colors["text_dim"])
         
         # Frequency
-        cur, max_f = self.get_gpu_frequency()
+        cur, max_f = freqs
         if cur is not None:
-            self.gpu_freq_label.config(text=f"{cur} MHz")
-            self.gpu_freq_max.config(text=f"MAX: {max_f} MHz")
+            self.set_widget(self.gpu_freq_label, text=f"{cur} MHz")
+            self.set_widget(self.gpu_freq_max, text=f"MAX: {max_f} MHz")
         
         # VRAM
-        used, total = self.get_gpu_vram()
+        used, total = vram
         if used is not None:
             used_gb = used / (1024**3)
             total_gb = total / (1024**3)
-            self.vram_label.config(text=f"{used_gb:.1f} / {total_gb:.0f} GB")
+            self.set_widget(self.vram_label, text=f"{used_gb:.1f} / {total_gb:.0f} GB")
             self.draw_vram_bar(self.vram_canvas, used, total)
         
         # Fans
-        rpm = self.get_gpu_fans()
-        self.fan_label.config(text=f"{rpm} RPM")
+        self.set_widget(self.fan_label, text=f"{rpm} RPM")
         if rpm > 0:
-            self.fan_status.config(text="● ACTIVE", fg=self.colors["accent_teal"])
+            self.set_widget(self.fan_status, text="● ACTIVE", fg=self.colors["accent_teal"])
         else:
-            self.fan_status.config(text="● IDLE", fg=self.colors["text_dim"])
+            self.set_widget(self.fan_status, text="● IDLE", fg=self.colors["text_dim"])
         
         # Graph
         color = self.colors["critical"] if self.is_critical else self.colors["accent_blue"]
-        self.draw_graph(self.gpu_graph_canvas, self.gpu_temp_history, color, 100)
+        self.draw_graph(self.gpu_graph_canvas, self.history['gpu_temp'], color, 100, self.history_pos['gpu_temp'])
     
-    def update_cpu(self):
-        usage = self.get_cpu_usage()
-        temp = self.get_cpu_temp()
-        nvme = self.get_nvme_temp()
-        freq = self.get_cpu_freq()
-        cores, threads = self.get_cpu_info()
+    def update_cpu(self, usage, temp, nvme, freq):
         
-        self.cpu_history.pop(0)
-        self.cpu_history.append(usage)
+        self.push_history('cpu', round(usage))
         self.current_cpu_usage = usage
         
         # Usage gauge
@@ -1237,52 +1460,64 @@ class SystemCommandCenter:
             self.current_cpu_temp = temp
             self.draw_gauge(self.cpu_temp_canvas, temp, 100, label="°C")
             c, s = self.get_temp_color_status(temp, (55, 75))
-            self.cpu_temp_status.config(text=s, fg=c)
+            self.set_widget(self.cpu_temp_status, text=s, fg=c)
             if temp > 75:
                 self.is_critical = True
         
         # NVMe
         if nvme is not None:
             c, _ = self.get_temp_color_status(nvme, (50, 70))
-            self.nvme_temp_label.config(text=f"{nvme:.0f}°C", fg=c)
+            self.set_widget(self.nvme_temp_label, text=f"{nvme:.0f}°C", fg=c)
         
-        self.cpu_freq_label.config(text=f"{freq} MHz")
-        self.cpu_cores_label.config(text=f"{cores}C / {threads}T")
+        self.set_widget(self.cpu_freq_label, text=f"{freq} MHz")
         
         # Graph
         color = self.colors["critical"] if usage > 80 else self.colors["warning"] if usage > 50 else self.colors["accent_green"]
-        self.draw_graph(self.cpu_graph_canvas, self.cpu_history, color)
+        self.draw_graph(self.cpu_graph_canvas, self.history['cpu'], color, 100, self.history_pos['cpu'])
     
-    def update_cpu_cores(self):
-        usages = self.get_per_core_usage()
-        
-        for i, usage in enumerate(usages):
-            if i < len(self.core_canvases):
-                self.draw_gradient_bar(self.core_canvases[i], usage)
-                
-                if usage > 80:
-                    color = self.colors["critical"]
-                elif usage > 50:
-                    color = self.colors["warning"]
-                else:
-                    color = self.colors["accent_green"]
-                
-                self.core_labels[i].config(text=f"{usage:.0f}%", fg=color)
+    def update_cpu_cores(self, usages):
+        canvas = self.cores_canvas
+        label_colors = (self.colors["accent_green"], self.colors["warning"], self.colors["critical"])
+        for i, usage in enumerate(usages[:len(self.core_spans)]):
+            level = 2 if usage > 80 else 1 if usage > 50 else 0
+            x0, y0, x1, y1 = self.core_spans[i]
+            fill_width = int((x1 - x0) * usage / 100)
+            text = f"{usage:.0f}%"
+            last = self.core_state[i]
+            if last == (fill_width, level, text):
+                continue
+            
+            label, track, segments, glow, pct = self.core_items[i]
+            if last is None or last[1] != level:
+                for segment, color in zip(segments, BAR_GRADIENTS[level]):
+                    canvas.itemconfigure(segment, fill=color)
+                canvas.itemconfigure(glow, fill=BAR_GRADIENTS[level][-1])
+                canvas.itemconfigure(pct, fill=label_colors[level])
+            
+            # Same three segments and end glow as draw_gradient_bar(); empty ones collapse to x0
+            seg_width = fill_width // 3 if fill_width > 3 else fill_width
+            for n, segment in enumerate(segments):
+                left = x0 + min(n * seg_width, fill_width)
+                right = x0 + min((n + 1) * seg_width, fill_width)
+                canvas.coords(segment, left, y0 + 2, right, y1 - 2)
+            if fill_width > 5:
+                canvas.coords(glow, x0 + fill_width - 3, y0, x0 + fill_width, y1)
+            else:
+                canvas.coords(glow, x0, y0, x0, y1)
+            canvas.itemconfigure(pct, text=text)
+            self.core_state[i] = (fill_width, level, text)
     
-    def update_memory(self):
-        mem = self.get_memory_info()
+    def update_memory(self, mem):
         if mem:
-            self.ram_percent.config(text=f"{mem['mem_percent']:.1f}%")
-            self.ram_details.config(text=f"{self.format_bytes(mem['mem_used'])} / {self.format_bytes(mem['mem_total'])}")
+            self.set_widget(self.ram_percent, text=f"{mem['mem_percent']:.1f}%")
+            self.set_widget(self.ram_details, text=f"{self.format_bytes(mem['mem_used'])} / {self.format_bytes(mem['mem_total'])}")
             self.draw_gradient_bar(self.ram_canvas, mem['mem_percent'])
             
-            self.swap_percent.config(text=f"{mem['swap_percent']:.1f}%")
-            self.swap_details.config(text=f"{self.format_bytes(mem['swap_used'])} / {self.format_bytes(mem['swap_total'])}")
+            self.set_widget(self.swap_percent, text=f"{mem['swap_percent']:.1f}%")
+            self.set_widget(self.swap_details, text=f"{self.format_bytes(mem['swap_used'])} / {self.format_bytes(mem['swap_total'])}")
             self.draw_gradient_bar(self.swap_canvas, mem['swap_percent'])
     
-    def update_storage(self):
-        disks = self.get_storage_info()
-        
+    def update_storage(self, disks):
         for w in self.storage_frame.winfo_children():
             w.destroy()
         
@@ -1291,60 +1526,52 @@ class SystemCommandCenter:
             row.pack(fill="x", pady=2)
             
             mount = disk['mount'] if len(disk['mount']) <= 15 else disk['mount'][:12] + "..."
-            tk.Label(row, text=mount, font=("Monospace", 9), fg=self.colors["text_normal"],
+            tk.Label(row, text=mount, font=self.font(9), fg=self.colors["text_normal"],
                     bg=self.colors["bg_panel"], width=15, anchor="w").pack(side="left")
             
             pct = disk['percent']
             color = self.colors["accent_green"] if pct < 70 else self.colors["warning"] if pct < 90 else self.colors["critical"]
             
-            tk.Label(row, text=f"{pct}%", font=("Monospace", 9, "bold"), fg=color,
+            tk.Label(row, text=f"{pct}%", font=self.font(9, "bold"), fg=color,
                     bg=self.colors["bg_panel"], width=5).pack(side="right")
             
             tk.Label(row, text=f"{self.format_bytes(disk['used'])}/{self.format_bytes(disk['total'])}",
-                    font=("Monospace", 8), fg=self.colors["text_dim"],
+                    font=self.font(8), fg=self.colors["text_dim"],
                     bg=self.colors["bg_panel"]).pack(side="right", padx=5)
             
             bar_canvas = tk.Canvas(row, height=10, width=60, bg=self.colors["bg_card"], highlightthickness=0)
             bar_canvas.pack(side="right", padx=3)
             self.draw_gradient_bar(bar_canvas, pct)
     
-    def update_disk_io(self):
-        read, write = self.get_disk_io()
-        
-        self.disk_read_label.config(text=self.format_speed(read))
-        self.disk_write_label.config(text=self.format_speed(write))
+    def update_disk_io(self, read, write):
+        self.set_widget(self.disk_read_label, text=self.format_speed(read))
+        self.set_widget(self.disk_write_label, text=self.format_speed(write))
         
-        self.disk_read_history.pop(0)
-        self.disk_read_history.append(read)
-        self.disk_write_history.pop(0)
-        self.disk_write_history.append(write)
+        self.push_history('disk_read', int(read))
+        self.push_history('disk_write', int(write))
         
-        max_io = max(max(self.disk_read_history), max(self.disk_write_history), 1024)
-        self.draw_dual_graph(self.disk_canvas, self.disk_read_history, self.colors["accent_green"],
-                            self.disk_write_history, self.colors["accent_orange"], max_io)
+        reads, writes = self.history['disk_read'], self.history['disk_write']
+        max_io = max(max(reads), max(writes), 1024)
+        self.draw_dual_graph(self.disk_canvas, reads, self.colors["accent_green"],
+                            writes, self.colors["accent_orange"], max_io, self.history_pos['disk_read'])
     
-    def update_network(self):
-        rx, tx = self.get_network_speed()
+    def update_network(self, rx, tx):
+        self.set_widget(self.net_dl_label, text=self.format_speed(rx))
+        self.set_widget(self.net_ul_label, text=self.format_speed(tx))
         
-        self.net_dl_label.config(text=self.format_speed(rx))
-        self.net_ul_label.config(text=self.format_speed(tx))
+        self.push_history('net_rx', int(rx))
+        self.push_history('net_tx', int(tx))
         
-        self.net_rx_history.pop(0)
-        self.net_rx_history.append(rx)
-        self.net_tx_history.pop(0)
-        self.net_tx_history.append(tx)
-        
-        max_net = max(max(self.net_rx_history), max(self.net_tx_history), 1024)
-        self.draw_dual_graph(self.net_canvas, self.net_rx_history, self.colors["accent_green"],
-                            self.net_tx_history, self.colors["accent_red"], max_net)
+        rxs, txs = self.history['net_rx'], self.history['net_tx']
+        max_net = max(max(rxs), max(txs), 1024)
+        self.draw_dual_graph(self.net_canvas, rxs, self.colors["accent_green"],
+                            txs, self.colors["accent_red"], max_net, self.history_pos['net_rx'])
     
-    def update_processes(self):
-        procs = self.get_top_processes()
-        
+    def update_processes(self, procs):
         for i, labels in enumerate(self.process_labels):
             if i < len(procs):
                 p = procs[i]
-                labels[0].config(text=p['name'], fg=self.colors["text_normal"])
+                self.set_widget(labels[0], text=p['name'], fg=self.colors["text_normal"])
                 
                 try:
                     cpu = float(p['cpu'])
@@ -1352,46 +1579,50 @@ class SystemCommandCenter:
                 except:
                     cpu_color = self.colors["text_dim"]
                 
-                labels[1].config(text=p['cpu'], fg=cpu_color)
-                labels[2].config(text=p['mem'])
-                labels[3].config(text=p['pid'])
+                self.set_widget(labels[1], text=p['cpu'], fg=cpu_color)
+                self.set_widget(labels[2], text=p['mem'])
+                self.set_widget(labels[3], text=p['pid'])
             else:
                 for lbl in labels:
-                    lbl.config(text="--", fg=self.colors["text_dim"])
+                    self.set_widget(lbl, text="--", fg=self.colors["text_dim"])
     
-    def update_system_status(self):
-        stats = self.get_system_stats()
+    def update_system_status(self, stats):
         for key, val in stats.items():
             if key in self.status_values:
-                self.status_values[key].config(text=val)
+                self.set_widget(self.status_values[key], text=val)
         
         # Update status text based on critical state
         if self.is_critical:
-            self.status_text.config(text="⚠ THERMAL WARNING", fg=self.colors["critical"])
+            self.set_widget(self.status_text, text="⚠ THERMAL WARNING", fg=self.colors["critical"])
         else:
-            self.status_text.config(text="ALL SYSTEMS NOMINAL", fg=self.colors["nominal"])
+            self.set_widget(self.status_text, text="ALL SYSTEMS NOMINAL", fg=self.colors["nominal"])
     
     def update_time(self):
         now = datetime.now()
-        self.time_label.config(text=now.strftime("%H:%M:%S"))
-        self.date_label.config(text=now.strftime("%A, %B %d, %Y"))
+        self.set_widget(self.time_label, text=now.strftime("%H:%M:%S"))
+        self.set_widget(self.date_label, text=now.strftime("%A, %B %d, %Y"))
     
     def update_all(self):
+        """Render pass: only touches widgets, all sampling happens in collect_loop"""
         try:
             self.update_time()
-            self.update_gpu()
-            self.update_cpu()
-            self.update_cpu_cores()
-            self.update_memory()
-            self.update_storage()
-            self.update_disk_io()
-            self.update_network()
-            self.update_processes()
-            self.update_system_status()
+            
+            seq, metrics = self.snapshot
+            if seq != self.rendered_seq:
+                self.rendered_seq = seq
+                self.update_gpu(metrics['gpu_temps'], metrics['gpu_freq'], metrics['gpu_vram'], metrics['gpu_fans'])
+                self.update_cpu(metrics['cpu_usage'], metrics['cpu_temp'], metrics['nvme_temp'], metrics['cpu_freq'])
+                self.update_cpu_cores(metrics['core_usage'])
+                self.update_memory(metrics['memory'])
+                self.update_storage(metrics['storage'])
+                self.update_disk_io(*metrics['disk_io'])
+                self.update_network(*metrics['network'])
+                self.update_processes(metrics['processes'])
+                self.update_system_status(metrics['system'])
         except Exception as e:
             print(f"Update error: {e}")
         
-        self.root.after(1000, self.update_all)
+        self.root.after(100, self.update_all)
 
 
 def main():